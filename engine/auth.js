@@ -0,0 +1,129 @@
+// v2.61: Auth state persists per site in workflow static data
+// ({ fingerprint, token, expires_at, validated_at, user }). A JWT is reused
+// until shortly before the expiry in its payload, and the users/me check is
+// skipped while the last successful one is under AUTH_CHECK_TTL_MS old.
+// The fingerprint (a hash of mode + user + secret, never the secret itself)
+// drops the entry when a site's credentials change.
+const AUTH_CHECK_TTL_MS = 60 * 60 * 1000;
+const JWT_EXPIRY_MARGIN_MS = 10 * 60 * 1000;
+let authHeadersLoad = null;
+
+function authFingerprint() {
+  const secret = config.authMode === 'jwt'
+    ? `${config.jwtUser}:${config.jwtPassword}:${config.jwtToken}`
+    : `${config.wpUser}:${config.wpPassword}`;
+  let hash = 0x811c9dc5;
+  for (const ch of `${config.authMode}|${secret}`) hash = Math.imul(hash ^ ch.charCodeAt(0), 0x01000193) >>> 0;
+  return hash.toString(16);
+}
+
+function getAuthCache() {
+  const staticData = workflowStaticData();
+  const caches = staticData.authCache || (staticData.authCache = {});
+  const fingerprint = authFingerprint();
+  if (caches[config.baseUrl]?.fingerprint !== fingerprint) caches[config.baseUrl] = { fingerprint };
+  return caches[config.baseUrl];
+}
+
+// Called when WordPress rejects the credentials so the next run starts clean
+function forgetWpAuth() {
+  const staticData = workflowStaticData();
+  if (staticData.authCache) delete staticData.authCache[config.baseUrl];
+  authHeadersLoad = null;
+}
+
+// Expiry (ms) from the token's `exp` claim, or null if it can't be read
+function jwtExpiry(token) {
+  try {
+    const payload = JSON.parse(Buffer.from(token.split('.')[1].replace(/-/g, '+').replace(/_/g, '/'), 'base64').toString('utf8'));
+    return typeof payload.exp === 'number' ? payload.exp * 1000 : null;
+  } catch { return null; }
+}
+
+function tokenIsFresh(cache) {
+  return Boolean(cache.token && cache.expires_at && cache.expires_at - Date.now() > JWT_EXPIRY_MARGIN_MS);
+}
+
+// Single flight: concurrent callers share one validation/token fetch
+function getWpAuthHeaders() {
+  if (!authHeadersLoad) {
+    authHeadersLoad = loadWpAuthHeaders.call(this).catch(e => {
+      authHeadersLoad = null;
+      throw e;
+    });
+  }
+  return authHeadersLoad;
+}
+
+async function loadWpAuthHeaders() {
+  if (config.authMode === 'jwt') {
+    const cache = getAuthCache();
+    if (tokenIsFresh(cache)) {
+      debug.auth_cache = { token: 'cached', expires_at: new Date(cache.expires_at).toISOString() };
+      return { Authorization: `Bearer ${cache.token}` };
+    }
+    if (config.jwtToken) {
+      const valid = await validateJwtToken.call(this, config.jwtToken);
+      if (valid) {
+        // A token without a readable exp is re-validated every run
+        Object.assign(cache, { token: config.jwtToken, expires_at: jwtExpiry(config.jwtToken) });
+        debug.auth_cache = { token: 'site_token' };
+        return { Authorization: `Bearer ${config.jwtToken}` };
+      }
+    }
+    const token = await getJwtToken.call(this);
+    if (token) {
+      Object.assign(cache, { token, expires_at: jwtExpiry(token) });
+      debug.auth_cache = { token: 'fetched' };
+      return { Authorization: `Bearer ${token}` };
+    }
+    throw new Error('JWT authentication failed');
+  } else {
+    const creds = Buffer.from(`${config.wpUser}:${config.wpPassword}`).toString('base64');
+    return { Authorization: `Basic ${creds}` };
+  }
+}
+
+async function validateJwtToken(token) {
+  try {
+    const resp = await httpRequest.call(this, {
+      method: 'POST',
+      url: `${config.baseUrl}/wp-json/jwt-auth/v1/token/validate`,
+      headers: { Authorization: `Bearer ${token}` }
+    });
+    return resp?.data?.status === 200 || resp?.code === 'jwt_auth_valid_token';
+  } catch { return false; }
+}
+
+async function getJwtToken() {
+  const endpoint = config.jwtTokenEndpoint || `${config.baseUrl}/wp-json/jwt-auth/v1/token`;
+  try {
+    const resp = await httpRequest.call(this, {
+      method: 'POST',
+      url: endpoint,
+      body: { username: config.jwtUser, password: config.jwtPassword },
+      headers: { 'Content-Type': 'application/json' }
+    });
+    return resp?.token || null;
+  } catch (e) {
+    throw new Error(`JWT token fetch failed: ${e.message}`);
+  }
+}
+
+async function wpAuthSanityCheck() {
+  const authHeaders = await getWpAuthHeaders.call(this);
+  // v2.61: Skip users/me when these credentials passed it recently
+  const cache = getAuthCache();
+  if (cache.validated_at && Date.now() - cache.validated_at < AUTH_CHECK_TTL_MS) {
+    return { ok: true, user: cache.user, cached: true };
+  }
+  const resp = await httpRequest.call(this, {
+    method: 'GET',
+    url: `${config.baseUrl}/wp-json/wp/v2/users/me`,
+    headers: authHeaders
+  });
+  if (!resp?.id) throw new Error('No user ID in response');
+  const user = resp.name || resp.slug;
+  Object.assign(cache, { validated_at: Date.now(), user });
+  return { ok: true, user };
+}
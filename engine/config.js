@@ -0,0 +1,139 @@
+// Helper to parse boolean from various formats
+function parseBool(val, defaultVal = false) {
+  if (val === undefined || val === null || val === '') return defaultVal;
+  if (typeof val === 'boolean') return val;
+  if (typeof val === 'string') {
+    const lower = val.toLowerCase().trim();
+    if (lower === 'true' || lower === 'yes' || lower === '1') return true;
+    if (lower === 'false' || lower === 'no' || lower === '0') return false;
+  }
+  return defaultVal;
+}
+
+function detectEmailProvider(globals) {
+  if (globals.EMAIL_PROVIDER) return globals.EMAIL_PROVIDER.toLowerCase();
+  if (globals.RESEND_API_KEY) return 'resend';
+  if (globals.SENDGRID_API_KEY) return 'sendgrid';
+  if (globals.MAILGUN_API_KEY && globals.MAILGUN_DOMAIN) return 'mailgun';
+  if (globals.SMTP2GO_API_KEY) return 'smtp2go';
+  return null;
+}
+
+const config = {
+  baseUrl: site.base_url.replace(/\/$/, ''),
+  authMode: (site.auth_mode || 'jwt').toLowerCase(),
+  wpUser: site.wp_user || site.jwt_user || '',
+  wpPassword: site.wp_app_password || '',
+  jwtUser: site.jwt_user || '',
+  jwtPassword: site.jwt_password || '',
+  jwtToken: site.jwt_token || '',
+  jwtTokenEndpoint: site.jwt_token_endpoint || null,
+  postStatus: site.post_status || 'draft',
+  tone: site.tone || 'informative and engaging',
+  minWords: parseInt(site.min_words) || 1500,
+  maxWords: parseInt(site.max_words) || 2500,
+  faqCount: parseInt(site.faq_count) || 5,
+  imagesCount: (() => {
+    // v2.33: Support images_min/images_max range (random) or single images_count
+    const min = parseInt(site.images_min);
+    const max = parseInt(site.images_max);
+    if (!isNaN(min) && !isNaN(max) && min <= max) {
+      return Math.floor(Math.random() * (max - min + 1)) + min;
+    }
+    return site.images_count !== undefined && site.images_count !== '' ? parseInt(site.images_count) : 0;
+  })(),
+  imageProvider: site.image_provider_priority 
+    ? site.image_provider_priority.split(',').map(s => s.trim().toLowerCase()).filter(s => s) 
+    : (globals.IMAGE_PROVIDER_PRIORITY_DEFAULT || 'fal,pexels,openai').split(',').map(s => s.trim().toLowerCase()).filter(s => s),
+  // v2.65: 'dynamic' reorders providers by rolling success rate and latency; 'static' keeps the list order
+  imageProviderOrdering: (site.image_provider_ordering || 'dynamic').toLowerCase().trim(),
+  // v2.50: Images generated/uploaded at once (generation of N+1 overlaps upload of N)
+  imageConcurrency: Math.max(1, parseInt(site.image_concurrency) || 2),
+  // v2.51: Let WordPress build thumbnails in the background after upload
+  deferThumbnails: parseBool(site.defer_thumbnails, true),
+  // v2.54: Base64 images larger than this go through the chunked upload (0 = never)
+  uploadChunkBytes: (() => {
+    const kb = parseInt(site.upload_chunk_kb);
+    return (isNaN(kb) ? 512 : Math.max(0, kb)) * 1024;
+  })(),
+  // v2.62: Keep-alive sockets per host (0 = n8n's request helper, one connection per call)
+  httpPoolSize: (() => {
+    const size = parseInt(site.http_pool_size);
+    return isNaN(size) ? 6 : Math.max(0, size);
+  })(),
+  // v2.64: Fallback chains (images, serp, indexing) that may start the next provider
+  // while a slow one is still running, and how many such hedges one execution may spend
+  hedgeChains: (site.hedge_chains || '').split(',').map(s => s.trim().toLowerCase()).filter(s => s),
+  hedgeBudget: (() => {
+    const budget = parseInt(site.hedge_budget);
+    return isNaN(budget) ? 3 : Math.max(0, budget);
+  })(),
+  // v2.56: 'semantic' ranks internal link targets by embedding similarity ('keyword' = title word match)
+  internalLinkMode: (site.internal_link_mode || 'keyword').toLowerCase().trim(),
+  embeddingModel: site.embedding_model || 'text-embedding-3-small',
+  internalLinksCount: (() => {
+    const min = parseInt(site.internal_links_min);
+    const max = parseInt(site.internal_links_max);
+    if (!isNaN(min) && !isNaN(max) && min <= max) {
+      return Math.floor(Math.random() * (max - min + 1)) + min;
+    }
+    return site.internal_links_count !== undefined && site.internal_links_count !== '' ? parseInt(site.internal_links_count) : 3;
+  })(),
+  externalLinksCount: (() => {
+    const min = parseInt(site.external_links_min);
+    const max = parseInt(site.external_links_max);
+    if (!isNaN(min) && !isNaN(max) && min <= max) {
+      return Math.floor(Math.random() * (max - min + 1)) + min;
+    }
+    return site.external_links_count !== undefined && site.external_links_count !== '' ? parseInt(site.external_links_count) : 5;
+  })(),
+  youtubeCount: (() => {
+    const min = parseInt(site.youtube_embeds_min);
+    const max = parseInt(site.youtube_embeds_max);
+    if (!isNaN(min) && !isNaN(max) && min <= max) {
+      return Math.floor(Math.random() * (max - min + 1)) + min;
+    }
+    return site.youtube_embeds_count !== undefined && site.youtube_embeds_count !== '' ? parseInt(site.youtube_embeds_count) : 1;
+  })(),
+  defaultCategory: site.default_category || '',
+  
+  // Per-site notification controls (v2.8, v2.46: renamed to indexing_enabled)
+  indexingEnabled: parseBool(site.indexing_enabled, false),
+  telegramEnabled: parseBool(site.telegram_enabled, true),
+  emailEnabled: parseBool(site.email_enabled, false),
+  
+  openaiKey: globals.OPENAI_API_KEY,
+  openaiModel: site.openai_model || globals.OPENAI_MODEL || 'gpt-4o-mini',
+  // v2.66: Stream the article and start images/terms as fields complete (keep-alive transport only)
+  contentStreaming: parseBool(site.content_streaming, true),
+  // v2.68: 'sections' writes an outline first, then every H2 section concurrently; 'single' is one completion
+  generationMode: (site.generation_mode || 'single').toLowerCase().trim(),
+  openaiImageModel: site.openai_image_model || globals.OPENAI_IMAGE_MODEL || 'dall-e-2',
+  falModel: site.fal_model || globals.FAL_MODEL || 'fal-ai/flux/schnell',
+  googleCseKey: globals.GOOGLE_CSE_API_KEY || '',
+  googleCseCx: globals.GOOGLE_CSE_CX || '',
+  serperKey: globals.SERPER_API_KEY || '',
+  youtubeKey: globals.YOUTUBE_API_KEY || '',
+  pexelsKey: globals.PEXELS_API_KEY || '',
+  falKey: globals.FAL_API_KEY || '',
+  speedyIndexKey: globals.SPEEDYINDEX_API_KEY || '',
+  fastIndexKey: globals.FASTINDEX_API_KEY || '',
+  telegramToken: globals.TELEGRAM_BOT_TOKEN || '',
+  telegramChatId: globals.TELEGRAM_CHAT_ID || '',
+  notificationEmail: globals.NOTIFICATION_EMAIL || '',
+  emailFrom: globals.EMAIL_FROM || 'noreply@autoblogger.local',
+  emailProvider: detectEmailProvider(globals),
+  resendApiKey: globals.RESEND_API_KEY || '',
+  sendgridApiKey: globals.SENDGRID_API_KEY || '',
+  mailgunApiKey: globals.MAILGUN_API_KEY || '',
+  mailgunDomain: globals.MAILGUN_DOMAIN || '',
+  smtp2goApiKey: globals.SMTP2GO_API_KEY || '',
+  topic,
+  tags: topicRow.tags || '',
+  categories: topicRow.categories || topicRow.category || ''
+};
+
+debug.images_requested = config.imagesCount;
+debug.internal_links_requested = config.internalLinksCount;
+debug.external_links_requested = config.externalLinksCount;
+debug.youtube_embeds_requested = config.youtubeCount;
@@ -0,0 +1,693 @@
+// Prompt rules shared by single-completion and sectioned generation (v2.68)
+const CONTENT_WRITING_STYLE = `WRITING STYLE - CRITICAL (Anti-AI Detection):
+- Write like a human blogger, NOT like an AI assistant
+- NEVER use em-dashes (—) - use commas, periods, or "and" instead
+- NEVER use these AI-typical words/phrases: "delve", "tapestry", "landscape", "realm", "crucial", "pivotal", "elevate", "leverage", "robust", "seamless", "cutting-edge", "game-changer", "it's important to note", "it's worth mentioning", "in today's world", "at the end of the day"
+- AVOID starting sentences with: "Whether you're...", "When it comes to...", "In the world of...", "As we navigate..."
+- Use contractions naturally (don't, won't, it's, you're)
+- Vary sentence length - mix short punchy sentences with longer ones
+- Include occasional informal phrases and colloquialisms appropriate to the tone
+- Write in active voice, be direct and specific`;
+
+const META_DESCRIPTION_RULES = `META DESCRIPTION RULES - CRITICAL:
+- NEVER start with: "Explore", "Discover", "Learn", "Find out", "Uncover", "Dive into", "Looking for"
+- Start with action verbs, questions, or direct statements
+- Good examples: "Your vape coil isn't lasting? Here's why.", "5 proven ways to...", "The truth about...", "Finally understand why..."
+- Make it compelling and specific, not generic
+- Include the main keyword naturally`;
+
+const ADAPTIVE_CONTENT_STYLE = `ADAPTIVE CONTENT STYLE:
+Analyze the topic and automatically adapt the format:
+- "Best X" / "Top X" / "X alternatives" → Listicle with numbered items, comparison table, pros/cons
+- "How to" / "Guide" / "Tutorial" → Step-by-step format with numbered instructions, tips boxes
+- "Review" / "vs" / "comparison" → Detailed analysis, comparison table, verdict section
+- "What is" / "Explained" → Educational format with definitions, examples, breakdown sections
+- "Tips" / "Ideas" / "Ways to" → Bullet-heavy format with actionable takeaways
+- General topics → Balanced informative article with good flow`;
+
+const CONTENT_STRUCTURE_RULES = `CONTENT STRUCTURE RULES:
+- ABSOLUTELY NO <a> tags or href attributes - links added programmatically later
+- ABSOLUTELY NO URLs in content_html - no example.com, no placeholder links
+- ABSOLUTELY NO "Learn more", "Read more", "Click here" or similar link text
+- NO citations, sources, or references sections
+- Link anchor phrases must appear ONLY in paragraph text (<p>, <li>), NEVER in headings`;
+
+// v2.70: Every content request's system message starts with this prefix. It has no
+// per-site or per-post values, so it is byte-identical across posts, sites and
+// generation modes, and OpenAI's prompt cache can reuse it. Site settings, schema
+// and tone come after it.
+const CONTENT_SYSTEM_PREFIX = `You are an expert SEO content writer creating content for a real blog. You MUST respond with ONLY valid JSON, no other text.
+
+${CONTENT_WRITING_STYLE}
+
+${META_DESCRIPTION_RULES}
+
+${ADAPTIVE_CONTENT_STYLE}
+
+${CONTENT_STRUCTURE_RULES}
+
+HTML & FORMATTING:
+- Use proper HTML: h2, h3, p, ul, li, ol, strong, em, table, thead, tbody, tr, th, td
+- Tables should have proper thead with th headers and tbody with td cells
+- NO title in content_html (title goes in the title field)
+
+IMAGE PLACEHOLDERS (only when the task asks for them):
+Format: <!-- WPIMG alt="DESCRIPTIVE ALT TEXT HERE" -->
+PLACEMENT: Place each image where it would naturally enhance the reader's understanding - after explaining a concept, showing a process, or introducing a new section. Space them throughout the article.
+Each ALT text must be unique and descriptive of what the image should show.`;
+
+function contentSystemPrompt(task) {
+  return `${CONTENT_SYSTEM_PREFIX}
+
+${task}
+
+TONE (PRIORITY): ${config.tone}
+The tone setting from the site takes absolute priority. Adapt your language, formality, and style to match this tone while still following all other rules.`;
+}
+
+// v2.69: Anchor phrases are requested only for link types the site inserts, as many as it inserts
+function anchorPhraseFields() {
+  return [
+    { name: 'internal_anchor_phrases', example: '["phrase for internal links"]', count: config.internalLinksCount },
+    { name: 'external_anchor_phrases', example: '["phrase for external links"]', count: config.externalLinksCount }
+  ].filter(a => a.count > 0);
+}
+
+// JSON schema example for the prompt from [name, example] pairs
+function outputSchema(fields) {
+  return `{\n${fields.map(([name, example]) => `  "${name}": ${example}`).join(',\n')}\n}`;
+}
+
+function numberedList(items) {
+  return items.map((item, i) => `${i + 1}. ${item}`).join('\n');
+}
+
+async function generateContentJson(onField) {
+  if (config.generationMode === 'sections') return generateSectionedContentJson.call(this, onField);
+  
+  // v2.69: YouTube placeholders and youtube_anchor_phrases are no longer requested
+  // (videos are placed by H2 since v2.41), nor faq_items (unused since v2.29);
+  // anchor phrases only when the site inserts that kind of link
+  const anchors = anchorPhraseFields();
+
+  const systemPrompt = contentSystemPrompt(`TASK: Write the complete article.
+
+Output JSON schema:
+${outputSchema([
+  ['title', '"SEO-optimized title"'],
+  ['slug', '"url-friendly-slug"'],
+  ['meta_description', '"150-160 char meta description"'],
+  ['focus_keyphrase', '"main keyword/phrase to rank for"'],
+  ['tag_suggestions', '["tag1", "tag2"]'],
+  ['content_html', '"<p>Full HTML content...</p>"'],
+  ...anchors.map(a => [a.name, a.example])
+])}
+
+ARTICLE REQUIREMENTS:
+- INCLUDE AT LEAST ONE DATA TABLE (comparisons, specs, statistics, pros/cons)
+- Include ${config.faqCount} FAQs at the end
+- Target ${config.minWords}-${config.maxWords} words
+- focus_keyphrase should appear naturally 3-5 times in the content${anchors.length > 0 ? '\n- Anchor phrases MUST appear verbatim as plain text in PARAGRAPH content (NOT in headings)' : ''}`);
+
+  // v2.70: Values that can change from post to post (random link/image counts, the topic) come last
+  const userPrompt = `Write a comprehensive blog article about the topic below.
+
+Provide:\n${numberedList([
+    'Engaging introduction',
+    '4-6 main sections with H2 headings',
+    'Subsections with H3 where appropriate',
+    'AT LEAST ONE HTML TABLE with data',
+    'Practical tips and examples',
+    `${config.faqCount} FAQs at the end`,
+    'focus_keyphrase (main SEO keyword derived from topic)',
+    ...anchors.map(a => `${a.count} ${a.name} (phrases that appear in PARAGRAPHS only)`),
+    ...(config.imagesCount > 0 ? [`EXACTLY ${config.imagesCount} image placeholder(s) in the content_html`] : [])
+  ])}${anchors.length > 0 ? '\n\nIMPORTANT: All anchor phrases must appear in <p> or <li> tags, NOT in headings.' : ''}\n\nRespond with ONLY the JSON object.
+
+TOPIC: "${config.topic}"`;
+
+  const body = {
+    model: config.openaiModel,
+    messages: [{ role: 'system', content: systemPrompt }, { role: 'user', content: userPrompt }],
+    temperature: 0.7,
+    max_tokens: contentMaxTokens(),
+    response_format: { type: 'json_object' }
+  };
+  
+  let answer;
+  if (config.contentStreaming && useKeepAliveTransport() && typeof AbortController === 'function') {
+    answer = await streamContentJson.call(this, body, onField);
+  } else {
+    const resp = await openaiRequest.call(this, 'content', 'chat/completions', { body });
+    answer = { text: resp?.choices?.[0]?.message?.content, finishReason: resp?.choices?.[0]?.finish_reason };
+  }
+  
+  if (!answer.text) throw new Error('Empty response from OpenAI');
+  const repair = debug.content_repair = { max_tokens: body.max_tokens, finish_reason: answer.finishReason || null, continuations: 0, repaired: false };
+  
+  // v2.67: A cut-off answer is continued rather than thrown away
+  while (answer.finishReason === 'length' && repair.continuations < CONTENT_CONTINUATIONS) {
+    repair.continuations++;
+    const more = await continueContentJson.call(this, body, answer.text);
+    answer.text += more.text;
+    answer.finishReason = more.finishReason;
+    if (answer.feed) answer.feed(more.text);
+  }
+  repair.finish_reason = answer.finishReason || null;
+  
+  let parsed;
+  try {
+    parsed = JSON.parse(answer.text);
+  } catch (e) {
+    parsed = repairJson(answer.text);
+    if (!parsed) throw new Error(`Invalid JSON from OpenAI (finish_reason: ${answer.finishReason || 'unknown'}): ${e.message}`);
+    repair.repaired = true;
+    // A cut-off article ends at its last complete block
+    if (typeof parsed.content_html === 'string') parsed.content_html = trimToLastBlock(parsed.content_html);
+  }
+  
+  // Strip any hallucinated links from content_html (AI sometimes ignores instructions)
+  // v2.57: Same tokenizer pass as link injection - drops <a> tags (keeping their content),
+  // stray href attributes and example.com placeholder URLs
+  if (parsed.content_html) {
+    parsed.content_html = stripLinks(parsed.content_html);
+  }
+  
+  return parsed;
+}
+
+// v2.66: Streaming generation. With the keep-alive transport (v2.62) the chat
+// completion is requested with stream: true and the SSE deltas go through an
+// incremental JSON scanner. Each top-level field is passed to onField(name,
+// value, fieldsSoFar) as soon as it is complete, so later steps can start while
+// the rest of the answer streams. content_html is checked as it arrives: a link
+// or placeholder URL in it, or content_html starting before title, aborts the
+// request and the article is generated again. The last attempt is not checked;
+// links in it are stripped as before.
+const CONTENT_STREAM_ATTEMPTS = 2;
+const CONTENT_STREAM_VIOLATIONS = [
+  { pattern: /<a\s[^>]*href/i, reason: 'link in content_html' },
+  { pattern: /example\.com/i, reason: 'placeholder URL in content_html' }
+];
+
+async function streamContentJson(body, onField) {
+  const started = Date.now();
+  const stats = debug.content_stream = { attempts: 0, aborted: [] };
+  for (let attempt = 1; ; attempt++) {
+    stats.attempts = attempt;
+    const strict = attempt < CONTENT_STREAM_ATTEMPTS;
+    const controller = new AbortController();
+    const fields = {};
+    let violation = null;
+    const reject = reason => {
+      violation = reason;
+      controller.abort(new Error(`Content rejected while streaming: ${reason}`));
+    };
+    const scanner = createJsonFieldScanner((name, value) => {
+      if (name === 'content_html' && typeof value === 'string') value = stripLinks(value);
+      fields[name] = value;
+      if (onField) onField(name, value, fields);
+    }, (name, segment) => {
+      if (!strict || violation || name !== 'content_html') return;
+      if (!fields.title) return reject('content_html before title');
+      const hit = CONTENT_STREAM_VIOLATIONS.find(v => v.pattern.test(segment));
+      if (hit) reject(hit.reason);
+    });
+    
+    let sse = '';
+    let finishReason = null;
+    let usage = null;
+    const onData = chunk => {
+      sse += chunk.toString('utf8');
+      const lines = sse.split('\n');
+      sse = lines.pop();
+      for (const line of lines) {
+        if (!line.startsWith('data:')) continue;
+        const data = line.slice(5).trim();
+        if (!data || data === '[DONE]') continue;
+        const event = JSON.parse(data);
+        if (event.error) throw new Error(event.error.message || 'OpenAI stream error');
+        // v2.70: With include_usage the last event carries the usage block and no choices
+        if (event.usage) usage = event.usage;
+        const choice = event.choices?.[0];
+        if (choice?.finish_reason) finishReason = choice.finish_reason;
+        const delta = choice?.delta?.content;
+        if (!delta) continue;
+        if (stats.first_token_ms === undefined) stats.first_token_ms = Date.now() - started;
+        if (!violation) scanner.feed(delta);
+      }
+    };
+    
+    try {
+      await openaiRequest.call(this, 'content_stream', 'chat/completions', {
+        body: { ...body, stream: true, stream_options: { include_usage: true } },
+        onData,
+        abortSignal: controller.signal
+      }, () => usage);
+    } catch (e) {
+      if (!violation) throw e;
+    }
+    if (violation) {
+      stats.aborted.push({ reason: violation, chars: scanner.text().length });
+      continue;
+    }
+    stats.total_ms = Date.now() - started;
+    stats.finish_reason = finishReason;
+    // feed() lets a continuation (v2.67) report the fields it completes
+    return { text: scanner.text(), finishReason, feed: text => scanner.feed(text) };
+  }
+}
+
+// v2.67: max_tokens follows the site's word range: ~1.35 tokens per English word,
+// +40% for HTML markup and JSON escaping, plus the FAQs, anchors and metadata.
+// Capped at the model's output limit; unknown models keep the old 4500.
+const CONTENT_CONTINUATIONS = 2;
+const MODEL_OUTPUT_LIMITS = [
+  ['gpt-4.1', 32768],
+  ['gpt-4o', 16384],
+  ['gpt-4-turbo', 4096],
+  ['gpt-4', 8192],
+  ['gpt-3.5', 4096]
+];
+
+function modelOutputLimit() {
+  const model = config.openaiModel.toLowerCase();
+  return MODEL_OUTPUT_LIMITS.find(([prefix]) => model.startsWith(prefix))?.[1] || 4500;
+}
+
+function contentMaxTokens() {
+  const estimate = Math.ceil(config.maxWords * 1.35 * 1.4) + config.faqCount * 120 + 600;
+  return Math.min(modelOutputLimit(), Math.max(2000, estimate));
+}
+
+// v2.70: Every OpenAI call (chat, embeddings, images) goes through openaiRequest().
+// The response's usage block - prompt, cached and completion tokens - is recorded
+// with the call's latency in debug.openai_usage, together with per-post totals and
+// the cache hit rate (cached / prompt tokens). Failed or cancelled calls are listed
+// with their error and no tokens.
+function recordOpenaiUsage(call, model, usage, ms, error) {
+  const totals = debug.openai_usage;
+  const entry = {
+    call,
+    model,
+    // Images report input/output tokens, chat and embeddings prompt/completion tokens
+    prompt_tokens: usage?.prompt_tokens ?? usage?.input_tokens ?? 0,
+    cached_tokens: usage?.prompt_tokens_details?.cached_tokens ?? usage?.input_tokens_details?.cached_tokens ?? 0,
+    completion_tokens: usage?.completion_tokens ?? usage?.output_tokens ?? 0,
+    ms: Math.round(ms)
+  };
+  if (error) entry.error = error.message;
+  totals.calls.push(entry);
+  totals.prompt_tokens += entry.prompt_tokens;
+  totals.cached_tokens += entry.cached_tokens;
+  totals.completion_tokens += entry.completion_tokens;
+  totals.cache_hit_rate = totals.prompt_tokens > 0 ? Math.round(totals.cached_tokens / totals.prompt_tokens * 1000) / 1000 : 0;
+}
+
+// usageOf(resp) returns the usage block; a streamed call passes one that reads
+// the usage its onData handler picked up from the last event
+async function openaiRequest(call, path, options, usageOf = resp => resp?.usage) {
+  const started = Date.now();
+  try {
+    const resp = await httpRequest.call(this, {
+      method: 'POST',
+      url: `https://api.openai.com/v1/${path}`,
+      headers: { 'Authorization': `Bearer ${config.openaiKey}`, 'Content-Type': 'application/json' },
+      ...options
+    });
+    recordOpenaiUsage(call, options.body?.model, usageOf(resp), Date.now() - started);
+    return resp;
+  } catch (e) {
+    recordOpenaiUsage(call, options.body?.model, null, Date.now() - started, e);
+    throw e;
+  }
+}
+
+// Ask for the rest of a cut-off answer. JSON mode is off: the continuation is a
+// fragment, not an object. Text the model repeats from the end of the answer is dropped.
+async function continueContentJson(body, text) {
+  const { response_format, ...rest } = body;
+  const resp = await openaiRequest.call(this, 'continuation', 'chat/completions', {
+    body: {
+      ...rest,
+      messages: [
+        ...body.messages,
+        { role: 'assistant', content: text },
+        { role: 'user', content: 'Your answer was cut off. Continue the JSON from exactly where it stopped. Output only the remaining characters: no repetition, no code fences, no other text.' }
+      ]
+    }
+  });
+  let more = String(resp?.choices?.[0]?.message?.content || '').replace(/^\s*```(?:json)?\s*/i, '').replace(/\s*```\s*$/, '');
+  for (let overlap = Math.min(300, more.length, text.length); overlap >= 12; overlap--) {
+    if (text.endsWith(more.slice(0, overlap))) {
+      more = more.slice(overlap);
+      break;
+    }
+  }
+  return { text: more, finishReason: resp?.choices?.[0]?.finish_reason };
+}
+
+// Best-effort local repair of near-valid JSON: code fences and text around the
+// object are dropped, a cut-off string is closed, a dangling key, comma or
+// partial literal is removed and open objects/arrays are closed. Null if that
+// still doesn't parse.
+function repairJson(text) {
+  let src = String(text).replace(/^\s*```(?:json)?\s*/i, '').replace(/\s*```\s*$/, '');
+  const start = src.indexOf('{');
+  if (start < 0) return null;
+  src = src.slice(start);
+  const end = src.lastIndexOf('}');
+  if (end > 0) {
+    try { return JSON.parse(src.slice(0, end + 1)); } catch {}
+  }
+  
+  const stack = [];
+  let inString = false;
+  let escaped = false;
+  for (const ch of src) {
+    if (inString) {
+      if (escaped) escaped = false;
+      else if (ch === '\\') escaped = true;
+      else if (ch === '"') inString = false;
+    } else if (ch === '"') inString = true;
+    else if (ch === '{' || ch === '[') stack.push(ch === '{' ? '}' : ']');
+    else if (ch === '}' || ch === ']') stack.pop();
+  }
+  if (inString) src = (escaped ? src.slice(0, -1) : src.replace(/\\u[0-9a-fA-F]{0,3}$/, '')) + '"';
+  
+  for (let guard = 0; guard < 5; guard++) {
+    const before = src;
+    src = src.replace(/\s+$/, '')
+      .replace(/,$/, '')
+      .replace(/,?\s*"(?:[^"\\]|\\.)*"\s*:$/, '')
+      .replace(/:\s*(?:-?[\d.eE+-]*|t|tr|tru|f|fa|fal|fals|n|nu|nul)$/, ':');
+    // A string right after { or , inside an object is a key without a value
+    if (stack[stack.length - 1] === '}') src = src.replace(/([{,])\s*"(?:[^"\\]|\\.)*"$/, '$1');
+    if (src === before) break;
+  }
+  src = src.replace(/,$/, '') + stack.reverse().join('');
+  try { return JSON.parse(src); } catch { return null; }
+}
+
+// Cut HTML back to its last closing block tag
+function trimToLastBlock(html) {
+  if (/>\s*$/.test(html)) return html;
+  let cut = -1;
+  for (const m of html.matchAll(/<\/(?:p|ul|ol|table|h[2-6]|blockquote|div)>/gi)) cut = m.index + m[0].length;
+  return cut > 0 ? html.slice(0, cut) : html;
+}
+
+// v2.68: Sectioned generation (generation_mode=sections). A short first request
+// returns the outline: metadata, H2 list, anchor phrases, image alt texts and FAQ
+// questions. The introduction, every section and the FAQ answers are then written
+// concurrently with the outline as shared context, and content_html is assembled
+// in outline order. onField() gets the outline fields and, as 'content_outline',
+// the H2 skeleton of the article, so media slots can be claimed and filled while
+// the sections are still being written.
+const OUTLINE_MAX_TOKENS = 1500;
+const INTRO_WORDS = [100, 160];
+const FAQ_ANSWER_WORDS = [40, 80];
+const OUTLINE_FIELDS = ['title', 'slug', 'meta_description', 'focus_keyphrase', 'tag_suggestions', 'internal_anchor_phrases', 'external_anchor_phrases'];
+
+async function generateSectionedContentJson(onField) {
+  const started = Date.now();
+  const stats = debug.content_sections = { sections: 0, outline_ms: 0, slowest_part_ms: 0, total_ms: 0, truncated: 0, repaired: 0 };
+  
+  const outline = await requestContentPart.call(this, 'outline', outlineSystemPrompt(), outlineUserPrompt(), OUTLINE_MAX_TOKENS, stats);
+  const sections = (Array.isArray(outline.sections) ? outline.sections : [])
+    .map(s => ({ heading: String(s?.heading || '').trim(), summary: String(s?.summary || '').trim(), table: s?.table === true }))
+    .filter(s => s.heading);
+  if (!outline.title || sections.length < 2) throw new Error('Invalid outline from OpenAI: missing title or sections');
+  stats.sections = sections.length;
+  stats.outline_ms = Date.now() - started;
+  
+  const fields = {};
+  for (const name of OUTLINE_FIELDS) {
+    if (outline[name] === undefined) continue;
+    fields[name] = outline[name];
+    if (onField) onField(name, outline[name], fields);
+  }
+  // Alt texts travel as WPIMG placeholders, like in a single-completion article
+  const imageAlts = (Array.isArray(outline.image_alts) ? outline.image_alts : [])
+    .map(alt => String(alt).replace(/"|-->/g, '').trim())
+    .filter(Boolean);
+  if (onField) onField('content_outline', assembleSections(sections, imageAlts, '', [], []), fields);
+  
+  const questions = (Array.isArray(outline.faq_questions) ? outline.faq_questions : []).map(String).filter(Boolean).slice(0, config.faqCount);
+  const words = sectionWordRange(sections.length, questions.length);
+  const phrases = assignAnchorPhrases(outline, sections.length);
+  const context = sectionContext(outline, sections);
+  const system = sectionSystemPrompt();
+  const timed = async run => {
+    const t = Date.now();
+    try { return await run(); } finally { stats.slowest_part_ms = Math.max(stats.slowest_part_ms, Date.now() - t); }
+  };
+  
+  const [intro, faq, ...bodies] = await Promise.all([
+    timed(() => requestContentPart.call(this, 'intro', system, `${context}
+
+Write the INTRODUCTION. It comes before section 1 and has no heading.
+- ${INTRO_WORDS[0]}-${INTRO_WORDS[1]} words in <p> tags
+- Use the focus keyphrase once, naturally
+- Hook the reader and say what the article covers, without summarizing every section
+
+Respond with ONLY this JSON: {"html": "<p>...</p>"}`, partMaxTokens(INTRO_WORDS[1]), stats)),
+    questions.length === 0 ? { faq_items: [] } : timed(() => requestContentPart.call(this, 'faq', system, `${context}
+
+Answer these reader questions for the article's FAQ:
+${questions.map((q, i) => `${i + 1}. ${q}`).join('\n')}
+- ${FAQ_ANSWER_WORDS[0]}-${FAQ_ANSWER_WORDS[1]} words per answer, plain text without HTML
+
+Respond with ONLY this JSON: {"faq_items": [{"question": "Question?", "answer": "Answer text"}]}`, partMaxTokens(questions.length * FAQ_ANSWER_WORDS[1]), stats)),
+    ...sections.map((section, i) => timed(() => requestContentPart.call(this, `section_${i + 1}`, system, `${context}
+
+Write SECTION ${i + 1}: "${section.heading}"${section.summary ? `\nIt covers: ${section.summary}` : ''}
+- ${words.min}-${words.max} words
+- Start directly with the content: NO <h2>, the heading is added for you. Use <h3> for subsections
+- Don't repeat what the other sections cover${i < sections.length - 1 ? ' and don\'t wrap up the article' : ''}${section.table ? '\n- INCLUDE A DATA TABLE with thead/th headers and tbody/td cells' : ''}${phrases[i].length > 0 ? `\n- These phrases MUST appear verbatim in <p> or <li> text: ${phrases[i].map(p => `"${p}"`).join(', ')}` : ''}${i < 3 ? '\n- Use the focus keyphrase once, naturally' : ''}
+
+Respond with ONLY this JSON: {"html": "<p>...</p>"}`, partMaxTokens(words.max), stats)))
+  ]);
+  
+  const faqItems = (Array.isArray(faq.faq_items) ? faq.faq_items : [])
+    .filter(item => item?.question && item?.answer)
+    .map(item => ({ question: String(item.question), answer: String(item.answer) }));
+  const contentHtml = assembleSections(sections, imageAlts, sectionHtml(intro.html), bodies.map(body => sectionHtml(body.html)), faqItems);
+  stats.total_ms = Date.now() - started;
+  return { ...fields, content_html: contentHtml };
+}
+
+function outlineSystemPrompt() {
+  const anchors = anchorPhraseFields();
+  return contentSystemPrompt(`TASK: Plan the article. The introduction, sections and FAQ answers are written later from this outline.
+
+Output JSON schema:
+${outputSchema([
+  ['title', '"SEO-optimized title"'],
+  ['slug', '"url-friendly-slug"'],
+  ['meta_description', '"150-160 char meta description"'],
+  ['focus_keyphrase', '"main keyword/phrase to rank for"'],
+  ['tag_suggestions', '["tag1", "tag2"]'],
+  ['sections', '[{"heading": "H2 heading", "summary": "What the section covers, one sentence", "table": false}]'],
+  ...(config.imagesCount > 0 ? [['image_alts', '["descriptive alt text"]']] : []),
+  ...anchors.map(a => [a.name, a.example]),
+  ['faq_questions', '["FAQ question?"]']
+])}
+
+OUTLINE RULES:
+- 4-6 sections with H2 headings; the last one wraps the article up
+- NO introduction or FAQ in sections (both are added separately)
+- Set "table": true on the section that benefits most from a data table${anchors.length > 0 ? '\n- Anchor phrases are short natural phrases that can be used verbatim in paragraph text, NEVER in headings' : ''}${config.imagesCount > 0 ? '\n- Each image_alts entry is unique and descriptive of what the image should show' : ''}`);
+}
+
+function outlineUserPrompt() {
+  return `Plan a comprehensive blog article about the topic below.
+
+Provide:\n${numberedList([
+    'title, slug, meta_description and tag_suggestions',
+    'focus_keyphrase (main SEO keyword derived from topic)',
+    '4-6 sections with H2 headings',
+    `${config.faqCount} faq_questions`,
+    ...anchorPhraseFields().map(a => `${a.count} ${a.name}`),
+    ...(config.imagesCount > 0 ? [`EXACTLY ${config.imagesCount} image_alts`] : [])
+  ])}\n\nRespond with ONLY the JSON object.
+
+TOPIC: "${config.topic}"`;
+}
+
+function sectionSystemPrompt() {
+  return contentSystemPrompt(`TASK: Write one part of an article. The other parts are written at the same time from the same outline.
+- Write only your part, as HTML in the "html" field
+- NO <h1> or <h2> headings and NO title - headings are added programmatically
+- NO image or video placeholders - media is added programmatically`);
+}
+
+// Shared context for every part: title, keyphrase and the full outline
+function sectionContext(outline, sections) {
+  return `ARTICLE: "${outline.title}"
+TOPIC: ${config.topic}
+FOCUS KEYPHRASE: ${outline.focus_keyphrase || config.topic}
+OUTLINE:
+${sections.map((s, i) => `${i + 1}. ${s.heading}${s.summary ? ` - ${s.summary}` : ''}`).join('\n')}`;
+}
+
+// The word range left after the introduction and FAQ answers, split evenly
+function sectionWordRange(sectionCount, faqCount) {
+  const fixed = (INTRO_WORDS[0] + INTRO_WORDS[1]) / 2 + faqCount * (FAQ_ANSWER_WORDS[0] + FAQ_ANSWER_WORDS[1]) / 2;
+  const min = Math.max(120, Math.round((config.minWords - fixed) / sectionCount));
+  return { min, max: Math.max(min + 50, Math.round((config.maxWords - fixed) / sectionCount)) };
+}
+
+// Each anchor phrase is written into one section (round-robin) so it appears verbatim
+function assignAnchorPhrases(outline, sectionCount) {
+  const assigned = Array.from({ length: sectionCount }, () => []);
+  const phrases = [...new Set(['internal_anchor_phrases', 'external_anchor_phrases']
+    .flatMap(name => Array.isArray(outline[name]) ? outline[name] : [])
+    .map(phrase => String(phrase).trim())
+    .filter(Boolean))];
+  phrases.forEach((phrase, i) => assigned[i % sectionCount].push(phrase));
+  return assigned;
+}
+
+function partMaxTokens(words) {
+  return Math.ceil(words * 1.35 * 1.4) + 300;
+}
+
+// One JSON-mode completion for a part of a sectioned article. A cut-off answer
+// is repaired (and its html trimmed to the last block) instead of continued.
+async function requestContentPart(call, system, user, maxTokens, stats) {
+  const resp = await openaiRequest.call(this, call, 'chat/completions', {
+    body: {
+      model: config.openaiModel,
+      messages: [{ role: 'system', content: system }, { role: 'user', content: user }],
+      temperature: 0.7,
+      max_tokens: Math.min(modelOutputLimit(), maxTokens),
+      response_format: { type: 'json_object' }
+    }
+  });
+  const choice = resp?.choices?.[0];
+  if (!choice?.message?.content) throw new Error('Empty response from OpenAI');
+  if (choice.finish_reason === 'length') stats.truncated++;
+  try {
+    return JSON.parse(choice.message.content);
+  } catch (e) {
+    const parsed = repairJson(choice.message.content);
+    if (!parsed) throw new Error(`Invalid JSON from OpenAI (finish_reason: ${choice.finish_reason || 'unknown'}): ${e.message}`);
+    stats.repaired++;
+    if (typeof parsed.html === 'string') parsed.html = trimToLastBlock(parsed.html);
+    return parsed;
+  }
+}
+
+// A part's HTML without links, and with any H1/H2 it wrote demoted to H3 so the
+// article's sections are exactly the outline's
+function sectionHtml(html) {
+  return stripLinks(String(html || '').trim()).replace(/<(\/?)h[12]\b/gi, '<$1h3');
+}
+
+function escapeHtmlText(text) {
+  return String(text).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+}
+
+// Deterministic assembly; with empty parts it gives the H2 skeleton passed to onField
+function assembleSections(sections, imageAlts, intro, bodies, faqItems) {
+  const parts = [intro, imageAlts.map(alt => `<!-- WPIMG alt="${alt}" -->`).join('')];
+  sections.forEach((section, i) => parts.push(`<h2>${escapeHtmlText(section.heading)}</h2>`, bodies[i] || ''));
+  if (faqItems.length > 0) {
+    parts.push('<h2>FAQ</h2>', ...faqItems.map(item => `<h3>${escapeHtmlText(item.question)}</h3>\n<p>${escapeHtmlText(item.answer)}</p>`));
+  }
+  return parts.filter(Boolean).join('\n\n');
+}
+
+// Incremental scanner for one JSON object. onField(name, value) fires when a
+// top-level value is complete; onString(name, segment) gets the newly arrived
+// raw text of a top-level string value (with a little overlap for matches that
+// straddle two chunks).
+function createJsonFieldScanner(onField, onString) {
+  let text = '';
+  let pos = 0;
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+  let key = null;
+  let keyStart = -1;
+  let valueStart = -1;
+  let checked = 0;
+  
+  const emit = end => {
+    const name = key;
+    key = null;
+    const raw = text.slice(valueStart, end).trim();
+    valueStart = -1;
+    let value;
+    try { value = JSON.parse(raw); } catch { return; }
+    onField(name, value);
+  };
+  
+  return {
+    text: () => text,
+    feed(chunk) {
+      text += chunk;
+      for (; pos < text.length; pos++) {
+        const ch = text[pos];
+        if (inString) {
+          if (escaped) escaped = false;
+          else if (ch === '\\') escaped = true;
+          else if (ch === '"') {
+            inString = false;
+            if (depth !== 1) continue;
+            if (keyStart >= 0) {
+              key = JSON.parse(text.slice(keyStart, pos + 1));
+              keyStart = -1;
+            } else if (valueStart >= 0) {
+              emit(pos + 1);
+            }
+          }
+          continue;
+        }
+        if (ch === '"') {
+          inString = true;
+          if (depth === 1 && key === null) keyStart = pos;
+          else if (depth === 1 && valueStart < 0) { valueStart = pos; checked = pos; }
+        } else if (ch === '{' || ch === '[') {
+          if (depth === 1 && key !== null && valueStart < 0) valueStart = pos;
+          depth++;
+        } else if (ch === '}' || ch === ']') {
+          if (depth === 1 && valueStart >= 0) emit(pos);
+          depth--;
+          if (depth === 1 && valueStart >= 0) emit(pos + 1);
+        } else if (ch === ',') {
+          if (depth === 1 && valueStart >= 0) emit(pos);
+        } else if (depth === 1 && key !== null && valueStart < 0 && ch !== ':' && !/\s/.test(ch)) {
+          valueStart = pos;
+        }
+      }
+      // A top-level string still streaming: hand over what arrived since the last check
+      if (inString && depth === 1 && key !== null && valueStart >= 0) {
+        onString(key, text.slice(Math.max(valueStart, checked - 32)));
+        checked = text.length;
+      }
+    }
+  };
+}
+
+// Base name for uploaded image files
+function postSlug(contentJson) {
+  return contentJson.slug || contentJson.title.toLowerCase().replace(/[^a-z0-9]+/g, '-').substring(0, 50);
+}
+
+function validateContent(contentJson) {
+  const errors = [];
+  if (!contentJson.title) errors.push('Missing title');
+  if (!contentJson.content_html) errors.push('Missing content_html');
+  if (!contentJson.meta_description) errors.push('Missing meta_description');
+  // v2.32: Image placeholder check is now a warning, not an error
+  // AI sometimes doesn't include enough placeholders - we proceed with what we have
+  if (config.imagesCount > 0) {
+    const placeholderMatches = contentJson.content_html.match(/<!-- WPIMG alt="[^"]+" -->/g) || [];
+    if (placeholderMatches.length < config.imagesCount) {
+      debug.wp_errors.push({ step: 'VALIDATION_WARNING', message: `Image placeholders: wanted ${config.imagesCount}, got ${placeholderMatches.length}` });
+    }
+  }
+  return errors;
+}
@@ -0,0 +1,168 @@
+/**
+ * AUTOBLOGGER PUBLISHER ENGINE v2.71
+ * 
+ * v2.71 Changes:
+ * - Early images start only once the slug has streamed and are kept only under that slug
+ * - Uploads from a discarded early run, or from a run that fails first, are deleted again
+ * - debug.images_uploaded counts the kept images only; deletions go to debug.images_discarded
+ * - Term cache no longer prefetched while streaming; it only loads when publish-bundle is missing
+ * - Errors thrown while parsing a stream (fromStream) no longer count toward the OpenAI circuit
+ * - Static data read through one workflowStaticData() helper
+ * - Post index capped at the newest 1500 posts; semantic vectors kept for the newest 500
+ * - Term cache misses created per term again; /create-terms (plugin 1.7) dropped, no fallback site could reach it
+ * - Image provider sampling only while the head provider is unsettled, hourly per provider, never costlier than a healthy head
+ * - SpeedyIndex/FastIndex submissions no longer idempotent: a timeout or 5xx is not resubmitted and billed twice
+ * - YouTube embeds written into the block their slot claimed, not the section's first block
+ * 
+ * v2.70 Changes:
+ * - Content prompts start with one static prefix shared by all sites, posts and generation modes
+ * - Site settings, schema and tone follow it; per-post values (topic, random counts) come last
+ * - Every OpenAI call records prompt/cached/completion tokens and latency in debug.openai_usage
+ * 
+ * v2.69 Changes:
+ * - Output schema and prompt list built from site config; only fields a later step reads are requested
+ * - youtube_anchor_phrases, YTVID placeholders and faq_items dropped (unused since v2.41/v2.29)
+ * - Internal/external anchor phrases requested only when enabled, as many as the link count
+ * 
+ * v2.68 Changes:
+ * - generation_mode=sections: outline request first, then intro, every H2 section and FAQs concurrently
+ * - content_html assembled in outline order; stray H1/H2 in a section demoted to H3
+ * - Images and YouTube slots claimed on the outline's H2 skeleton and filled while sections are written
+ * 
+ * v2.67 Changes:
+ * - Article cut off at max_tokens (finish_reason=length) continued up to twice instead of failing
+ * - Near-valid JSON repaired locally; a cut-off content_html ends at its last complete block
+ * - max_tokens derived from the word range and FAQ count, capped at the model's output limit
+ * 
+ * v2.66 Changes:
+ * - Article streamed (content_streaming) and parsed field by field as the SSE deltas arrive
+ * - Links/placeholder URLs in content_html or content before title abort the stream; one regeneration
+ * - Term cache loads on tag_suggestions, images start once content_html is complete
+ * 
+ * v2.65 Changes:
+ * - Rolling image provider stats in static data (success rate, p50/p95 latency, cost per image)
+ * - Providers reordered per post: failing ones last, fastest healthy first (image_provider_ordering)
+ * - image_provider_priority kept as tiebreaker and for providers without enough samples
+ * 
+ * v2.64 Changes:
+ * - Image, SERP and indexing fallbacks run through one chain runner with optional hedging (hedge_chains)
+ * - A provider slower than its p90 latency gets the next one started; first result wins, loser cancelled
+ * - Hedges capped per execution by hedge_budget (default 3); latency samples kept in static data
+ * 
+ * v2.63 Changes:
+ * - httpRequest maps each call to a provider with a timeout budget and jittered exponential retries
+ * - Circuit breaker per provider in static data: 3 outages in 10 min skip it until a probe succeeds
+ * 
+ * v2.62 Changes:
+ * - httpRequest keeps one connection pool per host for the execution (needs NODE_FUNCTION_ALLOW_BUILTIN)
+ * - HTTP/2 session where the host negotiates h2, keep-alive agent (http_pool_size, default 6) otherwise
+ * - Per-host protocol/connection/request counts in debug.http_connections
+ * 
+ * v2.61 Changes:
+ * - JWT cached per site in static data until its decoded expiry; no validate call while fresh
+ * - Concurrent callers share one token refresh; users/me check skipped for an hour after success
+ * 
+ * v2.60 Changes:
+ * - TERMS served from a per-site tag/category cache (full pagination, 24h TTL) in static data
+ * - Cache misses found-or-created in one /n8n/v1/create-terms request (plugin 1.7+)
+ * 
+ * v2.59 Changes:
+ * - Per-section YouTube searches run concurrently
+ * - Candidates deduplicated, then checked by real duration with one videos.list call (Shorts dropped)
+ * 
+ * v2.58 Changes:
+ * - One section map per article: images and YouTube embeds claim <h2> slots and never share one
+ * - Links and media are placed on one token list; the post HTML is assembled once before publishing
+ * 
+ * v2.57 Changes:
+ * - One-pass HTML tokenizer + Aho-Corasick phrase matching for external and internal links
+ * - Links never land in headings or existing links; HTML rebuilt once per step
+ * - Hallucinated-link stripping uses the same tokenizer
+ * 
+ * v2.56 Changes:
+ * - internal_link_mode=semantic: link targets ranked by embedding similarity (title + excerpt)
+ * - Post embeddings cached in the title index; one batched embeddings call per post
+ * 
+ * v2.55 Changes:
+ * - Internal links matched locally against a per-site title index in workflow static data
+ * - Index refreshed with one modified_after delta sync instead of a search call per phrase
+ * 
+ * v2.54 Changes:
+ * - Base64 images above upload_chunk_kb (default 512) use the resumable chunked upload (plugin 1.6+)
+ * - Chunks are raw binary (base64 if blocked); a failed chunk resumes from the plugin's offset
+ * 
+ * v2.53 Changes:
+ * - Base64 images sent as a raw text/plain body so plugin 1.5+ decodes them in constant memory
+ * - Retries with the JSON body when the plugin is older
+ * 
+ * v2.52 Changes:
+ * - Terms, post and SEO meta published in one request via /n8n/v1/publish-bundle (plugin 1.4+)
+ * - Falls back to the separate tag/category/post/SEO calls when the route is missing
+ * 
+ * v2.51 Changes:
+ * - Image uploads ask the plugin to defer thumbnail generation (defer_thumbnails, default on)
+ * - Needs plugin 1.3+ for the speed-up; older plugins ignore the flag
+ * 
+ * v2.50 Changes:
+ * - Images generated and uploaded as a pipelined pool (image_concurrency, default 2)
+ * - Results spliced back in placeholder order; first image is still featured
+ * 
+ * v2.49 Changes:
+ * - Humanized prompts: Anti-AI footprint rules (no em-dashes, typical AI phrases)
+ * - Adaptive content style based on topic type (listicles, reviews, how-tos, etc.)
+ * - Better meta descriptions (no generic "Explore/Discover" openers)
+ * - Tone from registry sheet is now explicitly prioritized
+ * 
+ * v2.48 Changes:
+ * - FIX: Images now generated even when AI omits placeholders
+ * - Uses section headings for alt text when AI placeholders missing
+ * 
+ * v2.47 Changes:
+ * - External links now distributed across content (prevents clustering)
+ * - Minimum spacing enforced between links based on content size
+ * - Links spread across different paragraphs
+ * 
+ * v2.46 Changes:
+ * - Renamed speedyindex_enabled to indexing_enabled (generic control)
+ * - Renamed function to pingIndexingService
+ * 
+ * v2.45 Changes:
+ * - Added FastIndex.eu as fallback (FASTINDEX_API_KEY)
+ * 
+ * v2.44 Changes:
+ * - Added Serper.dev as fallback SERP provider (SERPER_API_KEY)
+ * 
+ * v2.43 Changes:
+ * - YouTube: Now searches per-section heading for much better relevance
+ * 
+ * v2.42 Changes:
+ * - Filter out YouTube Shorts (videoDuration=medium)
+ * 
+ * v2.41 Changes:
+ * - Images distributed across early H2 sections
+ * - YouTube distributed across middle H2 sections
+ * - Never places media in Conclusion/FAQ sections
+ * 
+ * v2.40 Changes:
+ * - YouTube uses plain URL (WordPress auto-embeds)
+ * 
+ * v2.39 Changes:
+ * - Simplified YouTube embed format
+ * 
+ * v2.38 Changes:
+ * - YouTube embeds use [embed] shortcode (iframes stripped by wp_kses)
+ * 
+ * v2.37 Changes:
+ * - FIX: Empty string handling for internal_links_count/external_links_count (was causing NaN)
+ * 
+ * v2.36 Changes:
+ * - YouTube/Images placed by AI using placeholder comments
+ * 
+ * v2.30 Changes:
+ * - SEO: New plugin endpoint /n8n/v1/update-seo-meta for direct meta updates
+ * - SEO: Shows which SEO plugins are detected (Yoast/RankMath)
+ * - SEO: Uses update_post_meta() directly (bypasses REST API schema restrictions)
+ * 
+ * v2.29 Changes:
+ * - FIX: Removed JSON-LD script injection (WordPress blocks script tags)
+ */
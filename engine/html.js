@@ -0,0 +1,285 @@
+// v2.57: One-pass HTML tokenizer shared by link injection and link stripping.
+// Text runs are tagged with the <p>/<li>/<td> block they sit in; text inside
+// headings or existing <a> tags is never linkable.
+const LINK_BLOCK_TAGS = new Set(['p', 'li', 'td']);
+const HEADING_TAGS = new Set(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']);
+
+function parseHtml(html) {
+  const tokens = [];
+  let blockDepth = 0;
+  let headingDepth = 0;
+  let anchorDepth = 0;
+  let block = -1;
+  let blockCount = 0;
+  let pos = 0;
+
+  function pushText(end) {
+    if (end <= pos) return;
+    tokens.push({
+      kind: 'text',
+      raw: html.substring(pos, end),
+      block: blockDepth > 0 ? block : -1,
+      linkable: blockDepth > 0 && headingDepth === 0 && anchorDepth === 0,
+      inLink: anchorDepth > 0,
+      links: null
+    });
+  }
+
+  while (pos < html.length) {
+    const lt = html.indexOf('<', pos);
+    if (lt === -1) break;
+    if (html.startsWith('<!--', lt)) {
+      pushText(lt);
+      const close = html.indexOf('-->', lt + 4);
+      const end = close === -1 ? html.length : close + 3;
+      tokens.push({ kind: 'comment', raw: html.substring(lt, end) });
+      pos = end;
+      continue;
+    }
+    const nameMatch = /^<(\/?)([a-zA-Z][a-zA-Z0-9]*)/.exec(html.substring(lt, lt + 20));
+    if (!nameMatch) {
+      // A bare '<' is text
+      pushText(lt + 1);
+      pos = lt + 1;
+      continue;
+    }
+    // Find the closing '>' outside quoted attribute values
+    let end = lt + nameMatch[0].length;
+    let quote = null;
+    for (; end < html.length; end++) {
+      const ch = html[end];
+      if (quote) { if (ch === quote) quote = null; }
+      else if (ch === '"' || ch === "'") quote = ch;
+      else if (ch === '>') break;
+    }
+    pushText(lt);
+    end = Math.min(end + 1, html.length);
+    const name = nameMatch[2].toLowerCase();
+    const closing = nameMatch[1] === '/';
+    tokens.push({ kind: 'tag', raw: html.substring(lt, end), name, closing });
+    pos = end;
+
+    const step = closing ? -1 : (html[end - 2] === '/' ? 0 : 1);
+    if (LINK_BLOCK_TAGS.has(name)) {
+      if (step > 0 && blockDepth === 0) block = blockCount++;
+      blockDepth = Math.max(0, blockDepth + step);
+    } else if (HEADING_TAGS.has(name)) {
+      headingDepth = Math.max(0, headingDepth + step);
+    } else if (name === 'a') {
+      anchorDepth = Math.max(0, anchorDepth + step);
+    }
+  }
+  pushText(html.length);
+  return { tokens, blockCount };
+}
+
+function renderHtml(doc) {
+  let out = '';
+  for (const token of doc.tokens) {
+    if (!token.links) {
+      out += token.raw;
+    } else {
+      let last = 0;
+      for (const link of token.links.sort((a, b) => a.start - b.start)) {
+        out += token.raw.substring(last, link.start) + link.open + token.raw.substring(link.start, link.end) + link.close;
+        last = link.end;
+      }
+      out += token.raw.substring(last);
+    }
+    // v2.58: Blocks claimed on a section map render right after their </h2>
+    if (token.blocks) for (const block of token.blocks) out += block.html;
+  }
+  return out;
+}
+
+// v2.58: One section map per article, built right after generation. Images,
+// YouTube embeds and any later block type claim an <h2> slot on it; links are
+// placed on the same token list, and renderHtml() assembles the post once.
+// Ending sections (Conclusion, FAQs, Summary...) never get a slot.
+const ENDING_SECTIONS = ['conclusion', 'faq', 'summary', 'final', 'wrap'];
+const MEDIA_PLACEHOLDER = /^<!-- (WPIMG alt|YTVID context)="([^"]+)" -->$/;
+
+function buildSectionMap(html) {
+  const doc = parseHtml(html);
+  const sections = [];
+  const imageAlts = [];
+  let heading = null;
+  for (const token of doc.tokens) {
+    if (token.kind === 'comment') {
+      // AI-placed media placeholders are dropped; WPIMG alt text is kept for the images
+      const placeholder = MEDIA_PLACEHOLDER.exec(token.raw);
+      if (!placeholder) continue;
+      if (placeholder[1] === 'WPIMG alt') imageAlts.push(placeholder[2]);
+      token.raw = '';
+    } else if (token.kind === 'tag' && token.name === 'h2') {
+      if (!token.closing) {
+        heading = '';
+      } else if (heading !== null) {
+        const title = heading.trim();
+        if (!ENDING_SECTIONS.some(s => title.toLowerCase().includes(s))) {
+          token.blocks = [];
+          sections.push({ title, kind: null, blocks: token.blocks });
+        }
+        heading = null;
+      }
+    } else if (token.kind === 'text' && heading !== null) {
+      heading += token.raw;
+    }
+  }
+  return { doc, sections, imageAlts };
+}
+
+// A slot holds blocks of one kind only. Returns a block whose .html is filled
+// in later, or null if another kind already owns the slot.
+function claimSection(map, index, kind) {
+  const section = map.sections[index];
+  if (!section || (section.kind !== null && section.kind !== kind)) return null;
+  section.kind = kind;
+  const block = { html: '' };
+  section.blocks.push(block);
+  return block;
+}
+
+// v2.68: Moves the slots claimed on an outline skeleton (sectioned generation) to
+// the assembled article's map. False, and nothing moved, if the headings differ.
+function adoptSections(map, skeleton) {
+  if (map.sections.length !== skeleton.sections.length) return false;
+  if (map.sections.some((section, i) => section.title !== skeleton.sections[i].title)) return false;
+  map.sections.forEach((section, i) => {
+    section.kind = skeleton.sections[i].kind;
+    section.blocks.push(...skeleton.sections[i].blocks);
+  });
+  return true;
+}
+
+// Nearest slot to `index` that no block type has claimed yet, or -1
+function nearestFreeSection(map, index) {
+  for (let d = 0; d < map.sections.length; d++) {
+    for (const i of d === 0 ? [index] : [index + d, index - d]) {
+      if (map.sections[i] && map.sections[i].kind === null) return i;
+    }
+  }
+  return -1;
+}
+
+// Lower-case one UTF-16 unit at a time so match offsets line up with the source text
+function foldCase(text) {
+  let out = '';
+  for (const ch of text) {
+    const lower = ch.toLowerCase();
+    out += lower.length === ch.length ? lower : ch;
+  }
+  return out;
+}
+
+function isWordChar(ch) {
+  return ch !== undefined && /[A-Za-z0-9_]/.test(ch);
+}
+
+// Aho-Corasick automaton over case-folded phrases. find() reports every
+// occurrence bounded like /\bphrase\b/ as { start, end, pattern }.
+function buildPhraseMatcher(patterns) {
+  const edges = [new Map()];
+  const fail = [0];
+  const output = [[]];
+  patterns.forEach((pattern, index) => {
+    let state = 0;
+    for (let i = 0; i < pattern.length; i++) {
+      let next = edges[state].get(pattern[i]);
+      if (next === undefined) {
+        next = edges.length;
+        edges.push(new Map());
+        fail.push(0);
+        output.push([]);
+        edges[state].set(pattern[i], next);
+      }
+      state = next;
+    }
+    output[state].push(index);
+  });
+
+  const queue = [...edges[0].values()];
+  for (let head = 0; head < queue.length; head++) {
+    const state = queue[head];
+    for (const [ch, next] of edges[state]) {
+      let f = fail[state];
+      while (f > 0 && !edges[f].has(ch)) f = fail[f];
+      const target = edges[f].get(ch);
+      fail[next] = target !== undefined && target !== next ? target : 0;
+      output[next] = output[next].concat(output[fail[next]]);
+      queue.push(next);
+    }
+  }
+
+  return {
+    find(text) {
+      const folded = foldCase(text);
+      const matches = [];
+      let state = 0;
+      for (let i = 0; i < folded.length; i++) {
+        const ch = folded[i];
+        while (state > 0 && !edges[state].has(ch)) state = fail[state];
+        state = edges[state].get(ch) ?? 0;
+        for (const pattern of output[state]) {
+          const end = i + 1;
+          const start = end - patterns[pattern].length;
+          if (isWordChar(text[start - 1]) !== isWordChar(text[start]) && isWordChar(text[end - 1]) !== isWordChar(text[end])) {
+            matches.push({ start, end, pattern });
+          }
+        }
+      }
+      return matches;
+    }
+  };
+}
+
+// Every phrase is matched in one pass over the document's text runs.
+// Returns Map(folded phrase -> { occurrences: [{ token, start, end, block }], inLink })
+// with linkable occurrences in document order; inLink marks phrases already inside an <a>.
+function findPhraseOccurrences(doc, phrases) {
+  const patterns = [...new Set(phrases.map(p => foldCase(String(p || '').trim())).filter(p => p))];
+  const found = new Map(patterns.map(p => [p, { occurrences: [], inLink: false }]));
+  if (patterns.length === 0) return found;
+  const matcher = buildPhraseMatcher(patterns);
+  for (const token of doc.tokens) {
+    if (token.kind !== 'text' || !(token.linkable || token.inLink)) continue;
+    for (const match of matcher.find(token.raw)) {
+      // Not inside an entity such as &amp;
+      if (token.raw[match.start - 1] === '&' && token.raw[match.end] === ';') continue;
+      const entry = found.get(patterns[match.pattern]);
+      if (token.inLink) entry.inLink = true;
+      else entry.occurrences.push({ token, start: match.start, end: match.end, block: token.block });
+    }
+  }
+  return found;
+}
+
+function phraseEntry(found, phrase) {
+  return found.get(foldCase(String(phrase || '').trim())) || { occurrences: [], inLink: false };
+}
+
+// Wrap an occurrence in a link unless it overlaps one already placed
+function placeLink(occurrence, open, close) {
+  const token = occurrence.token;
+  token.links = token.links || [];
+  if (token.links.some(l => occurrence.start < l.end && l.start < occurrence.end)) return false;
+  token.links.push({ start: occurrence.start, end: occurrence.end, open, close });
+  return true;
+}
+
+// Remove <a> tags (keeping their content), stray href attributes and placeholder URLs
+function stripLinks(html) {
+  const doc = parseHtml(html);
+  let out = '';
+  for (const token of doc.tokens) {
+    if (token.kind === 'tag') {
+      if (token.name === 'a') continue;
+      out += token.raw.replace(/\s*href\s*=\s*("[^"]*"|'[^']*'|[^\s>]*)/gi, '');
+    } else if (token.kind === 'text') {
+      out += token.raw.replace(/https?:\/\/(?:www\.)?example\.com[^\s<]*/gi, '');
+    } else {
+      out += token.raw;
+    }
+  }
+  return out;
+}
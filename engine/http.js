@@ -0,0 +1,545 @@
+// v2.62: Keep-alive transport. n8n's helpers.httpRequest builds a new agent for
+// every call, so each request paid its own TCP + TLS handshake. When the Code
+// node may load Node built-ins (NODE_FUNCTION_ALLOW_BUILTIN=http,https,http2,tls,zlib
+// or *), every request to a host shares one pool for the whole execution: an
+// HTTP/2 session if the host negotiates h2, otherwise a keep-alive agent with
+// http_pool_size sockets. Without the built-ins, behind an HTTP(S)_PROXY, or
+// with http_pool_size = 0, the n8n helper is used as before.
+const HTTP_MODULES = (() => {
+  const optional = name => { try { return require(name); } catch { return null; } };
+  try {
+    return { http: require('http'), https: require('https'), tls: require('tls'), http2: optional('http2'), zlib: optional('zlib') };
+  } catch { return null; }
+})();
+const HTTP_CONNECT_TIMEOUT_MS = 15000;
+const HTTP_MAX_REDIRECTS = 5;
+const HTTP2_FORBIDDEN_HEADERS = new Set(['connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade', 'host']);
+const httpPool = new Map();
+
+function useKeepAliveTransport() {
+  if (!HTTP_MODULES || config.httpPoolSize === 0) return false;
+  const env = typeof process !== 'undefined' && process.env ? process.env : {};
+  return !(env.HTTPS_PROXY || env.https_proxy || env.HTTP_PROXY || env.http_proxy);
+}
+
+// v2.63: Resilience layer shared by every external call. Each provider has a
+// timeout budget (a cap on the call's own timeout) and a retry count. Retries
+// use jittered exponential backoff: any request is retried when it was rejected
+// unprocessed (429, 503, connection refused/DNS), and idempotent requests (GET,
+// or `idempotent: true`) also on timeouts, resets and 5xx. A circuit breaker per
+// provider, kept in workflow static data, opens after CIRCUIT_FAILURES outages
+// within CIRCUIT_WINDOW_MS. While open, calls fail at once; after
+// CIRCUIT_COOLDOWN_MS a single probe call is let through and closes it on success.
+const PROVIDER_POLICIES = {
+  openai_chat: { timeout: 300000, retries: 1 },
+  openai_images: { timeout: 60000, retries: 1 },
+  openai_embeddings: { timeout: 30000, retries: 2 },
+  fal: { timeout: 40000, retries: 1 },
+  pexels: { timeout: 10000, retries: 2 },
+  google_cse: { timeout: 10000, retries: 2 },
+  serper: { timeout: 10000, retries: 2 },
+  youtube: { timeout: 10000, retries: 2 },
+  speedyindex: { timeout: 15000, retries: 2 },
+  fastindex: { timeout: 15000, retries: 2 },
+  telegram: { timeout: 10000, retries: 2 },
+  email: { timeout: 15000, retries: 2 },
+  // A site outage fails the post anyway; WordPress only gets retries
+  wordpress: { timeout: 60000, retries: 2, breaker: false },
+  other: { timeout: 30000, retries: 1 }
+};
+const RETRY_BASE_MS = 400;
+const RETRY_MAX_MS = 8000;
+const CIRCUIT_FAILURES = 3;
+const CIRCUIT_WINDOW_MS = 10 * 60 * 1000;
+const CIRCUIT_COOLDOWN_MS = 5 * 60 * 1000;
+
+function providerFor(url) {
+  const host = url.hostname;
+  if (config.baseUrl && host === new URL(config.baseUrl).hostname) return 'wordpress';
+  if (host === 'api.openai.com') {
+    if (url.pathname.includes('/images')) return 'openai_images';
+    if (url.pathname.includes('/embeddings')) return 'openai_embeddings';
+    return 'openai_chat';
+  }
+  if (host === 'fal.run' || host.endsWith('.fal.ai') || host.endsWith('.fal.run') || host.endsWith('fal.media')) return 'fal';
+  if (host === 'api.pexels.com') return 'pexels';
+  if (host === 'www.googleapis.com') return url.pathname.startsWith('/youtube') ? 'youtube' : 'google_cse';
+  if (host === 'google.serper.dev') return 'serper';
+  if (host === 'api.speedyindex.com') return 'speedyindex';
+  if (host === 'host060126.eu') return 'fastindex';
+  if (host === 'api.telegram.org') return 'telegram';
+  if (['api.resend.com', 'api.sendgrid.com', 'api.mailgun.net', 'api.smtp2go.com'].includes(host)) return 'email';
+  return 'other';
+}
+
+function errorStatus(error) {
+  const status = error?.response?.status ?? error?.httpCode ?? error?.statusCode;
+  return status ? parseInt(status) : null;
+}
+
+// True when the request can't have reached the provider's handler
+function isUnprocessed(error) {
+  const status = errorStatus(error);
+  if (status === 429 || status === 503) return true;
+  const code = `${error?.code || ''} ${error?.cause?.code || ''} ${error?.message || ''}`;
+  return /ECONNREFUSED|ENOTFOUND|EAI_AGAIN|connect timeout/i.test(code);
+}
+
+function isRetryable(error, idempotent) {
+  if (isUnprocessed(error)) return true;
+  if (!idempotent) return false;
+  const status = errorStatus(error);
+  return !status || status === 408 || status >= 500;
+}
+
+function isOutage(error) {
+  const status = errorStatus(error);
+  return !status || status === 408 || status === 429 || status >= 500;
+}
+
+function retryDelay(attempt, error) {
+  const retryAfter = parseFloat(error?.response?.headers?.['retry-after']);
+  if (!isNaN(retryAfter)) return Math.min(retryAfter * 1000, RETRY_MAX_MS);
+  return Math.random() * Math.min(RETRY_MAX_MS, RETRY_BASE_MS * 2 ** attempt);
+}
+
+function getCircuit(provider) {
+  const staticData = workflowStaticData();
+  const circuits = staticData.circuits || (staticData.circuits = {});
+  return circuits[provider] || (circuits[provider] = { failures: [], open_until: 0, probe_at: 0 });
+}
+
+function providerStats(provider) {
+  debug.providers = debug.providers || {};
+  return debug.providers[provider] || (debug.providers[provider] = { calls: 0, retries: 0, failures: 0, skipped: 0 });
+}
+
+// Throws while the circuit is open; returns true if this call is the half-open probe
+function enterCircuit(circuit, provider, timeout) {
+  const now = Date.now();
+  if (!circuit.open_until) return false;
+  // One probe after the cooldown; a probe that never reported back expires with its timeout
+  if (now >= circuit.open_until && now - circuit.probe_at > timeout) {
+    circuit.probe_at = now;
+    return true;
+  }
+  providerStats(provider).skipped++;
+  const error = new Error(`Circuit open for ${provider} after ${CIRCUIT_FAILURES} failures; next probe after ${new Date(Math.max(circuit.open_until, circuit.probe_at + timeout)).toISOString()}`);
+  error.circuitOpen = true;
+  throw error;
+}
+
+function recordOutcome(circuit, provider, ok, probe) {
+  const now = Date.now();
+  if (ok) {
+    if (circuit.open_until) debug.circuit_events = [...(debug.circuit_events || []), { provider, event: 'closed' }];
+    Object.assign(circuit, { failures: [], open_until: 0, probe_at: 0 });
+    return;
+  }
+  circuit.failures = circuit.failures.filter(t => now - t < CIRCUIT_WINDOW_MS).concat(now);
+  if (probe || circuit.failures.length >= CIRCUIT_FAILURES) {
+    if (!circuit.open_until || probe) debug.circuit_events = [...(debug.circuit_events || []), { provider, event: 'opened' }];
+    circuit.open_until = now + CIRCUIT_COOLDOWN_MS;
+    circuit.probe_at = 0;
+  }
+}
+
+async function httpRequest(options) {
+  const { idempotent, ...request } = options;
+  const method = (request.method || 'GET').toUpperCase();
+  const provider = providerFor(new URL(request.url || request.uri));
+  const policy = PROVIDER_POLICIES[provider];
+  const stats = providerStats(provider);
+  request.timeout = Math.min(request.timeout || policy.timeout, policy.timeout);
+  const circuit = policy.breaker === false ? null : getCircuit(provider);
+  const probe = circuit ? enterCircuit(circuit, provider, request.timeout) : false;
+  const safe = idempotent ?? ['GET', 'HEAD', 'OPTIONS'].includes(method);
+  // v2.64: A cancelled hedge loser stops here - no retries, no circuit outcome
+  const signal = request.abortSignal;
+  // v2.66: Streamed bodies (onData, keep-alive transport only) can't be replayed once delivered
+  let streamed = false;
+  // v2.71: An error thrown by onData (bad SSE frame, error event) is the caller's
+  // verdict on a response that did arrive, not an outage
+  if (request.onData) {
+    const onData = request.onData;
+    request.onData = chunk => {
+      streamed = true;
+      try { onData(chunk); } catch (e) { e.fromStream = true; throw e; }
+    };
+  }
+  
+  for (let attempt = 0; ; attempt++) {
+    if (signal?.aborted) throw abortError(signal);
+    stats.calls++;
+    try {
+      const result = useKeepAliveTransport()
+        ? await keepAliveRequest(request)
+        : await this.helpers.httpRequest(request);
+      if (circuit) recordOutcome(circuit, provider, true, probe);
+      return result;
+    } catch (e) {
+      if (signal?.aborted) {
+        // A probe that was cancelled never reported back; let the next call probe
+        if (probe) circuit.probe_at = 0;
+        throw abortError(signal);
+      }
+      if (e.fromStream) {
+        stats.failures++;
+        if (probe) circuit.probe_at = 0;
+        throw e;
+      }
+      // A probe gets no retries: one failure re-opens the circuit
+      if (!probe && !streamed && attempt < policy.retries && isRetryable(e, safe)) {
+        stats.retries++;
+        await sleep(retryDelay(attempt, e));
+        continue;
+      }
+      stats.failures++;
+      // A client error (bad key, bad request) still means the provider answered
+      if (circuit) recordOutcome(circuit, provider, !isOutage(e), probe);
+      throw e;
+    }
+  }
+}
+
+function abortError(signal) {
+  const error = new Error(signal?.reason?.message || 'Request cancelled');
+  error.aborted = true;
+  return error;
+}
+
+// v2.64: Hedged fallback chains (images, serp, indexing). A chain normally runs
+// its providers one after another. With the chain listed in hedge_chains, a
+// provider that has not answered within its p90 latency (rolling, per site, in
+// workflow static data) gets the next provider started alongside it: the first
+// usable result wins and the other call is cancelled. Each hedge spends one unit
+// of hedge_budget for the execution; with the budget gone chains run in order.
+const HEDGE_SAMPLES = 50;
+const HEDGE_MIN_SAMPLES = 5;
+let hedgesSpent = 0;
+
+function latencyStats(provider) {
+  const staticData = workflowStaticData();
+  const latency = staticData.latency || (staticData.latency = {});
+  return latency[provider] || (latency[provider] = []);
+}
+
+function recordLatency(provider, ms) {
+  const samples = latencyStats(provider);
+  samples.push(Math.round(ms));
+  if (samples.length > HEDGE_SAMPLES) samples.splice(0, samples.length - HEDGE_SAMPLES);
+}
+
+// Value at fraction p of an ascending list, or null for an empty one
+function percentile(sorted, p) {
+  return sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))] : null;
+}
+
+// Until a provider has HEDGE_MIN_SAMPLES answers, hedge at a quarter of its timeout budget
+function hedgeDelay(provider) {
+  const samples = latencyStats(provider);
+  if (samples.length < HEDGE_MIN_SAMPLES) return PROVIDER_POLICIES[provider].timeout / 4;
+  return percentile([...samples].sort((a, b) => a - b), 0.9);
+}
+
+// steps: [{ provider, run(signal) -> result or null, onError(e) }] in fallback order.
+// Resolves with { result, step } from the first step that returns a result, or null.
+function runFallbackChain(chain, steps) {
+  const hedging = config.hedgeChains.includes(chain);
+  if (hedging) debug.hedging = debug.hedging || { budget: config.hedgeBudget, spent: 0 };
+  const stats = hedging ? (debug.hedging[chain] = debug.hedging[chain] || { hedged: 0, hedge_wins: 0 }) : null;
+  return new Promise(resolve => {
+    const running = new Map();
+    let next = 0;
+    let done = false;
+    
+    const finish = value => {
+      if (done) return;
+      done = true;
+      for (const entry of running.values()) {
+        clearTimeout(entry.timer);
+        entry.controller?.abort(new Error(`Cancelled: ${chain} answered by ${value.step.provider}`));
+      }
+      resolve(value);
+    };
+    
+    const launch = hedge => {
+      if (done) return;
+      if (next >= steps.length) {
+        if (running.size === 0) { done = true; resolve(null); }
+        return;
+      }
+      const index = next++;
+      const step = steps[index];
+      const controller = typeof AbortController === 'function' ? new AbortController() : null;
+      const entry = { controller, timer: null };
+      running.set(index, entry);
+      if (hedge) stats.hedged++;
+      if (hedging && next < steps.length) {
+        entry.timer = setTimeout(() => {
+          if (done || next !== index + 1 || hedgesSpent >= config.hedgeBudget) return;
+          debug.hedging.spent = ++hedgesSpent;
+          launch(true);
+        }, hedgeDelay(step.provider));
+      }
+      const started = Date.now();
+      Promise.resolve()
+        .then(() => step.run(controller?.signal))
+        .then(result => {
+          if (result) recordLatency(step.provider, Date.now() - started);
+          return result;
+        }, e => {
+          if (!done) step.onError(e);
+          return null;
+        })
+        .then(result => {
+          clearTimeout(entry.timer);
+          running.delete(index);
+          if (done) return;
+          if (result) {
+            if (hedge) stats.hedge_wins++;
+            finish({ result, step });
+          } else if (next === index + 1) {
+            // The newest step came up empty: fall through as before
+            launch(false);
+          } else if (running.size === 0) {
+            launch(false);
+          }
+        });
+    };
+    
+    launch(false);
+  });
+}
+
+// One pool per origin, opened by the first request and shared by concurrent ones
+function hostTransport(url) {
+  if (!httpPool.has(url.origin)) {
+    debug.http_connections = debug.http_connections || {};
+    const stats = debug.http_connections[url.host] = { protocol: null, connections: 0, requests: 0 };
+    httpPool.set(url.origin, openHostTransport(url, stats));
+  }
+  return httpPool.get(url.origin);
+}
+
+async function openHostTransport(url, stats) {
+  const { http, https, tls, http2 } = HTTP_MODULES;
+  stats.protocol = 'http/1.1';
+  if (url.protocol !== 'https:') return { agent: keepAliveAgent(http.Agent, stats, null), stats };
+  // One handshake offering h2 and http/1.1; the socket goes to whichever protocol the host picks
+  let socket = null;
+  try {
+    socket = await new Promise((resolve, reject) => {
+      const s = tls.connect({
+        host: url.hostname,
+        port: url.port || 443,
+        servername: url.hostname,
+        ALPNProtocols: http2 ? ['h2', 'http/1.1'] : ['http/1.1']
+      });
+      s.setTimeout(HTTP_CONNECT_TIMEOUT_MS, () => s.destroy(new Error(`connect timeout to ${url.host}`)));
+      s.once('secureConnect', () => { s.setTimeout(0); resolve(s); });
+      s.once('error', reject);
+    });
+    stats.connections++;
+  } catch (e) {
+    // Hosts that reject the ALPN offer get a plain keep-alive agent
+    stats.probe_error = e.message;
+  }
+  if (socket && socket.alpnProtocol === 'h2') {
+    stats.protocol = 'h2';
+    const session = http2.connect(url.origin, { createConnection: () => socket });
+    const drop = () => { if (httpPool.get(url.origin)?.session === session) httpPool.delete(url.origin); };
+    session.on('error', drop);
+    session.on('goaway', drop);
+    session.on('close', drop);
+    session.unref();
+    const transport = { session, stats };
+    httpPool.set(url.origin, Promise.resolve(transport));
+    return transport;
+  }
+  return { agent: keepAliveAgent(https.Agent, stats, socket), stats };
+}
+
+function keepAliveAgent(Agent, stats, spare) {
+  const agent = new Agent({ keepAlive: true, maxSockets: config.httpPoolSize, maxFreeSockets: config.httpPoolSize, scheduling: 'lifo' });
+  const createConnection = agent.createConnection;
+  agent.createConnection = function (options, callback) {
+    if (spare && !spare.destroyed) {
+      const socket = spare;
+      spare = null;
+      return socket;
+    }
+    spare = null;
+    stats.connections++;
+    return createConnection.call(this, options, callback);
+  };
+  return agent;
+}
+
+// Same contract as helpers.httpRequest for the options the engine uses (method,
+// url, headers, qs, body, timeout, encoding): parsed JSON or text back, and an
+// error carrying response.status/data for 4xx/5xx. v2.66: with onData, a 2xx
+// body is handed over chunk by chunk (uncompressed) and '' is returned.
+async function keepAliveRequest(options, redirects = 0) {
+  const url = new URL(options.url || options.uri);
+  for (const [key, value] of Object.entries(options.qs || {})) url.searchParams.append(key, String(value));
+  const method = (options.method || 'GET').toUpperCase();
+  const headers = {};
+  for (const [key, value] of Object.entries(options.headers || {})) {
+    if (value !== undefined && value !== null) headers[key.toLowerCase()] = String(value);
+  }
+  let body = options.body;
+  if (body !== undefined && body !== null && typeof body !== 'string' && !Buffer.isBuffer(body)) {
+    body = JSON.stringify(body);
+    headers['content-type'] = headers['content-type'] || 'application/json';
+  }
+  if (body === undefined || body === null || method === 'GET') body = null;
+  if (body !== null) headers['content-length'] = String(Buffer.byteLength(body));
+  headers.accept = headers.accept || 'application/json, text/plain, */*';
+  if (HTTP_MODULES.zlib && !options.onData) headers['accept-encoding'] = 'gzip, deflate, br';
+  
+  const transport = await hostTransport(url);
+  transport.stats.requests++;
+  const res = await (transport.session
+    ? sendHttp2(transport.session, url, method, headers, body, options.timeout, options.abortSignal, options.onData)
+    : sendHttp1(transport.agent, url, method, headers, body, options.timeout, options.abortSignal, options.onData));
+  
+  if (res.status >= 300 && res.status < 400 && res.headers.location && redirects < HTTP_MAX_REDIRECTS) {
+    const next = new URL(res.headers.location, url);
+    const keepBody = res.status === 307 || res.status === 308;
+    const nextHeaders = { ...options.headers };
+    // Credentials never follow a redirect to another host
+    if (next.host !== url.host) {
+      for (const key of Object.keys(nextHeaders)) if (key.toLowerCase() === 'authorization') delete nextHeaders[key];
+    }
+    return keepAliveRequest({
+      ...options,
+      url: next.href,
+      qs: undefined,
+      headers: nextHeaders,
+      method: keepBody ? method : (method === 'HEAD' ? 'HEAD' : 'GET'),
+      body: keepBody ? options.body : undefined
+    }, redirects + 1);
+  }
+  
+  let data = res.body;
+  if (options.encoding !== 'arraybuffer') {
+    data = data.toString('utf8');
+    try { data = JSON.parse(data); } catch {}
+  }
+  if (res.status >= 400) {
+    const error = new Error(`Request failed with status code ${res.status}`);
+    error.response = { status: res.status, headers: res.headers, data };
+    throw error;
+  }
+  return data;
+}
+
+function decodeBody(buffer, contentEncoding) {
+  const zlib = HTTP_MODULES.zlib;
+  const encoding = String(contentEncoding || '').toLowerCase();
+  if (!zlib || buffer.length === 0) return buffer;
+  if (encoding === 'gzip') return zlib.gunzipSync(buffer);
+  if (encoding === 'deflate') return zlib.inflateSync(buffer);
+  if (encoding === 'br') return zlib.brotliDecompressSync(buffer);
+  return buffer;
+}
+
+// v2.64: Aborting destroys the request; an h2 stream is reset without closing the session
+function onAbort(signal, cancel) {
+  if (!signal) return () => {};
+  if (signal.aborted) { cancel(); return () => {}; }
+  signal.addEventListener('abort', cancel, { once: true });
+  return () => signal.removeEventListener('abort', cancel);
+}
+
+function sendHttp1(agent, url, method, headers, body, timeout, signal, onData) {
+  const lib = url.protocol === 'https:' ? HTTP_MODULES.https : HTTP_MODULES.http;
+  return new Promise((resolve, reject) => {
+    const req = lib.request(url, { method, headers, agent }, res => {
+      const chunks = [];
+      const stream = onData && res.statusCode < 300;
+      res.on('data', chunk => {
+        if (!stream) return chunks.push(chunk);
+        try { onData(chunk); } catch (e) { req.destroy(e); }
+      });
+      res.on('error', reject);
+      res.on('end', () => {
+        clearTimeout(timer);
+        detach();
+        try {
+          resolve({ status: res.statusCode, headers: res.headers, body: decodeBody(Buffer.concat(chunks), res.headers['content-encoding']) });
+        } catch (e) { reject(e); }
+      });
+    });
+    const timer = timeout ? setTimeout(() => req.destroy(new Error(`timeout of ${timeout}ms exceeded`)), timeout) : null;
+    const detach = onAbort(signal, () => req.destroy(abortError(signal)));
+    req.on('error', e => { clearTimeout(timer); detach(); reject(e); });
+    req.end(body === null ? undefined : body);
+  });
+}
+
+function sendHttp2(session, url, method, headers, body, timeout, signal, onData) {
+  return new Promise((resolve, reject) => {
+    const h2Headers = { ':method': method, ':path': url.pathname + url.search };
+    for (const [key, value] of Object.entries(headers)) if (!HTTP2_FORBIDDEN_HEADERS.has(key)) h2Headers[key] = value;
+    const stream = session.request(h2Headers, { endStream: body === null });
+    const timer = timeout ? setTimeout(() => stream.destroy(new Error(`timeout of ${timeout}ms exceeded`)), timeout) : null;
+    const detach = onAbort(signal, () => stream.destroy(abortError(signal)));
+    let status = 0;
+    let responseHeaders = {};
+    const chunks = [];
+    stream.on('response', h => {
+      status = h[':status'];
+      responseHeaders = h;
+    });
+    stream.on('data', chunk => {
+      if (!onData || status >= 300) return chunks.push(chunk);
+      try { onData(chunk); } catch (e) { stream.destroy(e); }
+    });
+    stream.on('error', e => { clearTimeout(timer); detach(); reject(e); });
+    stream.on('end', () => {
+      clearTimeout(timer);
+      detach();
+      try {
+        resolve({ status, headers: responseHeaders, body: decodeBody(Buffer.concat(chunks), responseHeaders['content-encoding']) });
+      } catch (e) { reject(e); }
+    });
+    if (body !== null) stream.end(body);
+  });
+}
+
+// Called once at the end of the execution
+async function closeHttpPool() {
+  const transports = await Promise.allSettled([...httpPool.values()]);
+  httpPool.clear();
+  for (const t of transports) {
+    if (t.status !== 'fulfilled') continue;
+    if (t.value.session) t.value.session.close();
+    if (t.value.agent) t.value.agent.destroy();
+  }
+}
+
+function sleep(ms) {
+  return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+// v2.71: Shared by every cache, circuit and stats table. n8n only persists static
+// data for production executions: manual runs start empty and keep nothing
+function workflowStaticData() {
+  return typeof $getWorkflowStaticData === 'function' ? $getWorkflowStaticData('global') : {};
+}
+
+// v2.50: Run worker(item, index) with at most `limit` calls in flight; results keep input order
+async function mapWithConcurrency(items, limit, worker) {
+  const results = new Array(items.length);
+  let next = 0;
+  const runners = Array.from({ length: Math.max(1, Math.min(limit, items.length)) }, async () => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await worker(items[i], i);
+    }
+  });
+  await Promise.all(runners);
+  return results;
+}
@@ -0,0 +1,473 @@
+// v2.64: Providers run in image_provider_priority order through runFallbackChain,
+// so a slow provider can be hedged with the next one (hedge_chains = images)
+const IMAGE_PROVIDERS = {
+  openai: { policy: 'openai_images', key: () => config.openaiKey, generate: generateImageOpenAI },
+  fal: { policy: 'fal', key: () => config.falKey, generate: generateImageFal },
+  pexels: { policy: 'pexels', key: () => config.pexelsKey, generate: fetchImagePexels }
+};
+
+// v2.65: Rolling per-provider outcomes in workflow static data (imageStats), used
+// to reorder providers for every post. Providers that fail too often drop to the
+// back; healthy ones with enough samples trade places by median latency (1 s
+// buckets), then cost. image_provider_priority decides ties and keeps its slots
+// for providers without enough samples; image_provider_ordering = static turns
+// reordering off. A provider that fallbacks never reach would never get samples,
+// so one image per post (the last) tries the first under-sampled provider first.
+// v2.71: Only while the head provider is under-sampled or below
+// IMAGE_SETTLED_RATE, at most once per IMAGE_SAMPLE_INTERVAL_MS per provider
+// (imageSampledAt), and never a costlier provider while the head is healthy
+const IMAGE_STATS_SAMPLES = 30;
+const IMAGE_STATS_MAX_AGE_MS = 6 * 60 * 60 * 1000;
+const IMAGE_STATS_MIN_SAMPLES = 5;
+const IMAGE_HEALTHY_RATE = 0.7;
+const IMAGE_LATENCY_BUCKET_MS = 1000;
+const IMAGE_SETTLED_RATE = 0.9;
+const IMAGE_SAMPLE_INTERVAL_MS = 60 * 60 * 1000;
+
+// Approximate list price per generated image in USD
+function imageCostUsd(provider) {
+  if (provider === 'openai') return config.openaiImageModel === 'dall-e-3' ? 0.04 : 0.018;
+  if (provider === 'fal') return { 'fal-ai/flux/schnell': 0.002, 'fal-ai/flux/dev': 0.015 }[config.falModel] ?? 0.01;
+  return 0;
+}
+
+function imageStatsSamples(provider) {
+  const staticData = workflowStaticData();
+  const stats = staticData.imageStats || (staticData.imageStats = {});
+  const now = Date.now();
+  const samples = (stats[provider] || []).filter(sample => now - sample.at < IMAGE_STATS_MAX_AGE_MS);
+  return (stats[provider] = samples);
+}
+
+function recordImageOutcome(provider, ok, ms) {
+  const samples = imageStatsSamples(provider);
+  samples.push({ ok, ms: Math.round(ms), at: Date.now() });
+  if (samples.length > IMAGE_STATS_SAMPLES) samples.splice(0, samples.length - IMAGE_STATS_SAMPLES);
+}
+
+function imageProviderStats(provider) {
+  const samples = imageStatsSamples(provider);
+  const latencies = samples.filter(sample => sample.ok).map(sample => sample.ms).sort((a, b) => a - b);
+  const successRate = samples.length ? latencies.length / samples.length : null;
+  return {
+    samples: samples.length,
+    success_rate: successRate === null ? null : Math.round(successRate * 100) / 100,
+    p50_ms: percentile(latencies, 0.5),
+    p95_ms: percentile(latencies, 0.95),
+    // Failed calls are not billed, so the price per delivered image is the list price
+    cost_per_image: imageCostUsd(provider)
+  };
+}
+
+// Returns { order, explore }: explore is the order for the sampling image, or null
+function orderImageProviders() {
+  const allowed = config.imageProvider.filter(provider => IMAGE_PROVIDERS[provider] && IMAGE_PROVIDERS[provider].key());
+  const stats = Object.fromEntries(allowed.map(provider => [provider, imageProviderStats(provider)]));
+  debug.image_provider_stats = stats;
+  if (config.imageProviderOrdering === 'static') {
+    debug.image_provider_order = allowed;
+    return { order: allowed, explore: null };
+  }
+  
+  const known = provider => stats[provider].samples >= IMAGE_STATS_MIN_SAMPLES;
+  // A provider whose circuit is open (v2.63) would only be skipped at its slot
+  const healthy = provider => getCircuit(IMAGE_PROVIDERS[provider].policy).open_until <= Date.now() &&
+    (!known(provider) || stats[provider].success_rate >= IMAGE_HEALTHY_RATE);
+  const usable = allowed.filter(healthy);
+  // Providers with enough samples swap among their own slots; the rest stay put
+  const ranked = usable.filter(known).sort((a, b) =>
+    Math.floor(stats[a].p50_ms / IMAGE_LATENCY_BUCKET_MS) - Math.floor(stats[b].p50_ms / IMAGE_LATENCY_BUCKET_MS) ||
+    stats[a].cost_per_image - stats[b].cost_per_image ||
+    allowed.indexOf(a) - allowed.indexOf(b));
+  const order = usable.map(provider => known(provider) ? ranked.shift() : provider)
+    .concat(allowed.filter(provider => !healthy(provider)));
+  debug.image_provider_order = order;
+  const head = order[0];
+  if (!head || (known(head) && healthy(head) && stats[head].success_rate >= IMAGE_SETTLED_RATE)) return { order, explore: null };
+  const staticData = workflowStaticData();
+  const sampledAt = staticData.imageSampledAt || (staticData.imageSampledAt = {});
+  const sampling = order.slice(1).find(provider => !known(provider) &&
+    !(Date.now() - (sampledAt[provider] || 0) < IMAGE_SAMPLE_INTERVAL_MS) &&
+    (!healthy(head) || stats[provider].cost_per_image <= stats[head].cost_per_image));
+  if (!sampling) return { order, explore: null };
+  sampledAt[sampling] = Date.now();
+  debug.image_provider_sampling = sampling;
+  return { order, explore: [sampling, ...order.filter(provider => provider !== sampling)] };
+}
+
+async function generateImage(prompt, providerOrder) {
+  const steps = providerOrder.map(provider => ({
+    provider: IMAGE_PROVIDERS[provider].policy,
+    run: async signal => {
+      const started = Date.now();
+      try {
+        const img = await IMAGE_PROVIDERS[provider].generate.call(this, prompt, signal);
+        recordImageOutcome(provider, Boolean(img), Date.now() - started);
+        return img;
+      } catch (e) {
+        // Cancelled hedges and open circuits say nothing about the provider's health
+        if (!e.aborted && !e.circuitOpen) recordImageOutcome(provider, false, Date.now() - started);
+        throw e;
+      }
+    },
+    onError: e => debug.image_errors.push({ provider, prompt: prompt.substring(0, 50), error: e.message }),
+    name: provider
+  }));
+  const won = await runFallbackChain('images', steps);
+  if (!won) return null;
+  const provider = won.step.name;
+  debug.images_by_provider[provider] = (debug.images_by_provider[provider] || 0) + 1;
+  return { ...won.result, provider };
+}
+
+// v2.23: OpenAI - use 512x512 to avoid memory issues on n8n Cloud
+async function generateImageOpenAI(prompt, signal) {
+  // DALL-E 2 supports: 256x256, 512x512, 1024x1024
+  // DALL-E 3 only supports: 1024x1024, 1024x1792, 1792x1024
+  const isDalle3 = config.openaiImageModel === 'dall-e-3';
+  const imageSize = isDalle3 ? '1024x1024' : '512x512'; // Smaller for DALL-E 2
+  
+  const resp = await openaiRequest.call(this, 'image', 'images/generations', {
+    body: {
+      model: config.openaiImageModel,
+      prompt: `Professional blog image: ${prompt}`,
+      n: 1,
+      size: imageSize,
+      response_format: 'b64_json'
+    },
+    timeout: 60000,
+    abortSignal: signal
+  });
+  const b64 = resp?.data?.[0]?.b64_json;
+  if (b64) return { base64: b64, mimeType: 'image/png', provider: 'openai' };
+  return null;
+}
+
+// fal.ai - model configurable per-site: fal-ai/flux/schnell, fal-ai/flux/dev, fal-ai/fast-sdxl
+async function generateImageFal(prompt, signal) {
+  const resp = await httpRequest.call(this, {
+    method: 'POST',
+    url: `https://fal.run/${config.falModel}`,
+    headers: { 
+      'Authorization': `Key ${config.falKey}`, 
+      'Content-Type': 'application/json' 
+    },
+    body: {
+      prompt: `Professional blog image: ${prompt}`,
+      image_size: 'landscape_16_9',
+      num_images: 1
+    },
+    timeout: 60000,
+    abortSignal: signal
+  });
+  const imageUrl = resp?.images?.[0]?.url;
+  if (imageUrl) return { url: imageUrl };
+  return null;
+}
+
+async function fetchImagePexels(query, signal) {
+  const resp = await httpRequest.call(this, {
+    method: 'GET',
+    url: `https://api.pexels.com/v1/search?query=${encodeURIComponent(query)}&per_page=5`,
+    headers: { 'Authorization': config.pexelsKey },
+    abortSignal: signal
+  });
+  const photos = resp?.photos || [];
+  if (photos.length > 0) {
+    const photo = photos[Math.floor(Math.random() * photos.length)];
+    return { url: photo.src?.large || photo.src?.original };
+  }
+  return null;
+}
+
+// v2.54: Resumable chunked upload (plugin 1.6+). Chunks are raw binary; if something
+// in front of WordPress rejects binary bodies they are re-sent as base64 text.
+// Returns null when the plugin has no chunked route.
+async function uploadImageChunked(bytes, fields, authHeaders) {
+  const baseUrl = `${config.baseUrl}/wp-json/n8n/v1/upload-chunked`;
+  let init;
+  try {
+    init = await httpRequest.call(this, {
+      method: 'POST',
+      url: baseUrl,
+      headers: { ...authHeaders, 'Content-Type': 'application/json' },
+      body: { ...fields, size: bytes.length, defer_thumbnails: config.deferThumbnails },
+      timeout: 15000
+    });
+  } catch (e) {
+    const errMsg = e.message || '';
+    if (errMsg.includes('rest_no_route') || errMsg.includes('404')) return null;
+    throw e;
+  }
+  
+  const chunkSize = Math.max(64 * 1024, Math.min(config.uploadChunkBytes, init.max_chunk_size || config.uploadChunkBytes));
+  const uploadUrl = `${baseUrl}/${init.upload_id}`;
+  let offset = 0;
+  let failures = 0;
+  let binary = true;
+  let chunks = 0;
+  while (offset < bytes.length) {
+    const chunk = bytes.subarray(offset, offset + chunkSize);
+    try {
+      let resp = await httpRequest.call(this, {
+        method: 'POST',
+        url: `${uploadUrl}/chunk`,
+        qs: binary ? { offset } : { offset, encoding: 'base64' },
+        headers: { ...authHeaders, 'Content-Type': binary ? 'application/octet-stream' : 'text/plain' },
+        body: binary ? chunk : chunk.toString('base64'),
+        timeout: 30000
+      });
+      if (typeof resp === 'string') resp = JSON.parse(resp);
+      offset = resp?.received ?? offset + chunk.length;
+      failures = 0;
+      chunks++;
+    } catch (e) {
+      const status = e.response?.status;
+      if (binary && (status === 403 || status === 406 || status === 415)) {
+        binary = false;
+        debug.image_errors.push({ step: 'CHUNKED_BINARY_BLOCKED', status, hint: 'Resending chunks as base64' });
+        continue;
+      }
+      if (++failures > 3) throw e;
+      debug.image_errors.push({ step: 'CHUNK_RETRY', offset, attempt: failures, error: (e.message || '').substring(0, 100) });
+      await sleep(500 * failures);
+      // The chunk may have landed before the error - resume from what the plugin has
+      try {
+        let state = await httpRequest.call(this, { method: 'GET', url: uploadUrl, headers: authHeaders, timeout: 15000 });
+        if (typeof state === 'string') state = JSON.parse(state);
+        if (typeof state?.received === 'number') offset = state.received;
+      } catch (statusErr) {
+        // Keep the current offset; the chunk is simply sent again
+      }
+    }
+  }
+  
+  let resp = await httpRequest.call(this, {
+    method: 'POST',
+    url: `${uploadUrl}/finalize`,
+    headers: authHeaders,
+    timeout: 45000
+  });
+  if (typeof resp === 'string') resp = JSON.parse(resp);
+  debug.image_errors.push({ step: 'CHUNKED_UPLOAD', chunks, bytes: bytes.length, binary });
+  return resp;
+}
+
+async function uploadImageToWp(imageData, filename, altText) {
+  const authHeaders = await getWpAuthHeaders.call(this);
+  
+  // v2.27: Use custom n8n-image-upload plugin endpoints
+  // These accept JSON (not binary) so Cloudflare won't block them
+  
+  const ext = (imageData.mimeType || 'image/png').includes('png') ? 'png' : 
+              (imageData.mimeType || '').includes('webp') ? 'webp' : 'jpg';
+  const fname = `${filename}.${ext}`;
+  
+  // For base64 images (OpenAI) - use /n8n/v1/upload-image
+  if (imageData.base64) {
+    const magicBytes = Buffer.from(imageData.base64, 'base64').slice(0, 4).toString('hex');
+    debug.image_errors.push({ 
+      step: 'TRYING_N8N_PLUGIN_BASE64', 
+      filename: fname,
+      magic_bytes: magicBytes,
+      base64_length: imageData.base64.length
+    });
+    
+    const uploadFields = {
+      filename: fname,
+      mime_type: imageData.mimeType || 'image/png',
+      alt_text: altText || filename,
+      title: altText || filename
+    };
+    try {
+      let uploadResp = null;
+      // v2.54: Large images go up in resumable chunks instead of one all-or-nothing request
+      const bytes = Buffer.from(imageData.base64, 'base64');
+      if (config.uploadChunkBytes > 0 && bytes.length > config.uploadChunkBytes) {
+        try {
+          uploadResp = await uploadImageChunked.call(this, bytes, uploadFields, authHeaders);
+          if (!uploadResp) debug.image_errors.push({ step: 'PLUGIN_NO_CHUNKED', hint: 'Update n8n Autoblogger Helper plugin to 1.6+' });
+        } catch (e) {
+          debug.image_errors.push({ step: 'CHUNKED_UPLOAD_FAILED', error: (e.message || '').substring(0, 200) });
+        }
+      }
+      // v2.53: Send the base64 as a raw text/plain body (fields in the query string) so
+      // plugin 1.5+ can stream-decode it; older plugins reject it with no_base64
+      if (!uploadResp) {
+        try {
+          uploadResp = await httpRequest.call(this, {
+            method: 'POST',
+            url: `${config.baseUrl}/wp-json/n8n/v1/upload-image`,
+            qs: { ...uploadFields, defer_thumbnails: config.deferThumbnails ? 1 : 0 },
+            headers: {
+              ...authHeaders,
+              'Content-Type': 'text/plain'
+            },
+            body: imageData.base64,
+            timeout: 45000
+          });
+          if (typeof uploadResp === 'string') uploadResp = JSON.parse(uploadResp);
+        } catch (e) {
+          if (e.response?.data?.code !== 'no_base64' && !(e.message || '').includes('no_base64')) throw e;
+          debug.image_errors.push({ step: 'PLUGIN_NO_STREAMING', hint: 'Update n8n Autoblogger Helper plugin to 1.5+' });
+          uploadResp = await httpRequest.call(this, {
+            method: 'POST',
+            url: `${config.baseUrl}/wp-json/n8n/v1/upload-image`,
+            headers: {
+              ...authHeaders,
+              'Content-Type': 'application/json'
+            },
+            body: {
+              base64: imageData.base64,
+              ...uploadFields,
+              // v2.51: Plugin 1.3+ returns before generating sub-sizes (older plugins ignore this)
+              defer_thumbnails: config.deferThumbnails
+            },
+            timeout: 45000
+          });
+        }
+      }
+      
+      if (uploadResp?.id || uploadResp?.success) {
+        debug.image_errors.push({ step: 'N8N_PLUGIN_SUCCESS', id: uploadResp.id, url: uploadResp.url, thumbnails: uploadResp.thumbnails });
+        return { id: uploadResp.id, url: uploadResp.url || uploadResp.source_url };
+      }
+      debug.image_errors.push({ step: 'N8N_PLUGIN_NO_ID', response: JSON.stringify(uploadResp || {}).substring(0, 300) });
+    } catch (e) {
+      const errMsg = e.message || '';
+      debug.image_errors.push({ step: 'N8N_PLUGIN_FAILED', error: errMsg.substring(0, 200) });
+      
+      // If plugin not installed, fall back to standard upload
+      if (errMsg.includes('rest_no_route') || errMsg.includes('404')) {
+        debug.image_errors.push({ step: 'PLUGIN_NOT_INSTALLED', hint: 'Install n8n-image-upload.php plugin' });
+      }
+    }
+  }
+  
+  // For URL images (fal, pexels) - use /n8n/v1/sideload-image
+  if (imageData.url) {
+    debug.image_errors.push({ step: 'TRYING_N8N_PLUGIN_SIDELOAD', url: imageData.url?.substring(0, 80) });
+    
+    try {
+      const sideloadResp = await httpRequest.call(this, {
+        method: 'POST',
+        url: `${config.baseUrl}/wp-json/n8n/v1/sideload-image`,
+        headers: {
+          ...authHeaders,
+          'Content-Type': 'application/json'
+        },
+        body: {
+          url: imageData.url,
+          filename: fname,
+          alt_text: altText || filename,
+          title: altText || filename,
+          // v2.51: Plugin 1.3+ returns before generating sub-sizes (older plugins ignore this)
+          defer_thumbnails: config.deferThumbnails
+        },
+        timeout: 45000
+      });
+      
+      if (sideloadResp?.id || sideloadResp?.success) {
+        debug.image_errors.push({ step: 'SIDELOAD_SUCCESS', id: sideloadResp.id, url: sideloadResp.url, thumbnails: sideloadResp.thumbnails });
+        return { id: sideloadResp.id, url: sideloadResp.url || sideloadResp.source_url };
+      }
+      debug.image_errors.push({ step: 'SIDELOAD_NO_ID', response: JSON.stringify(sideloadResp || {}).substring(0, 200) });
+    } catch (e) {
+      const errMsg = e.message || '';
+      debug.image_errors.push({ step: 'SIDELOAD_FAILED', error: errMsg.substring(0, 200) });
+      
+      // Plugin not installed - use external URL as fallback
+      if (errMsg.includes('rest_no_route') || errMsg.includes('404')) {
+        debug.image_errors.push({ step: 'PLUGIN_NOT_INSTALLED_SIDELOAD' });
+      }
+    }
+    
+    // Fallback: Use external URL directly
+    debug.image_errors.push({ step: 'USING_EXTERNAL_URL', url: imageData.url?.substring(0, 80) });
+    return { id: null, url: imageData.url, external: true };
+  }
+  
+  return null;
+}
+
+async function processImagePlaceholders(media, titleSlug) {
+  let featuredImageId = null;
+  const domain = config.baseUrl.replace(/https?:\/\//, '').replace(/\/$/, '');
+  
+  // v2.41: ALWAYS distribute images by H2 sections (ignore AI placement)
+  // This ensures even distribution and avoids clustering
+  // v2.58: Sections come from the shared section map; AI placeholders were
+  // already removed there and only their alt text is reused
+  const usableH2s = media.sections;
+  
+  // v2.48: Always generate requested number of images (even if AI omitted placeholders)
+  const imagesToPlace = config.imagesCount;
+  const jobs = [];
+  if (imagesToPlace > 0 && usableH2s.length > 0) {
+    // Calculate positions - spread evenly, skip first H2 (intro)
+    const startSection = Math.min(1, usableH2s.length - 1);
+    const availableSections = usableH2s.length - startSection;
+    const step = Math.max(1, Math.floor(availableSections / imagesToPlace));
+    
+    for (let i = 0; i < imagesToPlace; i++) {
+      const sectionIdx = Math.min(startSection + i * step, usableH2s.length - 1);
+      const block = claimSection(media, sectionIdx, 'image');
+      if (block) {
+        jobs.push({
+          block,
+          alt: media.imageAlts[i] || `${usableH2s[sectionIdx].title} - ${config.topic}`
+        });
+      }
+    }
+  }
+  
+  // v2.50: Generate + upload as a pipelined pool limited by image_concurrency,
+  // so one image is uploading while the next is still being generated
+  debug.image_concurrency = config.imageConcurrency;
+  const providers = jobs.length > 0 ? orderImageProviders() : null;
+  const uploads = await mapWithConcurrency(jobs, config.imageConcurrency, async (job, i) => {
+    // The featured (first) image never samples; with one image nothing does
+    const sampling = providers.explore && jobs.length > 1 && i === jobs.length - 1;
+    const img = await generateImage.call(this, job.alt, sampling ? providers.explore : providers.order);
+    if (!img) return null;
+    return uploadImageToWp.call(this, img, `${titleSlug}-${i + 1}`, job.alt);
+  });
+  
+  // Fill the claimed slots in section order (the first image stays featured)
+  // v2.71: The caller counts the uploads, so a discarded early run doesn't inflate them
+  const attachmentIds = [];
+  for (let i = 0; i < jobs.length; i++) {
+    const altText = jobs[i].alt;
+    const uploaded = uploads[i];
+    if (!uploaded) continue;
+    if (uploaded.id) attachmentIds.push(uploaded.id);
+    // v2.13: Handle both WP-uploaded and external URLs
+    const imgUrl = uploaded.url;
+    const imgHtml = uploaded.external 
+      ? `<figure class="wp-block-image"><img src="${imgUrl}" alt="${altText}" loading="lazy" /></figure>`
+      : `<figure class="wp-block-image"><img src="${imgUrl}" alt="${altText} | ${domain}" loading="lazy" /></figure>`;
+    jobs[i].block.html = '\n\n' + imgHtml + '\n\n';
+    // Only set featured image if actually uploaded to WP
+    if (i === 0 && uploaded.id) featuredImageId = uploaded.id;
+    if (uploaded.external) {
+      debug.image_errors.push({ step: 'USING_EXTERNAL_URL', url: imgUrl.substring(0, 80) });
+    }
+  }
+  return { featuredImageId, uploaded: uploads.filter(Boolean).length, attachmentIds };
+}
+
+// v2.71: Images placed on an early section map that the kept article didn't match
+// are removed from the media library once their uploads have settled
+async function discardImageUploads(pending) {
+  const result = await pending.catch(() => null);
+  const ids = result?.attachmentIds || [];
+  if (ids.length === 0) return;
+  const authHeaders = await getWpAuthHeaders.call(this);
+  await Promise.all(ids.map(id => httpRequest.call(this, {
+    method: 'DELETE',
+    url: `${config.baseUrl}/wp-json/wp/v2/media/${id}?force=true`,
+    headers: authHeaders,
+    idempotent: true
+  }).catch(e => debug.image_errors.push({ step: 'DISCARD_UPLOAD', id, error: e.message }))));
+  debug.images_discarded += ids.length;
+}
@@ -0,0 +1,43 @@
+function parseInput(json) {
+  let site = json.site_config || json.site || json.siteConfig || {};
+  let topicRow = json.topicRow || json.topic_row || json.row || {};
+  if (!site.base_url && json.base_url) site = json;
+  let topic = topicRow.topic || topicRow.keyword || json.topic || json.keyword || '';
+  // Key wiring (n8n $vars or Site_Registry columns) is generated per variant by pipeline/build.py
+  let globals = resolveGlobals(json, site);
+  return { site, topicRow, globals, topic };
+}
+
+const input = $input.first().json;
+const { site, topicRow, globals, topic } = parseInput(input);
+
+const executionLog = [];
+const debug = {
+  serp_count: 0,
+  serp_provider: 'none',
+  youtube_candidates_count: 0,
+  images_requested: 0,
+  images_uploaded: 0,
+  images_discarded: 0,
+  images_by_provider: {},
+  internal_links_requested: 0,
+  internal_links_inserted: 0,
+  external_links_requested: 0,
+  external_links_inserted: 0,
+  youtube_embeds_requested: 0,
+  youtube_embeds_inserted: 0,
+  categories_requested: [],
+  categories_found: [],
+  notifications: { speedyindex: false, telegram: false, email: false },
+  seo_meta_updated: false,
+  seo_plugins: {},
+  image_errors: [],
+  wp_errors: [],
+  // v2.70: Tokens and latency of every OpenAI call
+  openai_usage: { calls: [], prompt_tokens: 0, cached_tokens: 0, completion_tokens: 0, cache_hit_rate: 0 }
+};
+let currentStep = '';
+
+if (!topic) return [{ json: { ok: false, error: 'Missing topic', debug: { input } } }];
+if (!site.base_url) return [{ json: { ok: false, error: 'Missing site base_url', debug: { site, input } } }];
+if (!globals.OPENAI_API_KEY) return [{ json: { ok: false, error: missingKeyError('OPENAI_API_KEY'), site, topicRow } }];
@@ -0,0 +1,371 @@
+// v2.55: Per-site index of published post titles kept in workflow static data
+// ({ posts: { id: [title, link] }, cursor, built_at }). Each run does one delta
+// sync with modified_after; the first build is paged and resumes on the next run.
+// A weekly full rebuild drops posts that were unpublished or deleted.
+// v2.71: Bounded to the newest POST_INDEX_MAX_POSTS posts (by id); semantic mode keeps
+// vectors (and excerpts waiting to be embedded) for the newest POST_VECTORS_MAX of them
+const POST_INDEX_PAGES_PER_RUN = 10;
+const POST_INDEX_REBUILD_MS = 7 * 24 * 60 * 60 * 1000;
+const POST_INDEX_MAX_POSTS = 1500;
+const POST_VECTORS_MAX = 500;
+
+function decodeEntities(text) {
+  return String(text || '')
+    .replace(/&#(\d+);/g, (m, code) => String.fromCharCode(parseInt(code)))
+    .replace(/&#x([0-9a-f]+);/gi, (m, code) => String.fromCharCode(parseInt(code, 16)))
+    .replace(/&amp;/g, '&').replace(/&quot;/g, '"').replace(/&lt;/g, '<').replace(/&gt;/g, '>').replace(/&nbsp;/g, ' ');
+}
+
+function getPostIndex() {
+  const staticData = workflowStaticData();
+  const indexes = staticData.postIndex || (staticData.postIndex = {});
+  let index = indexes[config.baseUrl];
+  if (!index || Date.now() - Date.parse(index.built_at) > POST_INDEX_REBUILD_MS) {
+    // v2.56: Embeddings survive the rebuild; they are keyed by the title they were computed from
+    index = indexes[config.baseUrl] = {
+      posts: {}, cursor: null, built_at: new Date().toISOString(),
+      vectors: index?.vectors || {}, embedding_model: index?.embedding_model || null, pending: {}
+    };
+  }
+  index.vectors = index.vectors || {};
+  index.pending = index.pending || {};
+  return index;
+}
+
+async function syncPostIndex() {
+  const authHeaders = await getWpAuthHeaders.call(this);
+  const index = getPostIndex();
+  const stats = { posts: 0, fetched: 0, requests: 0, complete: false };
+  const semantic = config.internalLinkMode === 'semantic';
+  for (let page = 0; page < POST_INDEX_PAGES_PER_RUN; page++) {
+    // `modified` (site-local, like the post_modified column modified_after filters on)
+    // is the cursor; step back a second so posts sharing the boundary second aren't skipped
+    let url = `${config.baseUrl}/wp-json/wp/v2/posts?status=publish&per_page=100&orderby=modified&order=asc&_fields=id,title,link,modified${semantic ? ',excerpt' : ''}`;
+    if (index.cursor) {
+      const after = new Date(Date.parse(index.cursor + 'Z') - 1000).toISOString().substring(0, 19);
+      url += `&modified_after=${encodeURIComponent(after)}`;
+    }
+    let posts;
+    try {
+      posts = await httpRequest.call(this, { method: 'GET', url, headers: authHeaders });
+      stats.requests++;
+    } catch (e) {
+      debug.wp_errors.push({ step: 'POST_INDEX_SYNC', error: e.message });
+      break;
+    }
+    if (!Array.isArray(posts)) break;
+    for (const post of posts) {
+      const title = decodeEntities(post.title?.rendered);
+      index.posts[post.id] = [title, post.link];
+      // v2.56: Hold title + excerpt until the post is (re-)embedded
+      if (semantic && index.vectors[post.id]?.[0] !== title) {
+        const excerpt = decodeEntities((post.excerpt?.rendered || '').replace(/<[^>]+>/g, ' ')).replace(/\s+/g, ' ').trim();
+        index.pending[post.id] = `${title}. ${excerpt}`.substring(0, 600);
+      }
+    }
+    stats.fetched += posts.length;
+    const lastModified = posts.length ? posts[posts.length - 1].modified : null;
+    // A full page whose last post shares the cursor second can't advance - stop rather than loop
+    if (posts.length < 100 || !lastModified || lastModified === index.cursor) {
+      if (lastModified) index.cursor = lastModified;
+      stats.complete = true;
+      break;
+    }
+    index.cursor = lastModified;
+  }
+  trimPostIndex(index, stats.complete);
+  stats.posts = Object.keys(index.posts).length;
+  debug.post_index = stats;
+  return index;
+}
+
+// Integer keys enumerate in ascending order, so the oldest posts come first. Vectors
+// of posts a paged rebuild hasn't reached yet are kept until the sync is complete.
+function trimPostIndex(index, complete) {
+  const ids = Object.keys(index.posts);
+  for (const id of ids.slice(0, Math.max(0, ids.length - POST_INDEX_MAX_POSTS))) delete index.posts[id];
+  const embeddable = new Set(vectorWindow(index));
+  if (complete) for (const id of Object.keys(index.vectors)) if (!embeddable.has(id)) delete index.vectors[id];
+  for (const id of Object.keys(index.pending)) if (!embeddable.has(id)) delete index.pending[id];
+}
+
+function vectorWindow(index) {
+  return Object.keys(index.posts).slice(-POST_VECTORS_MAX);
+}
+
+const LINK_STOP_WORDS = new Set(['the', 'and', 'for', 'with', 'your', 'you', 'how', 'what', 'why', 'are', 'from', 'this', 'that', 'into', 'best', 'guide', 'tips']);
+
+function titleWords(text) {
+  return text.toLowerCase().split(/[^a-z0-9]+/).filter(w => w.length >= 3 && !LINK_STOP_WORDS.has(w));
+}
+
+// Best title match for a phrase: share of the phrase's words found in the title
+// (at least half), ties go to the newer post
+function matchPostIndex(index, phrase, usedLinks) {
+  const words = titleWords(phrase);
+  if (words.length === 0) return null;
+  let best = null;
+  let bestScore = 0;
+  let bestId = 0;
+  for (const [id, [title, link]] of Object.entries(index.posts)) {
+    if (usedLinks.has(link)) continue;
+    const titleSet = new Set(titleWords(title));
+    const score = words.filter(w => titleSet.has(w)).length / words.length;
+    if (score > bestScore || (score === bestScore && score > 0 && +id > bestId)) {
+      best = { id: +id, title, link };
+      bestScore = score;
+      bestId = +id;
+    }
+  }
+  return bestScore >= 0.5 ? best : null;
+}
+
+// v2.56: Semantic ranking. Post vectors are L2-normalised, stored as int8 (base64) next
+// to the title they were computed from, and built at most EMBED_POSTS_PER_RUN at a time
+// in the same request that embeds the anchor phrases - one embeddings call per post.
+const EMBEDDING_DIMENSIONS = 256;
+const EMBED_POSTS_PER_RUN = 500;
+const SEMANTIC_TOP_K = 3;
+const SEMANTIC_MIN_SIMILARITY = 0.3;
+
+function normalizeVector(vec) {
+  let norm = 0;
+  for (const v of vec) norm += v * v;
+  norm = Math.sqrt(norm) || 1;
+  return vec.map(v => v / norm);
+}
+
+function quantizeVector(vec) {
+  const unit = normalizeVector(vec);
+  const bytes = new Int8Array(unit.length);
+  for (let i = 0; i < unit.length; i++) bytes[i] = Math.max(-127, Math.min(127, Math.round(unit[i] * 127)));
+  return Buffer.from(bytes.buffer).toString('base64');
+}
+
+async function embedTexts(texts) {
+  const resp = await openaiRequest.call(this, 'embeddings', 'embeddings', {
+    body: { model: config.embeddingModel, input: texts, dimensions: EMBEDDING_DIMENSIONS },
+    timeout: 30000,
+    // v2.63: Same input, same vectors - safe to retry
+    idempotent: true
+  });
+  return [...(resp?.data || [])].sort((a, b) => a.index - b.index).map(d => d.embedding);
+}
+
+// Returns Map(phrase -> top-k [{ id, link, score }]) or null when embeddings are unavailable
+async function rankPostsSemantic(index, phrases) {
+  if (index.embedding_model !== config.embeddingModel) {
+    index.vectors = {};
+    index.embedding_model = config.embeddingModel;
+  }
+  // v2.71: Only the newest POST_VECTORS_MAX posts are embedded and ranked
+  const embeddable = vectorWindow(index);
+  const stale = embeddable
+    .filter(id => index.vectors[id]?.[0] !== index.posts[id][0])
+    .slice(-EMBED_POSTS_PER_RUN);
+  const postTexts = stale.map(id => index.pending[id] || index.posts[id][0]);
+  
+  let embeddings;
+  try {
+    embeddings = await embedTexts.call(this, [...phrases, ...postTexts]);
+    if (embeddings.length !== phrases.length + postTexts.length) throw new Error(`expected ${phrases.length + postTexts.length} embeddings, got ${embeddings.length}`);
+  } catch (e) {
+    debug.wp_errors.push({ step: 'LINK_EMBEDDINGS', error: e.message });
+    return null;
+  }
+  stale.forEach((id, i) => {
+    index.vectors[id] = [index.posts[id][0], quantizeVector(embeddings[phrases.length + i])];
+    delete index.pending[id];
+  });
+  
+  // One flat int8 matrix (rows = posts) scored against every phrase
+  const ids = embeddable.filter(id => index.vectors[id]?.[0] === index.posts[id][0]);
+  const dims = EMBEDDING_DIMENSIONS;
+  const matrix = new Int8Array(ids.length * dims);
+  const norms = new Float32Array(ids.length);
+  ids.forEach((id, row) => {
+    const bytes = Buffer.from(index.vectors[id][1], 'base64');
+    const vec = new Int8Array(bytes.buffer, bytes.byteOffset, Math.min(bytes.length, dims));
+    matrix.set(vec, row * dims);
+    let norm = 0;
+    for (const v of vec) norm += v * v;
+    norms[row] = Math.sqrt(norm) || 1;
+  });
+  
+  const ranked = new Map();
+  phrases.forEach((phrase, p) => {
+    const query = Float32Array.from(normalizeVector(embeddings[p]));
+    const top = [];
+    for (let row = 0; row < ids.length; row++) {
+      let dot = 0;
+      const offset = row * dims;
+      for (let d = 0; d < dims; d++) dot += query[d] * matrix[offset + d];
+      const score = dot / norms[row];
+      if (score < SEMANTIC_MIN_SIMILARITY) continue;
+      if (top.length < SEMANTIC_TOP_K || score > top[top.length - 1].score) {
+        top.push({ id: +ids[row], link: index.posts[ids[row]][1], score });
+        top.sort((a, b) => b.score - a.score);
+        if (top.length > SEMANTIC_TOP_K) top.pop();
+      }
+    }
+    ranked.set(phrase, top);
+  });
+  debug.internal_link_ranking = { mode: 'semantic', candidates: ids.length, embedded_posts: stale.length, pending_posts: embeddable.length - ids.length };
+  return ranked;
+}
+
+// v2.58: Links are placed on the section map's token list; main renders the post once
+async function injectInternalLinks(doc, anchorPhrases) {
+  if (config.internalLinksCount === 0 || !anchorPhrases?.length) return;
+  // v2.55: One delta sync, then every phrase is matched locally
+  const index = await syncPostIndex.call(this);
+  // v2.56: Semantic mode falls back to keyword matching if the embeddings call fails
+  const semantic = config.internalLinkMode === 'semantic' && config.openaiKey
+    ? await rankPostsSemantic.call(this, index, anchorPhrases)
+    : null;
+  // v2.57: One tokenizer pass; phrases are matched only in <p>/<li>/<td> text outside headings and links
+  const found = findPhraseOccurrences(doc, anchorPhrases);
+  let inserted = 0;
+  const usedLinks = new Set();
+  const shuffled = [...anchorPhrases].sort(() => Math.random() - 0.5);
+  
+  for (const phrase of shuffled) {
+    if (inserted >= config.internalLinksCount) break;
+    const entry = phraseEntry(found, phrase);
+    if (entry.inLink || entry.occurrences.length === 0) continue;
+    const post = semantic
+      ? (semantic.get(phrase) || []).find(candidate => !usedLinks.has(candidate.link))
+      : matchPostIndex(index, phrase, usedLinks);
+    if (!post) continue;
+    if (entry.occurrences.some(occurrence => placeLink(occurrence, `<a href="${post.link}">`, '</a>'))) {
+      entry.inLink = true;
+      usedLinks.add(post.link);
+      inserted++;
+    }
+  }
+  debug.internal_links_inserted = inserted;
+}
+
+// v2.47: External links distributed across sections to prevent clustering
+// v2.57: All candidate phrases (anchor phrases and SERP-title n-grams) are matched in
+// one automaton pass over the tokenized HTML; output is rendered once at the end
+function injectExternalLinks(doc, anchorPhrases, serpResults) {
+  if (config.externalLinksCount === 0 || !serpResults?.length) return;
+  let inserted = 0;
+  const usedUrls = new Set();
+  const usedParagraphIndices = new Set(); // Track paragraphs that already have links
+  const shuffledPhrases = [...(anchorPhrases || [])].sort(() => Math.random() - 0.5);
+  const shuffledSerp = [...serpResults].sort(() => Math.random() - 0.5);
+  const totalParagraphs = doc.blockCount;
+  
+  // Calculate minimum gap between links based on content size
+  const minGap = Math.max(2, Math.floor(totalParagraphs / (config.externalLinksCount + 1)));
+  let lastLinkParagraphIdx = -minGap; // Allow first link early
+  
+  const skipWords = ['about', 'their', 'there', 'these', 'those', 'which', 'would', 'could', 'should', 'being', 'after', 'before', 'between', 'through', 'during', 'without', 'within', 'learn', 'click', 'here', 'best', 'guide', 'review', 'ultimate'];
+  
+  function extractNgrams(title, n) {
+    const words = title.split(/[^a-zA-Z0-9]+/).filter(w => w.length >= 3);
+    const ngrams = [];
+    for (let i = 0; i <= words.length - n; i++) {
+      const phrase = words.slice(i, i + n).join(' ');
+      const phraseWords = phrase.toLowerCase().split(' ');
+      if (!phraseWords.some(w => skipWords.includes(w))) {
+        ngrams.push(phrase);
+      }
+    }
+    return ngrams;
+  }
+  
+  // Fallback phrases from each SERP title: 3-word, 2-word, then single words
+  const serpPhrases = new Map(shuffledSerp.map(serpItem => [serpItem, [3, 2, 1].map(n => n === 1
+    ? (serpItem.title || '').split(/[^a-zA-Z0-9]+/).filter(w => w.length >= 5 && !skipWords.includes(w.toLowerCase()))
+    : extractNgrams(serpItem.title || '', n))]));
+  const found = findPhraseOccurrences(doc, [...shuffledPhrases, ...[...serpPhrases.values()].flat(2)]);
+  
+  // Helper to check if we can place a link in this paragraph (spacing rule)
+  function canPlaceLinkAt(paragraphIdx) {
+    if (paragraphIdx < 0) return false;
+    if (usedParagraphIndices.has(paragraphIdx)) return false;
+    // Ensure minimum gap from last link
+    if (paragraphIdx - lastLinkParagraphIdx < minGap && inserted > 0) return false;
+    return true;
+  }
+  
+  function placeAt(occurrence, serpItem) {
+    if (!canPlaceLinkAt(occurrence.block)) return false;
+    if (!placeLink(occurrence, `<a href="${serpItem.url}" target="_blank" rel="noopener">`, '</a>')) return false;
+    usedParagraphIndices.add(occurrence.block);
+    lastLinkParagraphIdx = occurrence.block;
+    return true;
+  }
+  
+  // Helper to try placing a link for a phrase: first occurrence that respects spacing
+  function tryPlaceLink(phrase, serpItem) {
+    const entry = phraseEntry(found, phrase);
+    if (entry.inLink) return false;
+    for (const occurrence of entry.occurrences) {
+      if (placeAt(occurrence, serpItem)) {
+        entry.inLink = true;
+        return true;
+      }
+    }
+    return false;
+  }
+  
+  // First pass: use provided anchor phrases
+  for (const phrase of shuffledPhrases) {
+    if (inserted >= config.externalLinksCount) break;
+    const serpItem = shuffledSerp.find(s => !usedUrls.has(s.url));
+    if (serpItem && tryPlaceLink(phrase, serpItem)) {
+      usedUrls.add(serpItem.url);
+      inserted++;
+    }
+  }
+  
+  // Second pass: contextual fallback using SERP titles
+  if (inserted < config.externalLinksCount) {
+    const availableSerp = shuffledSerp.filter(s => !usedUrls.has(s.url));
+    for (const serpItem of availableSerp) {
+      if (inserted >= config.externalLinksCount) break;
+      const placed = serpPhrases.get(serpItem).some(phrases => phrases.some(phrase => tryPlaceLink(phrase, serpItem)));
+      if (placed) {
+        usedUrls.add(serpItem.url);
+        inserted++;
+      }
+    }
+  }
+  
+  // Third pass: if still not enough links, use any long word in an unused paragraph
+  if (inserted < config.externalLinksCount && inserted < totalParagraphs) {
+    const wordsByParagraph = new Map();
+    for (const token of doc.tokens) {
+      if (token.kind !== 'text' || !token.linkable) continue;
+      const words = wordsByParagraph.get(token.block) || [];
+      for (const match of token.raw.matchAll(/[A-Za-z0-9]{5,}/g)) {
+        // Skip entity names like &nbsp;
+        if (token.raw[match.index - 1] === '&') continue;
+        words.push({ token, start: match.index, end: match.index + match[0].length, block: token.block });
+      }
+      wordsByParagraph.set(token.block, words);
+    }
+    const availableSerp = shuffledSerp.filter(s => !usedUrls.has(s.url));
+    for (const serpItem of availableSerp) {
+      if (inserted >= config.externalLinksCount) break;
+      
+      // Try any unused paragraph
+      for (let i = 0; i < totalParagraphs && !usedUrls.has(serpItem.url); i++) {
+        if (usedParagraphIndices.has(i)) continue;
+        for (const word of wordsByParagraph.get(i) || []) {
+          if (placeAt(word, serpItem)) {
+            usedUrls.add(serpItem.url);
+            inserted++;
+            break;
+          }
+        }
+      }
+    }
+  }
+  
+  debug.external_links_inserted = inserted;
+}
@@ -0,0 +1,192 @@
+// v2.71: Work started while the article streams; declared outside the try so a failed run can clean it up
+const early = {};
+try {
+  // v2.62: 'keep-alive' when the Code node may load Node's http modules
+  debug.http_transport = useKeepAliveTransport() ? 'keep-alive' : 'n8n';
+  
+  currentStep = 'WP_AUTH_CHECK';
+  executionLog.push({ step: currentStep, status: 'started', time: new Date().toISOString() });
+  const authCheck = await wpAuthSanityCheck.call(this);
+  executionLog.push({ step: currentStep, status: 'completed', user: authCheck.user, cached: Boolean(authCheck.cached) });
+  
+  currentStep = 'FETCH_HINTS';
+  executionLog.push({ step: currentStep, status: 'started' });
+  const [serpResults, youtubeCandidates] = await Promise.all([fetchSerpHints.call(this), YOUTUBE_PREFETCH ? fetchYouTubeCandidates.call(this) : []]);
+  executionLog.push({ step: currentStep, status: 'completed', serp: serpResults.length, youtube: youtubeCandidates.length });
+  
+  currentStep = 'GENERATE_CONTENT';
+  executionLog.push({ step: currentStep, status: 'started' });
+  // v2.66: While the article streams, images start as soon as content_html is complete
+  // v2.71: ...and the slug is in; the early run is kept only under that slug. The term
+  // cache is no longer prefetched here - publish-bundle doesn't use it
+  const contentJson = await generateContentJson.call(this, (field, value, fields) => {
+    if (field === 'content_html' && config.imagesCount > 0 && fields.slug && fields.meta_description && value && !early.media) {
+      early.html = value;
+      early.slug = fields.slug;
+      early.media = buildSectionMap(value);
+      early.images = processImagePlaceholders.call(this, early.media, early.slug);
+      early.images.catch(() => {});
+    }
+    // v2.68: Sectioned generation hands over the H2 skeleton after the outline; images
+    // and YouTube slots are claimed on it and filled while the sections are written
+    if (field === 'content_outline' && fields.slug && !early.media) {
+      early.outline = value;
+      early.slug = fields.slug;
+      early.media = buildSectionMap(value);
+      if (config.imagesCount > 0) {
+        early.images = processImagePlaceholders.call(this, early.media, early.slug);
+        early.images.catch(() => {});
+      }
+      if (config.youtubeCount > 0 && config.youtubeKey) {
+        early.videos = injectYouTubeEmbeds.call(this, early.media, youtubeCandidates);
+        early.videos.catch(() => {});
+      }
+    }
+  });
+  const validationErrors = validateContent(contentJson);
+  if (validationErrors.length > 0) throw new Error(`Content validation failed: ${validationErrors.join(', ')}`);
+  executionLog.push({ step: currentStep, status: 'completed', title: contentJson.title?.substring(0, 50) });
+  
+  // v2.58: One section map for every block inserted below; the post is assembled once before publishing
+  // Early media only count if they were placed on the article that was kept
+  let media = null;
+  if (early.media && contentJson.slug === early.slug) {
+    if (early.html === contentJson.content_html) {
+      media = early.media;
+    } else if (early.outline) {
+      const map = buildSectionMap(contentJson.content_html);
+      if (adoptSections(map, early.media)) media = map;
+    }
+  }
+  const earlyImages = media ? early.images : null;
+  const earlyVideos = media ? early.videos : null;
+  if (!media) media = buildSectionMap(contentJson.content_html);
+  // v2.71: Uploads from a discarded early run are deleted alongside the new ones
+  const discarded = early.images && !earlyImages ? discardImageUploads.call(this, early.images).catch(() => {}) : null;
+  early.images = earlyImages;
+  
+  currentStep = 'PROCESS_IMAGES';
+  let featuredImageId = null;
+  if (config.imagesCount > 0) {
+    executionLog.push({ step: currentStep, status: 'started', count: config.imagesCount, early: Boolean(earlyImages) });
+    const [imgResult] = await Promise.all([earlyImages || processImagePlaceholders.call(this, media, postSlug(contentJson)), discarded]);
+    early.images = null;
+    featuredImageId = imgResult.featuredImageId;
+    debug.images_uploaded += imgResult.uploaded;
+    executionLog.push({ step: currentStep, status: 'completed', uploaded: debug.images_uploaded, featuredId: featuredImageId });
+  } else {
+    executionLog.push({ step: currentStep, status: 'skipped', reason: 'images_count=0' });
+  }
+  
+  currentStep = 'INTERNAL_LINKS';
+  if (config.internalLinksCount > 0) {
+    executionLog.push({ step: currentStep, status: 'started' });
+    await injectInternalLinks.call(this, media.doc, contentJson.internal_anchor_phrases);
+    executionLog.push({ step: currentStep, status: 'completed', inserted: debug.internal_links_inserted });
+  } else {
+    executionLog.push({ step: currentStep, status: 'skipped' });
+  }
+  
+  currentStep = 'EXTERNAL_LINKS';
+  if (config.externalLinksCount > 0 && serpResults.length > 0) {
+    executionLog.push({ step: currentStep, status: 'started' });
+    injectExternalLinks(media.doc, contentJson.external_anchor_phrases, serpResults);
+    executionLog.push({ step: currentStep, status: 'completed', inserted: debug.external_links_inserted });
+  } else {
+    executionLog.push({ step: currentStep, status: 'skipped', reason: serpResults.length === 0 ? 'no SERP results' : 'disabled' });
+  }
+  
+  currentStep = 'YOUTUBE_EMBEDS';
+  if (config.youtubeCount > 0 && config.youtubeKey) {
+    executionLog.push({ step: currentStep, status: 'started' });
+    await (earlyVideos || injectYouTubeEmbeds.call(this, media, youtubeCandidates));
+    executionLog.push({ step: currentStep, status: 'completed', inserted: debug.youtube_embeds_inserted, early: Boolean(earlyVideos) });
+  } else {
+    executionLog.push({ step: currentStep, status: 'skipped' });
+  }
+  
+  const processedHtml = renderHtml(media.doc);
+  
+  // v2.52: One round trip for terms + post + SEO meta; older plugins get the separate calls
+  currentStep = 'PUBLISH_BUNDLE';
+  executionLog.push({ step: currentStep, status: 'started' });
+  const tags = tagNames(config.tags, contentJson.tag_suggestions);
+  const categories = categoryNames(config.categories);
+  
+  // v2.29: Schema handled by Yoast/RankMath (WP blocks script tags in content)
+  const postData = {
+    title: contentJson.title,
+    slug: contentJson.slug,
+    content: processedHtml,
+    excerpt: contentJson.meta_description,
+    status: config.postStatus,
+    comment_status: 'open',
+    ping_status: 'open'
+  };
+  if (featuredImageId) postData.featured_media = featuredImageId;
+  let postResp = await publishBundle.call(this, postData, tags, categories, contentJson);
+  let tagIds, categoryIds;
+  if (postResp) {
+    if (!postResp.id) throw new Error('Failed to create WordPress post - no ID returned');
+    tagIds = postResp.tags || [];
+    categoryIds = postResp.categories || [];
+    executionLog.push({ step: currentStep, status: 'completed', postId: postResp.id, tags: tagIds.length, categories: categoryIds.length, categoryDetails: debug.categories_found });
+  } else {
+    executionLog.push({ step: currentStep, status: 'skipped', reason: 'plugin has no publish-bundle' });
+    
+    currentStep = 'TERMS';
+    // v2.60: Served from the per-site term cache; misses are created in one request
+    ({ tagIds, categoryIds } = await resolveTerms.call(this, tags, categories));
+    executionLog.push({ step: currentStep, status: 'completed', tags: tagIds.length, categories: categoryIds.length, categoryDetails: debug.categories_found });
+    
+    currentStep = 'PUBLISH_POST';
+    executionLog.push({ step: currentStep, status: 'started' });
+    if (tagIds.length > 0) postData.tags = tagIds;
+    if (categoryIds.length > 0) postData.categories = categoryIds;
+    postResp = await publishPost.call(this, postData);
+    if (!postResp?.id) throw new Error('Failed to create WordPress post - no ID returned');
+    executionLog.push({ step: currentStep, status: 'completed', postId: postResp.id });
+    
+    // v2.28: Update Yoast/RankMath SEO meta fields
+    await updateSeoMeta.call(this, postResp.id, contentJson);
+  }
+  
+  currentStep = 'POST_PROCESSING';
+  
+  // SpeedyIndex (only for published posts, respects per-site setting)
+  await pingIndexingService.call(this, postResp.link);
+  
+  // Telegram (respects per-site setting)
+  const indexStatus = debug.notifications.speedyindex === 'speedyindex_success' ? '✅ SpeedyIndex' : 
+                       debug.notifications.speedyindex === 'fastindex_success' ? '✅ FastIndex' : 
+                       debug.notifications.speedyindex === 'disabled_for_site' ? '⏸️ Disabled' :
+                       debug.notifications.speedyindex === 'post_not_published' ? '⏸️ Draft' :
+                       '❌ Failed';
+  const notifyMessage = `✅ <b>New Post Published</b>\n\n📝 ${contentJson.title}\n🌐 ${site.site_name || config.baseUrl}\n🔗 ${postResp.link || 'Draft'}\n📊 Images: ${debug.images_uploaded}/${debug.images_requested}\n🔗 Internal: ${debug.internal_links_inserted}/${debug.internal_links_requested}\n🌐 External: ${debug.external_links_inserted}/${debug.external_links_requested}\n📺 YouTube: ${debug.youtube_embeds_inserted}/${debug.youtube_embeds_requested}\n🏷️ Categories: ${categoryIds.length}\n🔍 Indexing: ${indexStatus}`;
+  await sendTelegramNotification.call(this, notifyMessage);
+  
+  // Email (respects per-site setting)
+  const emailHtml = `<h2>✅ New Post Published</h2><p><strong>Site:</strong> ${site.site_name || config.baseUrl}</p><p><strong>Title:</strong> ${contentJson.title}</p><p><strong>URL:</strong> <a href="${postResp.link}">${postResp.link || 'Draft'}</a></p><p><strong>Images:</strong> ${debug.images_uploaded}/${debug.images_requested}</p><p><strong>Internal Links:</strong> ${debug.internal_links_inserted}/${debug.internal_links_requested}</p><p><strong>External Links:</strong> ${debug.external_links_inserted}/${debug.external_links_requested}</p><p><strong>YouTube:</strong> ${debug.youtube_embeds_inserted}/${debug.youtube_embeds_requested}</p><p><strong>Categories:</strong> ${categoryIds.length}</p>`;
+  await sendEmailNotification.call(this, `New Post: ${contentJson.title}`, emailHtml);
+  
+  executionLog.push({ step: currentStep, status: 'completed', notifications: debug.notifications });
+  
+  return [{ json: { ok: true, post_id: postResp.id, post_url: postResp.link, title: contentJson.title, slug: contentJson.slug, focus_keyphrase: contentJson.focus_keyphrase, status: postResp.status, featured_image_id: featuredImageId, debug, execution_log: executionLog, site, topicRow } }];
+} catch (error) {
+  executionLog.push({ step: currentStep, status: 'FAILED', error: error.message });
+  // v2.71: Early uploads that never reached the image step are not left in the media library
+  if (early.images) await discardImageUploads.call(this, early.images).catch(() => {});
+  // v2.61: Rejected credentials must not be reused from the auth cache
+  if (/\b40[13]\b|jwt|rest_forbidden|not allowed/i.test(error.message)) forgetWpAuth();
+  
+  // Send failure notifications (still respects per-site settings)
+  const failMsg = `❌ <b>Post Failed</b>\n\n📝 ${config.topic}\n🌐 ${site.site_name || config.baseUrl}\n🚫 Step: ${currentStep}\n⚠️ ${error.message}`;
+  await sendTelegramNotification.call(this, failMsg).catch(() => {});
+  
+  const failEmailHtml = `<h2>❌ Post Failed</h2><p><strong>Site:</strong> ${site.site_name || config.baseUrl}</p><p><strong>Topic:</strong> ${config.topic}</p><p><strong>Step:</strong> ${currentStep}</p><p><strong>Error:</strong> ${error.message}</p>`;
+  await sendEmailNotification.call(this, `FAILED: ${config.topic}`, failEmailHtml).catch(() => {});
+  
+  return [{ json: { ok: false, error: error.message, failed_at_step: currentStep, debug, execution_log: executionLog, stack: error.stack, site, topicRow } }];
+} finally {
+  await closeHttpPool();
+}
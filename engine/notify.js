@@ -0,0 +1,91 @@
+// v2.8: Per-site Telegram control
+async function sendTelegramNotification(message) {
+  if (!config.telegramEnabled) {
+    debug.notifications.telegram = 'disabled_for_site';
+    return false;
+  }
+  if (!config.telegramToken || !config.telegramChatId) {
+    debug.notifications.telegram = 'no_credentials';
+    return false;
+  }
+  try {
+    await httpRequest.call(this, {
+      method: 'POST',
+      url: `https://api.telegram.org/bot${config.telegramToken}/sendMessage`,
+      headers: { 'Content-Type': 'application/json' },
+      body: { chat_id: config.telegramChatId, text: message, parse_mode: 'HTML' }
+    });
+    debug.notifications.telegram = true;
+    return true;
+  } catch (e) {
+    debug.wp_errors.push({ step: 'TELEGRAM', error: e.message });
+    debug.notifications.telegram = `error: ${e.message}`;
+    return false;
+  }
+}
+
+// v2.8: Per-site Email control
+async function sendEmailNotification(subject, htmlBody) {
+  if (!config.emailEnabled) {
+    debug.notifications.email = 'disabled_for_site';
+    return false;
+  }
+  if (!config.notificationEmail) {
+    debug.notifications.email = 'no_recipient';
+    return false;
+  }
+  if (!config.emailProvider) {
+    debug.notifications.email = 'no_provider';
+    return false;
+  }
+  try {
+    switch (config.emailProvider) {
+      case 'resend':
+        if (!config.resendApiKey) { debug.notifications.email = 'no_resend_key'; return false; }
+        await httpRequest.call(this, {
+          method: 'POST', url: 'https://api.resend.com/emails',
+          headers: { 'Authorization': `Bearer ${config.resendApiKey}`, 'Content-Type': 'application/json' },
+          body: { from: config.emailFrom, to: config.notificationEmail, subject, html: htmlBody }
+        });
+        break;
+      case 'sendgrid':
+        if (!config.sendgridApiKey) { debug.notifications.email = 'no_sendgrid_key'; return false; }
+        await httpRequest.call(this, {
+          method: 'POST', url: 'https://api.sendgrid.com/v3/mail/send',
+          headers: { 'Authorization': `Bearer ${config.sendgridApiKey}`, 'Content-Type': 'application/json' },
+          body: { personalizations: [{ to: [{ email: config.notificationEmail }] }], from: { email: config.emailFrom }, subject, content: [{ type: 'text/html', value: htmlBody }] }
+        });
+        break;
+      case 'mailgun':
+        if (!config.mailgunApiKey || !config.mailgunDomain) { debug.notifications.email = 'no_mailgun_config'; return false; }
+        const formData = new URLSearchParams();
+        formData.append('from', config.emailFrom);
+        formData.append('to', config.notificationEmail);
+        formData.append('subject', subject);
+        formData.append('html', htmlBody);
+        await httpRequest.call(this, {
+          method: 'POST', url: `https://api.mailgun.net/v3/${config.mailgunDomain}/messages`,
+          headers: { 'Authorization': `Basic ${Buffer.from(`api:${config.mailgunApiKey}`).toString('base64')}`, 'Content-Type': 'application/x-www-form-urlencoded' },
+          body: formData.toString()
+        });
+        break;
+      case 'smtp2go':
+        if (!config.smtp2goApiKey) { debug.notifications.email = 'no_smtp2go_key'; return false; }
+        await httpRequest.call(this, {
+          method: 'POST', url: 'https://api.smtp2go.com/v3/email/send',
+          headers: { 'Content-Type': 'application/json' },
+          body: { api_key: config.smtp2goApiKey, sender: config.emailFrom, to: [config.notificationEmail], subject, html_body: htmlBody }
+        });
+        break;
+      default:
+        debug.notifications.email = `unknown_provider: ${config.emailProvider}`;
+        return false;
+    }
+    debug.notifications.email = true;
+    return true;
+  } catch (e) {
+    debug.wp_errors.push({ step: 'EMAIL', provider: config.emailProvider, error: e.message });
+    debug.notifications.email = `error: ${e.message}`;
+    return false;
+  }
+}
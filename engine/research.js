@@ -0,0 +1,96 @@
+async function fetchSerpHints() {
+  // v2.44: Try Google CSE first, fall back to Serper.dev
+  // v2.64: Run as the 'serp' fallback chain (hedged when hedge_chains lists serp)
+  const steps = [];
+  
+  if (config.googleCseKey && config.googleCseCx) {
+    steps.push({
+      provider: 'google_cse',
+      run: async signal => {
+        const resp = await httpRequest.call(this, {
+          method: 'GET',
+          url: `https://www.googleapis.com/customsearch/v1?key=${config.googleCseKey}&cx=${config.googleCseCx}&q=${encodeURIComponent(config.topic)}&num=10`,
+          abortSignal: signal
+        });
+        const results = (resp?.items || []).map(item => ({ title: item.title, url: item.link, snippet: item.snippet }));
+        return results.length > 0 ? results : null;
+      },
+      onError: e => debug.wp_errors.push({ step: 'SERP_GOOGLE_CSE', error: e.message })
+    });
+  }
+  
+  // Fallback to Serper.dev
+  if (config.serperKey) {
+    steps.push({
+      provider: 'serper',
+      run: async signal => {
+        const resp = await httpRequest.call(this, {
+          method: 'POST',
+          url: 'https://google.serper.dev/search',
+          headers: {
+            'X-API-KEY': config.serperKey,
+            'Content-Type': 'application/json'
+          },
+          body: { q: config.topic, num: 10 },
+          // v2.63: A search POST has no side effects - safe to retry
+          idempotent: true,
+          abortSignal: signal
+        });
+        const results = (resp?.organic || []).map(item => ({ 
+          title: item.title, 
+          url: item.link, 
+          snippet: item.snippet 
+        }));
+        return results.length > 0 ? results : null;
+      },
+      onError: e => debug.wp_errors.push({ step: 'SERP_SERPER', error: e.message })
+    });
+  }
+  
+  const won = await runFallbackChain('serp', steps);
+  if (won) {
+    debug.serp_count = won.result.length;
+    debug.serp_provider = won.step.provider;
+    return won.result;
+  }
+  
+  debug.serp_provider = 'none';
+  return [];
+}
+
+// Topic-level videos, only used when a per-section YouTube search fails.
+// Release builds (python -m pipeline build --release) fold this flag to false
+// and drop fetchYouTubeCandidates() entirely.
+const YOUTUBE_PREFETCH = true;
+
+async function fetchYouTubeCandidates() {
+  if (!config.youtubeKey || config.youtubeCount === 0) return [];
+  try {
+    // v2.42: Use videoDuration=medium to exclude Shorts (under 4 min)
+    // Also fetch more results (15) so we have options after filtering
+    const resp = await httpRequest.call(this, {
+      method: 'GET',
+      url: `https://www.googleapis.com/youtube/v3/search?part=snippet&q=${encodeURIComponent(config.topic)}&type=video&videoDuration=medium&maxResults=15&key=${config.youtubeKey}`
+    });
+    
+    // Filter out any remaining shorts by title (some slip through)
+    const shortsKeywords = ['#shorts', '#short', 'shorts', '60 sec', '30 sec', 'tiktok'];
+    const results = (resp?.items || [])
+      .filter(item => {
+        const title = (item.snippet?.title || '').toLowerCase();
+        return !shortsKeywords.some(kw => title.includes(kw));
+      })
+      .slice(0, 5) // Keep top 5 after filtering
+      .map(item => ({
+        videoId: item.id?.videoId,
+        title: item.snippet?.title || 'Related Video',
+        url: `https://www.youtube.com/watch?v=${item.id?.videoId}`
+      }));
+    
+    debug.youtube_candidates_count = results.length;
+    return results;
+  } catch (e) {
+    debug.wp_errors.push({ step: 'YOUTUBE', error: e.message });
+    return [];
+  }
+}
@@ -0,0 +1,182 @@
+// v2.52: Term names are resolved once and shared by publish-bundle and the per-term calls
+function tagNames(tagString, tagSuggestions) {
+  if (tagString) return tagString.split(/[,|]/).map(t => t.trim()).filter(t => t);
+  if (tagSuggestions?.length) return tagSuggestions.slice(0, 5);
+  return [];
+}
+
+function categoryNames(categoryString) {
+  let termNames = [];
+  if (categoryString) {
+    termNames = categoryString.split(/[,|]/).map(t => t.trim()).filter(t => t);
+  }
+  if (termNames.length === 0 && config.defaultCategory) {
+    termNames = [config.defaultCategory];
+  }
+  debug.categories_requested = termNames;
+  return termNames;
+}
+
+// v2.60: Per-site term cache in workflow static data
+// ({ tags: { id: [name, slug] }, categories: { id: [name, slug] }, built_at }).
+// Both taxonomies are paged in full (_fields=id,name,slug) when the cache is
+// missing or older than TERM_CACHE_TTL_MS. Names the cache can't resolve are
+// found-or-created with one call per term and cached.
+// v2.71: Only used when the plugin has no publish-bundle (1.3 or older), which
+// resolves terms on the server; those plugins never had a bulk endpoint either
+const TERM_CACHE_TTL_MS = 24 * 60 * 60 * 1000;
+const TERM_CACHE_MAX_PAGES = 50;
+let termCacheLoad = null;
+
+function getTermCache() {
+  const staticData = workflowStaticData();
+  const caches = staticData.termCache || (staticData.termCache = {});
+  let cache = caches[config.baseUrl];
+  if (!cache || Date.now() - Date.parse(cache.built_at) > TERM_CACHE_TTL_MS) {
+    cache = caches[config.baseUrl] = { tags: {}, categories: {}, built_at: null };
+  }
+  return cache;
+}
+
+async function fetchAllTerms(taxonomy, authHeaders) {
+  const terms = {};
+  for (let page = 1; page <= TERM_CACHE_MAX_PAGES; page++) {
+    const resp = await httpRequest.call(this, {
+      method: 'GET',
+      url: `${config.baseUrl}/wp-json/wp/v2/${taxonomy}?per_page=100&page=${page}&orderby=id&_fields=id,name,slug`,
+      headers: authHeaders
+    });
+    if (!Array.isArray(resp)) break;
+    for (const term of resp) terms[term.id] = [decodeEntities(term.name), term.slug];
+    if (resp.length < 100) break;
+  }
+  return terms;
+}
+
+// One load per execution, shared by concurrent callers
+function loadTermCache(authHeaders) {
+  if (!termCacheLoad) {
+    termCacheLoad = (async () => {
+      const cache = getTermCache();
+      if (cache.built_at) {
+        debug.term_cache = { hit: true, built_at: cache.built_at };
+        return cache;
+      }
+      try {
+        const [tags, categories] = await Promise.all([
+          fetchAllTerms.call(this, 'tags', authHeaders),
+          fetchAllTerms.call(this, 'categories', authHeaders)
+        ]);
+        Object.assign(cache, { tags, categories, built_at: new Date().toISOString() });
+      } catch (e) {
+        debug.wp_errors.push({ step: 'TERM_CACHE', error: e.message });
+      }
+      debug.term_cache = { hit: false, tags: Object.keys(cache.tags).length, categories: Object.keys(cache.categories).length };
+      return cache;
+    })();
+  }
+  return termCacheLoad;
+}
+
+function termSlug(name) {
+  return name.toLowerCase().replace(/\s+/g, '-').replace(/[^a-z0-9-]/g, '');
+}
+
+function findCachedTag(cache, name) {
+  const nameLower = name.toLowerCase();
+  const entry = Object.entries(cache.tags).find(([, [tagName]]) => tagName.toLowerCase() === nameLower);
+  return entry ? parseInt(entry[0]) : null;
+}
+
+// Exact name, then slug, then partial name match
+function findCachedCategory(cache, name) {
+  const nameLower = name.toLowerCase();
+  const nameSlug = termSlug(name);
+  const all = Object.entries(cache.categories).map(([id, [catName, slug]]) => ({ id: parseInt(id), name: catName, slug }));
+  return all.find(c => c.name.toLowerCase() === nameLower)
+    || all.find(c => c.slug === nameSlug)
+    || all.find(c => c.name.toLowerCase().includes(nameLower) || nameLower.includes(c.name.toLowerCase()))
+    || null;
+}
+
+async function resolveTerms(tagList, categoryList) {
+  const authHeaders = await getWpAuthHeaders.call(this);
+  const tagIds = [];
+  const categoryIds = [];
+  if (tagList.length === 0 && categoryList.length === 0) return { tagIds, categoryIds };
+  const cache = await loadTermCache.call(this, authHeaders);
+  
+  const missingTags = [];
+  for (const name of tagList) {
+    const id = findCachedTag(cache, name);
+    if (id) tagIds.push(id);
+    else missingTags.push(name);
+  }
+  const missingCategories = [];
+  for (const name of categoryList) {
+    const found = findCachedCategory(cache, name);
+    if (found) {
+      categoryIds.push(found.id);
+      debug.categories_found.push({ requested: name, matched: found.name, id: found.id });
+    } else {
+      missingCategories.push(name);
+    }
+  }
+  if (missingTags.length === 0 && missingCategories.length === 0) return { tagIds, categoryIds };
+  
+  // Cache misses: one find-or-create call per term, all at once
+  const [createdTags, createdCategories] = await Promise.all([
+    Promise.all(missingTags.map(name => createTag.call(this, name, authHeaders))),
+    Promise.all(missingCategories.map(name => createCategory.call(this, name, authHeaders)))
+  ]);
+  for (const term of createdTags) {
+    if (!term?.id) continue;
+    tagIds.push(term.id);
+    cache.tags[term.id] = [term.name, term.slug || termSlug(term.name)];
+  }
+  for (const term of createdCategories) {
+    if (!term?.id) continue;
+    categoryIds.push(term.id);
+    cache.categories[term.id] = [term.name, term.slug || termSlug(term.name)];
+    debug.categories_found.push({ requested: term.requested || term.name, created: term.created !== false, id: term.id });
+  }
+  return { tagIds: [...new Set(tagIds)], categoryIds: [...new Set(categoryIds)] };
+}
+
+async function createTag(name, authHeaders) {
+  try {
+    const searchResp = await httpRequest.call(this, {
+      method: 'GET',
+      url: `${config.baseUrl}/wp-json/wp/v2/tags?search=${encodeURIComponent(name)}&_fields=id,name,slug`,
+      headers: authHeaders
+    });
+    const existing = (searchResp || []).find(t => decodeEntities(t.name).toLowerCase() === name.toLowerCase());
+    if (existing) return { id: existing.id, name, slug: existing.slug };
+    const createResp = await httpRequest.call(this, {
+      method: 'POST',
+      url: `${config.baseUrl}/wp-json/wp/v2/tags`,
+      headers: { ...authHeaders, 'Content-Type': 'application/json' },
+      body: { name }
+    });
+    return createResp?.id ? { id: createResp.id, name, slug: createResp.slug } : null;
+  } catch (e) {
+    debug.wp_errors.push({ step: 'CREATE_TAG', name, error: e.message });
+    return null;
+  }
+}
+
+// v2.31: Auto-create category via plugin endpoint (bypasses REST API 403)
+async function createCategory(name, authHeaders) {
+  try {
+    const createResp = await httpRequest.call(this, {
+      method: 'POST',
+      url: `${config.baseUrl}/wp-json/n8n/v1/create-category`,
+      headers: { ...authHeaders, 'Content-Type': 'application/json' },
+      body: { name: name, slug: termSlug(name) }
+    });
+    return createResp?.id ? { id: createResp.id, name: createResp.name || name, slug: createResp.slug, requested: name, created: createResp.created } : null;
+  } catch (createErr) {
+    debug.wp_errors.push({ step: 'CREATE_CATEGORY', requested: name, error: createErr.message });
+    return null;
+  }
+}
@@ -0,0 +1,131 @@
+// v2.59: Shorts and clips are rejected by their real duration (Shorts run up to 3 minutes)
+const YOUTUBE_MIN_SECONDS = 181;
+// Only used when the duration lookup fails
+const YOUTUBE_SHORTS_KEYWORDS = ['#shorts', '#short', 'shorts', '60 sec', '30 sec', 'tiktok'];
+
+// ISO 8601 duration (PT1H2M3S, P1DT2H) to seconds; 0 for live streams (P0D)
+function parseIsoDuration(value) {
+  const m = /^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$/.exec(value || '');
+  if (!m) return 0;
+  return (+(m[1] || 0)) * 86400 + (+(m[2] || 0)) * 3600 + (+(m[3] || 0)) * 60 + (+(m[4] || 0));
+}
+
+// One videos.list request (50 ids max) for every candidate; Map(videoId -> seconds) or null on failure
+async function fetchVideoDurations(videoIds) {
+  if (videoIds.length === 0) return new Map();
+  try {
+    const resp = await httpRequest.call(this, {
+      method: 'GET',
+      url: `https://www.googleapis.com/youtube/v3/videos?part=contentDetails&id=${videoIds.slice(0, 50).join(',')}&key=${config.youtubeKey}`
+    });
+    const durations = new Map((resp?.items || []).map(item => [item.id, parseIsoDuration(item.contentDetails?.duration)]));
+    debug.youtube_candidates_checked = { candidates: videoIds.length, usable: [...durations.values()].filter(s => s >= YOUTUBE_MIN_SECONDS).length };
+    return durations;
+  } catch (e) {
+    debug.wp_errors.push({ step: 'YOUTUBE_DURATIONS', error: e.message });
+    return null;
+  }
+}
+
+// v2.43: YouTube embeds matched to section headings for relevance
+// v2.58: Embeds claim slots on the shared section map (never a slot that holds images)
+async function injectYouTubeEmbeds(media, youtubeCandidates) {
+  if (config.youtubeCount === 0) return;
+  let inserted = 0;
+  const usedVideos = new Set();
+  
+  // AI-placed YouTube placeholders and ending sections were dropped by buildSectionMap()
+  const usableH2s = media.sections;
+  
+  if (usableH2s.length === 0) {
+    debug.youtube_embeds_inserted = 0;
+    return;
+  }
+  
+  // Place YouTube in MIDDLE sections
+  const embedCount = Math.min(config.youtubeCount, usableH2s.length);
+  const midPoint = Math.floor(usableH2s.length / 2);
+  
+  // Determine which sections get videos
+  // v2.71: Each slot keeps the block it claimed; a slot without a video stays empty
+  const slots = [];
+  for (let i = 0; i < embedCount; i++) {
+    let sectionIdx;
+    if (embedCount === 1) {
+      sectionIdx = midPoint;
+    } else {
+      sectionIdx = midPoint + (i % 2 === 0 ? Math.floor(i/2) : -Math.ceil(i/2));
+      sectionIdx = Math.max(0, Math.min(sectionIdx, usableH2s.length - 1));
+    }
+    // Move to the nearest section no image has taken
+    sectionIdx = nearestFreeSection(media, sectionIdx);
+    if (sectionIdx !== -1 && !slots.some(slot => slot.sectionIdx === sectionIdx)) {
+      const block = claimSection(media, sectionIdx, 'video');
+      if (block) slots.push({ sectionIdx, block });
+    }
+  }
+  
+  // v2.43: Search YouTube for EACH section heading for better relevance
+  // v2.59: All section searches run concurrently
+  const searches = await Promise.all(slots.map(async ({ sectionIdx, block }) => {
+    const section = usableH2s[sectionIdx];
+    const sectionTitle = section.title;
+    
+    // Search YouTube with section heading + topic for context
+    const searchQuery = `${sectionTitle} ${config.topic}`.substring(0, 100);
+    
+    try {
+      const resp = await httpRequest.call(this, {
+        method: 'GET',
+        url: `https://www.googleapis.com/youtube/v3/search?part=snippet&q=${encodeURIComponent(searchQuery)}&type=video&videoDuration=medium&maxResults=5&key=${config.youtubeKey}`
+      });
+      const videos = (resp?.items || [])
+        .filter(item => item.id?.videoId)
+        .map(item => ({
+          videoId: item.id.videoId,
+          title: item.snippet?.title || 'Related Video'
+        }));
+      return { block, videos };
+    } catch (e) {
+      debug.wp_errors.push({ step: 'YOUTUBE_SECTION_SEARCH', section: sectionTitle, error: e.message });
+      return { block, videos: [] };
+    }
+  }));
+  
+  // v2.59: Results are deduplicated across sections (and the pre-fetched fallbacks),
+  // then checked with one videos.list call instead of title keyword heuristics
+  const candidateIds = [...new Set([
+    ...searches.flatMap(s => s.videos.map(v => v.videoId)),
+    ...(youtubeCandidates || []).map(v => v.videoId).filter(Boolean)
+  ])];
+  const durations = await fetchVideoDurations.call(this, candidateIds);
+  const isUsable = video => durations
+    ? (durations.get(video.videoId) || 0) >= YOUTUBE_MIN_SECONDS
+    : !YOUTUBE_SHORTS_KEYWORDS.some(kw => video.title.toLowerCase().includes(kw));
+  
+  const placements = [];
+  for (const { block, videos } of searches) {
+    let video = videos.find(v => !usedVideos.has(v.videoId) && isUsable(v));
+    // Fall back to pre-fetched candidates if the section search failed or found nothing usable
+    if (!video && youtubeCandidates?.length > 0) {
+      video = youtubeCandidates.find(v => v.videoId && !usedVideos.has(v.videoId) && isUsable(v));
+    }
+    if (video) {
+      placements.push({ block, video });
+      usedVideos.add(video.videoId);
+    }
+  }
+  
+  for (const pos of placements) {
+    pos.block.html = `
+
+https://www.youtube.com/watch?v=${pos.video.videoId}
+
+<p style="text-align:center;font-style:italic;color:#666;margin-top:-10px;">${pos.video.title}</p>
+
+`;
+    inserted++;
+  }
+  
+  debug.youtube_embeds_inserted = inserted;
+}
@@ -0,0 +1,21 @@
+"""
+Release tooling for the n8n WordPress Autoblogger workflows.
+
+Replaces the old one-script-per-release ``fix_v2XX.py`` chain:
+
+- ``pipeline.patches`` holds the ordered, versioned patch set
+- ``pipeline.runner`` loads each workflow once, applies pending patches in
+  memory and writes each file at most once
+- ``pipeline.jsparse`` splits Code node source into top-level function
+  segments so patches can replace a function by name
+
+Run ``python -m pipeline --help`` from the repository root.
+"""
+from pipeline.jsparse import JsSource, JsSyntaxError
+from pipeline.patch import InsertFunction, Patch, PatchError, Replace, ReplaceFunction, Transform
+from pipeline.workflow import Workflow
+
+__all__ = [
+    'InsertFunction', 'JsSource', 'JsSyntaxError', 'Patch', 'PatchError',
+    'Replace', 'ReplaceFunction', 'Transform', 'Workflow',
+]
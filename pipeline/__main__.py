@@ -0,0 +1,88 @@
+"""
+Command line entry point.
+
+    python -m pipeline patch             # apply pending release patches
+    python -m pipeline patch --dry-run   # show what would be applied
+    python -m pipeline patch --adopt     # record patches as applied (baseline)
+    python -m pipeline build             # bundle engine/ into every Publisher variant
+    python -m pipeline build --force     # rebuild even if nothing changed
+    python -m pipeline build --release   # minified workflows in dist/
+    python -m pipeline build --release --verify   # ...checked against the bundle under node
+"""
+import argparse
+import sys
+import time
+
+from pipeline.build import VARIANTS, BuildError, build
+from pipeline.patch import PatchError, check_primitives
+from pipeline.patches import PATCHES
+from pipeline.runner import run_patches
+
+
+def cmd_patch(args):
+    patches = PATCHES
+    if args.target:
+        patches = [p for p in patches if p.target in args.target]
+    started = time.perf_counter()
+    try:
+        check_primitives()
+        report = run_patches(patches, root=args.root, adopt=args.adopt, dry_run=args.dry_run)
+    except PatchError as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 1
+    applied = sum(len(ids) for ids in report.values())
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f'✅ {applied} patch(es) across {len(report)} workflow(s) in {elapsed:.0f} ms')
+    return 0
+
+
+def cmd_build(args):
+    variants = VARIANTS
+    if args.variant:
+        variants = [v for v in variants if v.name in args.variant]
+    if args.verify and not args.release:
+        print('❌ --verify checks a release build; add --release', file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    try:
+        # Verifying needs the code in memory, so every variant is rebuilt
+        report = build(variants, root=args.root, force=args.force or args.verify,
+                       dry_run=args.dry_run, release=args.release, verify=args.verify)
+    except BuildError as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 1
+    built = sum(1 for status in report.values() if status == 'built')
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f'✅ {built} of {len(report)} variant(s) rebuilt in {elapsed:.0f} ms')
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pipeline')
+    parser.add_argument('--root', default='.', help='repository root (default: current directory)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    patch = sub.add_parser('patch', help='apply the ordered release patch set')
+    patch.add_argument('--dry-run', action='store_true', help='do not write any files')
+    patch.add_argument('--adopt', action='store_true',
+                       help='record pending patches as applied without editing code')
+    patch.add_argument('--target', action='append', help='only patch this workflow file (repeatable)')
+    patch.set_defaults(func=cmd_patch)
+
+    build_cmd = sub.add_parser('build', help='bundle engine/ into the Publisher workflow variants')
+    build_cmd.add_argument('--dry-run', action='store_true', help='do not write any files')
+    build_cmd.add_argument('--force', action='store_true', help='ignore the build cache')
+    build_cmd.add_argument('--release', action='store_true',
+                           help='minify and write release workflows to dist/')
+    build_cmd.add_argument('--verify', action='store_true',
+                           help='run bundled and minified engines under node and compare them')
+    build_cmd.add_argument('--variant', action='append', choices=[v.name for v in VARIANTS],
+                           help='only build this variant (repeatable)')
+    build_cmd.set_defaults(func=cmd_build)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
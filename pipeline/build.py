@@ -0,0 +1,361 @@
+"""
+Engine build.
+
+The Publisher engine is kept as module files under ``engine/``, listed in
+order by ``engine/manifest.json``. The build bundles them once and injects the
+result into every workflow variant in ``VARIANTS``:
+
+- ``vars`` variants (v2, Current) read API keys from n8n ``$vars`` through an
+  Inject Globals node; the node is generated from the engine's ``globals.*``
+  references, with defaults taken from ``globals.KEY || 'default'``
+- ``site`` variants (v3) have no Inject Globals node; the same keys are read
+  from lowercase Site_Registry columns by a generated ``resolveGlobals()``
+
+Each variant records an input and output hash in ``meta.engineBuild``. A
+variant whose inputs and emitted code are unchanged is skipped without being
+rewritten, and variants build in parallel.
+
+``--release`` writes minified variants to ``dist/`` (see ``pipeline.minify``)
+and reports the byte and compile-time savings per workflow. ``--verify`` also
+runs the bundled and minified engines side by side (see ``pipeline.verify``).
+"""
+import json
+import shutil
+import subprocess
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+from pipeline.jsparse import JsSource, JsSyntaxError, walk_tokens
+from pipeline.minify import MinifyError, fold_flags, minify
+from pipeline.verify import VerifyError, verify_release
+from pipeline.workflow import Workflow, content_hash
+
+ENGINE_DIR = 'engine'
+ENGINE_NODE = 'engine-001'
+GLOBALS_NODE = 'inject-globals-001'
+DIST_DIR = 'dist'
+# Build flags folded by release builds (see pipeline.minify.fold_flags)
+RELEASE_DEFINES = {
+    'YOUTUBE_PREFETCH': False,   # per-section YouTube search only
+}
+# Changing the generator itself invalidates every cached variant
+BUILD_DIGEST = content_hash(Path(__file__).read_text(encoding='utf-8'))
+
+
+class BuildError(Exception):
+    """The engine sources or a target workflow can't be built as configured."""
+
+
+@dataclass(frozen=True)
+class Variant:
+    name: str
+    target: str
+    wiring: str             # 'vars' or 'site'
+    version_suffix: str = ''
+
+
+VARIANTS = (
+    Variant('v2', 'v2/2_Publisher.json', 'vars'),
+    Variant('v3', 'v3/2_Publisher.json', 'site', '-no-globals'),
+    Variant('current', 'Current/Publisher (Autoblogging Engine).json', 'vars'),
+)
+
+
+@dataclass(frozen=True)
+class Engine:
+    version: str
+    modules: tuple          # module sources in manifest order
+
+    @property
+    def text(self):
+        return '\n\n'.join(self.modules) + '\n'
+
+    @property
+    def digest(self):
+        return content_hash(self.text)
+
+    @cached_property
+    def keys(self):
+        """``((KEY, default JS literal), ...)`` in first-use order. Tokenizes the
+        bundle, so it is only computed when a variant actually has to be built."""
+        try:
+            JsSource(self.text)
+        except JsSyntaxError as e:
+            raise BuildError(f'engine bundle does not tokenize: {e}') from None
+        return scan_globals(self.text)
+
+
+def scan_globals(src):
+    """``globals.KEY`` references in ``src`` with their ``|| 'literal'`` default."""
+    tokens = [t for t in walk_tokens(src) if t.kind not in ('ws', 'comment', 'template')]
+    keys = OrderedDict()
+    for i, tok in enumerate(tokens[:-2]):
+        if tok.kind != 'name' or tok.text != 'globals' or tokens[i + 1].text != '.':
+            continue
+        if i > 0 and tokens[i - 1].text in ('.', '?.'):
+            continue
+        key = tokens[i + 2].text
+        default = None
+        if i + 4 < len(tokens) and tokens[i + 3].text == '||' and tokens[i + 4].kind == 'string':
+            default = tokens[i + 4].text
+        current = keys.get(key)
+        if current is not None and default is not None and current != default:
+            raise BuildError(f'globals.{key} has conflicting defaults {current} and {default}')
+        keys[key] = current if default is None else default
+    return tuple((key, default or "''") for key, default in keys.items())
+
+
+def load_engine(root='.'):
+    engine_dir = Path(root) / ENGINE_DIR
+    manifest = json.loads((engine_dir / 'manifest.json').read_text(encoding='utf-8'))
+    parts = []
+    for name in manifest['modules']:
+        path = engine_dir / name
+        if not path.is_file():
+            raise BuildError(f'{path}: listed in manifest.json but missing')
+        parts.append(path.read_text(encoding='utf-8').strip('\n'))
+    return Engine(manifest['version'], tuple(parts))
+
+
+# -- generated wiring --------------------------------------------------------
+
+def vars_wiring():
+    return (
+        "// Generated by pipeline/build.py: keys come from the Inject Globals node (n8n $vars)\n"
+        "function resolveGlobals(json) {\n"
+        "  return json.globals || {};\n"
+        "}\n\n"
+        "function missingKeyError(key) {\n"
+        "  return `CRITICAL: ${key} is missing`;\n"
+        "}"
+    )
+
+
+def site_wiring(keys):
+    fields = ',\n'.join(f'    {key}: site.{key.lower()} || {default}' for key, default in keys)
+    return (
+        "// Generated by pipeline/build.py: no n8n $vars, every key is a Site_Registry column\n"
+        "function resolveGlobals(json, site) {\n"
+        "  return {\n"
+        f"{fields}\n"
+        "  };\n"
+        "}\n\n"
+        "function missingKeyError(key) {\n"
+        "  return `CRITICAL: ${key.toLowerCase()} is missing from Site_Registry. Add the column and your API key.`;\n"
+        "}"
+    )
+
+
+def inject_globals_code(keys):
+    fields = ',\n'.join(f'  {key}: $vars.{key} || {default}' for key, default in keys)
+    return (
+        "/**\n"
+        " * Inject Globals - Merge incoming data with n8n variables\n"
+        " * Generated by pipeline/build.py from the engine's globals.* references\n"
+        " */\n"
+        "const vars = {\n"
+        f"{fields}\n"
+        "};\n\n"
+        "return [{\n"
+        "  json: {\n"
+        "    globals: vars,\n"
+        "    ...($json || {})\n"
+        "  }\n"
+        "}];\n"
+    )
+
+
+def render(engine, variant):
+    """``{node_id: jsCode}`` for one variant."""
+    wiring = vars_wiring() if variant.wiring == 'vars' else site_wiring(engine.keys)
+    # Wiring goes right after the header module; function declarations are hoisted
+    header, *rest = engine.modules
+    codes = {ENGINE_NODE: '\n\n'.join((header, wiring, *rest)) + '\n'}
+    if variant.wiring == 'vars':
+        codes[GLOBALS_NODE] = inject_globals_code(engine.keys)
+    return codes
+
+
+# -- release -----------------------------------------------------------------
+
+# Node script timing a cold compile of each code string (median of several runs).
+# A unique trailing comment defeats V8's compilation cache.
+COMPILE_TIMER = r"""
+const vm = require('vm');
+const codes = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const out = {};
+for (const [key, code] of Object.entries(codes)) new vm.Script('(async function () {\n' + code + '\n})//warm' + key);
+for (const [key, code] of Object.entries(codes)) {
+  const runs = [];
+  for (let i = 0; i < 25; i++) {
+    const src = '(async function () {\n' + code + '\n})//' + key + i;
+    const t = process.hrtime.bigint();
+    new vm.Script(src);
+    runs.push(Number(process.hrtime.bigint() - t) / 1e6);
+  }
+  runs.sort((a, b) => a - b);
+  out[key] = runs[Math.floor(runs.length / 2)];
+}
+process.stdout.write(JSON.stringify(out));
+"""
+
+
+def measure_compile_ms(codes):
+    """``{key: ms}`` to compile each Code node body with node, or None without node."""
+    node = shutil.which('node')
+    if not node or not codes:
+        return None
+    try:
+        proc = subprocess.run([node, '-e', COMPILE_TIMER], input=json.dumps(codes),
+                              capture_output=True, text=True, timeout=120, check=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return json.loads(proc.stdout)
+
+
+def release_codes(codes):
+    """Minify rendered node code for a release build."""
+    try:
+        engine_code, info = minify(codes[ENGINE_NODE], RELEASE_DEFINES)
+        minified = {node_id: minify(code)[0] for node_id, code in codes.items() if node_id != ENGINE_NODE}
+    except (MinifyError, JsSyntaxError) as e:
+        raise BuildError(f'release minify failed: {e}') from None
+    minified[ENGINE_NODE] = engine_code
+    return minified, info['removed_functions']
+
+
+# -- build -------------------------------------------------------------------
+
+@dataclass
+class BuildResult:
+    variant: Variant
+    status: str             # 'built' or 'cached'
+    version_id: str
+    dev_code: str = ''      # release builds only: engine code before/after minify
+    code: str = ''
+    dev_json: int = 0       # release builds only: workflow JSON bytes before/after
+    json: int = 0
+    removed: tuple = ()
+
+
+def _output_hash(workflow, node_ids):
+    return content_hash('\0'.join(workflow.code(n) if workflow.has_node(n) else '' for n in node_ids))
+
+
+def build_variant(engine, variant, root='.', force=False, dry_run=False, release=False):
+    """Build one variant into its workflow, or into ``dist/`` for a release build."""
+    source_path = Path(root) / variant.target
+    out_path = Path(root) / DIST_DIR / variant.target if release else source_path
+    workflow = Workflow.load(out_path if out_path.exists() else source_path)
+    workflow.path = out_path
+    if variant.wiring == 'vars' and not workflow.has_node(GLOBALS_NODE):
+        raise BuildError(f'{variant.target}: $vars variant needs an Inject Globals node ({GLOBALS_NODE})')
+    if variant.wiring == 'site' and workflow.has_node(GLOBALS_NODE):
+        raise BuildError(f'{variant.target}: Site_Registry variant must not have an Inject Globals node')
+
+    version_id = engine.version + variant.version_suffix
+    mode = 'release' if release else 'dev'
+    inputs = content_hash('\0'.join((BUILD_DIGEST, engine.digest, variant.wiring, version_id, mode)))
+    node_ids = (ENGINE_NODE, GLOBALS_NODE) if variant.wiring == 'vars' else (ENGINE_NODE,)
+    record = workflow.meta.get('engineBuild', {})
+    if (not force and record.get('inputs') == inputs
+            and record.get('output') == _output_hash(workflow, node_ids)):
+        return BuildResult(variant, 'cached', version_id)
+
+    codes = render(engine, variant)
+    result = BuildResult(variant, 'built', version_id)
+    if release:
+        for node_id, code in codes.items():
+            workflow.set_code(node_id, code)
+        result.dev_code = codes[ENGINE_NODE]
+        result.dev_json = len(workflow.dumps().encode('utf-8'))
+        codes, result.removed = release_codes(codes)
+        result.code = codes[ENGINE_NODE]
+    for node_id, code in codes.items():
+        workflow.set_code(node_id, code)
+    workflow.version_id = version_id
+    workflow.meta['engineBuild'] = {'inputs': inputs, 'output': _output_hash(workflow, node_ids)}
+    if release:
+        workflow.meta['engineBuild']['release'] = True
+        result.json = len(workflow.dumps().encode('utf-8'))
+    if not dry_run:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        workflow.save()
+    return result
+
+
+def _kb(size):
+    return f'{size / 1024:.1f} KB'
+
+
+def _saving(before, after):
+    return f'{_kb(before)} -> {_kb(after)} (-{100 * (before - after) / before:.0f}%)' if before else 'n/a'
+
+
+def report_release(results, log=print):
+    """Log byte and compile-time savings for each rebuilt release variant."""
+    built = [r for r in results if r.status == 'built']
+    timings = measure_compile_ms({
+        f'{r.variant.name}:{kind}': code
+        for r in built for kind, code in (('dev', r.dev_code), ('release', r.code))
+    })
+    for r in built:
+        log(f'    {r.variant.name}: engine {_saving(len(r.dev_code.encode()), len(r.code.encode()))}, '
+            f'workflow {_saving(r.dev_json, r.json)}')
+        if timings:
+            dev, rel = timings[f'{r.variant.name}:dev'], timings[f'{r.variant.name}:release']
+            log(f'    {r.variant.name}: compile {dev:.2f} ms -> {rel:.2f} ms (-{100 * (dev - rel) / dev:.0f}%)')
+        else:
+            log(f'    {r.variant.name}: compile time not measured (node not found)')
+        if r.removed:
+            log(f'    {r.variant.name}: dropped {", ".join(r.removed)}')
+
+
+def verify_results(engine, results, log=print):
+    """Check every rebuilt release engine against its bundled source."""
+    pairs = {
+        r.variant.name: (fold_flags(r.dev_code, RELEASE_DEFINES), r.code)
+        for r in results if r.status == 'built'
+    }
+    if not pairs:
+        return
+    try:
+        checked = verify_release(pairs, engine.keys)
+    except VerifyError as e:
+        raise BuildError(f'release verify failed: {e}') from None
+    for name, scenarios in checked.items():
+        log(f'    {name}: minified engine matches the bundle in {scenarios} scenario(s)')
+
+
+def build(variants=VARIANTS, root='.', force=False, dry_run=False, release=False, verify=False,
+          log=print):
+    """Bundle the engine once and build all variants in parallel.
+
+    Release builds minify in worker processes (the passes are CPU bound) and
+    write to ``dist/``; ``verify`` then compares each one with the bundle.
+    Returns ``{variant name: status}``.
+    """
+    engine = load_engine(root)
+    if release:
+        engine.keys  # tokenize once here instead of in every worker
+    executor = ProcessPoolExecutor if release else ThreadPoolExecutor
+    with executor(max_workers=max(1, len(variants))) as pool:
+        futures = [
+            pool.submit(build_variant, engine, variant, root, force, dry_run, release)
+            for variant in variants
+        ]
+        results = [future.result() for future in futures]
+    report = OrderedDict()
+    for result in results:
+        report[result.variant.name] = result.status
+        mark = '+' if result.status == 'built' else '='
+        where = f'{DIST_DIR}/{result.variant.target}' if release else result.variant.target
+        log(f'  {mark} {where}: {result.status} {result.version_id}')
+    if release:
+        report_release(results, log)
+    if verify:
+        verify_results(engine, results, log)
+    return report
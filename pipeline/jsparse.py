@@ -0,0 +1,357 @@
+"""
+Lightweight JavaScript tokenizer and top-level segmenter for Code node source.
+
+This is not a parser. It knows just enough JavaScript (strings, nested
+template literals, comments, regex literals, bracket depth) to split the
+Publisher engine into top-level segments:
+
+- ``function`` segments: ``[async] function name(...) { ... }`` at depth 0,
+  including the comment lines directly above the declaration
+- ``code`` segments: everything in between (config, top-level statements)
+
+Each function is addressable by name and can be replaced in O(segment).
+"""
+from dataclasses import dataclass
+
+PUNCT_3 = ('===', '!==', '**=', '...', '<<=', '>>=', '>>>', '&&=', '||=', '??=')
+PUNCT_2 = ('=>', '==', '!=', '<=', '>=', '&&', '||', '??', '?.', '++', '--',
+           '+=', '-=', '*=', '/=', '%=', '&=', '|=', '^=', '<<', '>>', '**')
+# After these keywords a `/` starts a regex literal, not a division
+REGEX_KEYWORDS = frozenset((
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+    'void', 'throw', 'instanceof', 'yield', 'await',
+))
+
+
+class JsSyntaxError(ValueError):
+    """Unterminated literal or unbalanced brackets."""
+
+
+@dataclass(frozen=True)
+class Token:
+    kind: str   # ws, comment, string, template, regex, name, number, punct
+    start: int
+    end: int
+    text: str
+
+
+def _name_char(ch):
+    return ch.isalnum() or ch in '_$'
+
+
+class _Scanner:
+    def __init__(self, src):
+        self.src = src
+        self.n = len(src)
+
+    def tokens(self, pos=0, stop_at_brace=False):
+        """Yield tokens from ``pos``. With ``stop_at_brace`` the scan ends at the
+        unmatched ``}`` closing a template substitution (not yielded)."""
+        src, n = self.src, self.n
+        prev = None  # last significant token
+        depth = 0
+        while pos < n:
+            ch = src[pos]
+            start = pos
+            if ch.isspace():
+                while pos < n and src[pos].isspace():
+                    pos += 1
+                yield Token('ws', start, pos, src[start:pos])
+                continue
+            if src.startswith('//', pos):
+                end = src.find('\n', pos)
+                pos = n if end < 0 else end
+                yield Token('comment', start, pos, src[start:pos])
+                continue
+            if src.startswith('/*', pos):
+                end = src.find('*/', pos + 2)
+                if end < 0:
+                    raise JsSyntaxError(f'unterminated block comment at {start}')
+                pos = end + 2
+                yield Token('comment', start, pos, src[start:pos])
+                continue
+            if ch in '"\'':
+                pos = self._skip_string(pos)
+                tok = Token('string', start, pos, src[start:pos])
+            elif ch == '`':
+                pos = self._skip_template(pos)
+                tok = Token('template', start, pos, src[start:pos])
+            elif ch == '/' and self._regex_allowed(prev):
+                pos = self._skip_regex(pos)
+                tok = Token('regex', start, pos, src[start:pos])
+            elif _name_char(ch) and not ch.isdigit():
+                while pos < n and _name_char(src[pos]):
+                    pos += 1
+                tok = Token('name', start, pos, src[start:pos])
+            elif ch.isdigit() or (ch == '.' and pos + 1 < n and src[pos + 1].isdigit()):
+                pos += 1
+                while pos < n and (_name_char(src[pos]) or src[pos] == '.'):
+                    pos += 1
+                tok = Token('number', start, pos, src[start:pos])
+            else:
+                for size, table in ((3, PUNCT_3), (2, PUNCT_2)):
+                    if src[pos:pos + size] in table:
+                        pos += size
+                        break
+                else:
+                    pos += 1
+                text = src[start:pos]
+                if text in ('{', '(', '['):
+                    depth += 1
+                elif text in ('}', ')', ']'):
+                    if stop_at_brace and depth == 0 and text == '}':
+                        return
+                    depth -= 1
+                tok = Token('punct', start, pos, text)
+            prev = tok
+            yield tok
+        if stop_at_brace:
+            raise JsSyntaxError('unterminated template substitution')
+
+    @staticmethod
+    def _regex_allowed(prev):
+        if prev is None:
+            return True
+        if prev.kind == 'punct':
+            return prev.text not in (')', ']')
+        if prev.kind == 'name':
+            return prev.text in REGEX_KEYWORDS
+        return False
+
+    def _skip_string(self, pos):
+        src, quote = self.src, self.src[pos]
+        pos += 1
+        while pos < self.n:
+            ch = src[pos]
+            if ch == '\\':
+                pos += 2
+                continue
+            if ch == quote:
+                return pos + 1
+            if ch == '\n':
+                break
+            pos += 1
+        raise JsSyntaxError(f'unterminated string literal at {pos}')
+
+    def _skip_template(self, pos):
+        src = self.src
+        pos += 1
+        while pos < self.n:
+            ch = src[pos]
+            if ch == '\\':
+                pos += 2
+                continue
+            if ch == '`':
+                return pos + 1
+            if src.startswith('${', pos):
+                end = pos + 2
+                for tok in self.tokens(pos + 2, stop_at_brace=True):
+                    end = tok.end
+                # tokens() stops right before the closing brace
+                close = src.index('}', end)
+                pos = close + 1
+                continue
+            pos += 1
+        raise JsSyntaxError('unterminated template literal')
+
+    def _skip_regex(self, pos):
+        src = self.src
+        pos += 1
+        in_class = False
+        while pos < self.n:
+            ch = src[pos]
+            if ch == '\\':
+                pos += 2
+                continue
+            if ch == '\n':
+                break
+            if in_class:
+                if ch == ']':
+                    in_class = False
+            elif ch == '[':
+                in_class = True
+            elif ch == '/':
+                pos += 1
+                while pos < self.n and _name_char(src[pos]):
+                    pos += 1
+                return pos
+            pos += 1
+        raise JsSyntaxError(f'unterminated regex literal at {pos}')
+
+
+def tokenize(src):
+    """All tokens of ``src``, including whitespace and comments."""
+    return list(_Scanner(src).tokens())
+
+
+def template_substitutions(src, tok):
+    """Token lists of each ``${...}`` substitution in template token ``tok``."""
+    scanner = _Scanner(src)
+    pos = tok.start + 1
+    while pos < tok.end - 1:
+        if src[pos] == '\\':
+            pos += 2
+            continue
+        if src.startswith('${', pos):
+            inner = list(scanner.tokens(pos + 2, stop_at_brace=True))
+            yield inner
+            pos = src.index('}', inner[-1].end if inner else pos + 2) + 1
+            continue
+        pos += 1
+
+
+def token_streams(src):
+    """The top-level token list of ``src`` followed by one list per template
+    substitution (recursively). Offsets are always relative to ``src``."""
+    streams = [tokenize(src)]
+    for stream in streams:
+        for tok in stream:
+            if tok.kind == 'template':
+                streams.extend(template_substitutions(src, tok))
+    return streams
+
+
+def walk_tokens(src):
+    """Every token of ``src``, including those inside template substitutions."""
+    for stream in token_streams(src):
+        yield from stream
+
+
+@dataclass
+class Segment:
+    kind: str   # 'function' or 'code'
+    name: str   # function name, or None for code segments
+    text: str
+
+
+def _leading_comment_start(src, decl_start):
+    """Start of the comment lines directly above a declaration (no blank line between)."""
+    line_start = src.rfind('\n', 0, decl_start) + 1
+    start = line_start
+    while start > 0:
+        prev_start = src.rfind('\n', 0, start - 1) + 1
+        line = src[prev_start:start - 1].strip()
+        if not line.startswith('//'):
+            break
+        start = prev_start
+    return start
+
+
+def split_segments(src):
+    """Split ``src`` into top-level function and code segments.
+
+    Joining the ``text`` of all segments always reproduces ``src`` exactly.
+    """
+    tokens = [t for t in tokenize(src) if t.kind not in ('ws', 'comment')]
+    functions = []  # (start, end, name)
+    depth = 0
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        if depth == 0 and tok.kind == 'name' and tok.text == 'function':
+            is_async = i > 0 and tokens[i - 1].text == 'async' and tokens[i - 1].kind == 'name'
+            decl_index = i - 1 if is_async else i
+            prev = tokens[decl_index - 1] if decl_index > 0 else None
+            statement_start = prev is None or prev.text in (';', '}')
+            name_tok = tokens[i + 1] if i + 1 < len(tokens) else None
+            if statement_start and name_tok is not None and name_tok.kind == 'name':
+                decl = tokens[decl_index]
+                j = i + 2
+                body_depth = 0
+                while j < len(tokens):
+                    t = tokens[j]
+                    if t.kind == 'punct' and t.text in ('{', '(', '['):
+                        body_depth += 1
+                    elif t.kind == 'punct' and t.text in ('}', ')', ']'):
+                        body_depth -= 1
+                        if body_depth == 0 and t.text == '}':
+                            break
+                    j += 1
+                else:
+                    raise JsSyntaxError(f'unbalanced braces in function {name_tok.text}')
+                start = _leading_comment_start(src, decl.start)
+                if functions and start < functions[-1][1]:
+                    start = decl.start
+                functions.append((start, tokens[j].end, name_tok.text))
+                i = j + 1
+                continue
+        if tok.kind == 'punct':
+            if tok.text in ('{', '(', '['):
+                depth += 1
+            elif tok.text in ('}', ')', ']'):
+                depth -= 1
+                if depth < 0:
+                    raise JsSyntaxError(f'unbalanced {tok.text!r} at {tok.start}')
+        i += 1
+    if depth != 0:
+        raise JsSyntaxError('unbalanced brackets at end of source')
+
+    segments = []
+    pos = 0
+    for start, end, name in functions:
+        if start > pos:
+            segments.append(Segment('code', None, src[pos:start]))
+        segments.append(Segment('function', name, src[start:end]))
+        pos = end
+    if pos < len(src):
+        segments.append(Segment('code', None, src[pos:]))
+    return segments
+
+
+class JsSource:
+    """Code node source split into addressable top-level segments."""
+
+    def __init__(self, src):
+        self.segments = split_segments(src)
+        self._reindex()
+
+    def _reindex(self):
+        self._index = {}
+        for i, seg in enumerate(self.segments):
+            if seg.kind == 'function':
+                if seg.name in self._index:
+                    raise JsSyntaxError(f'duplicate top-level function {seg.name}')
+                self._index[seg.name] = i
+
+    @property
+    def text(self):
+        return ''.join(seg.text for seg in self.segments)
+
+    @property
+    def function_names(self):
+        return [seg.name for seg in self.segments if seg.kind == 'function']
+
+    def has_function(self, name):
+        return name in self._index
+
+    def function(self, name):
+        try:
+            return self.segments[self._index[name]].text
+        except KeyError:
+            raise KeyError(f'no top-level function {name!r}') from None
+
+    @staticmethod
+    def _single_function(name, text):
+        parsed = split_segments(text)
+        funcs = [s for s in parsed if s.kind == 'function']
+        if len(funcs) != 1 or funcs[0].name != name or any(s.text.strip() for s in parsed if s.kind == 'code'):
+            raise JsSyntaxError(f'replacement for {name} must be exactly one function declaration named {name}')
+
+    def replace_function(self, name, text):
+        """Replace one function segment; only the new segment is tokenized."""
+        self._single_function(name, text)
+        self.segments[self._index[name]] = Segment('function', name, text)
+
+    def insert_function(self, name, text, after):
+        """Insert a new top-level function right after function ``after``."""
+        if name in self._index:
+            raise JsSyntaxError(f'function {name} already exists')
+        self._single_function(name, text)
+        i = self._index[after] + 1
+        self.segments[i:i] = [Segment('code', None, '\n\n'), Segment('function', name, text)]
+        self._reindex()
+
+    def remove_function(self, name):
+        i = self._index[name]
+        del self.segments[i]
+        self._reindex()
@@ -0,0 +1,419 @@
+"""
+Release minifier for the Publisher engine.
+
+Works on the ``pipeline.jsparse`` token stream, never on raw text, so string
+and template literals (the prompts) are copied byte-for-byte. Passes, in order:
+
+1. ``fold_flags``: build flags (``const NAME = true;``) are replaced by their
+   release value; ``if (NAME) {...}`` blocks and ``NAME ? a : b`` are folded
+2. ``drop_unused_functions``: top-level functions no longer reachable from
+   top-level code are removed
+3. ``rename_identifiers``: names declared in the engine get short names;
+   property names, object keys and undeclared globals are left alone
+4. ``compact``: comments and whitespace are removed, keeping a newline only
+   where automatic semicolon insertion could depend on it
+
+``compact`` re-tokenizes its output and checks that the token sequence is
+unchanged, so a whitespace bug can't silently change the program.
+"""
+from collections import Counter
+
+from pipeline.jsparse import JsSource, split_segments, token_streams, tokenize
+from pipeline.jsparse import _name_char
+
+KEYWORDS = frozenset((
+    'await', 'break', 'case', 'catch', 'class', 'const', 'continue', 'debugger',
+    'default', 'delete', 'do', 'else', 'enum', 'export', 'extends', 'false',
+    'finally', 'for', 'function', 'if', 'import', 'in', 'instanceof', 'let',
+    'new', 'null', 'of', 'return', 'super', 'switch', 'this', 'throw', 'true',
+    'try', 'typeof', 'var', 'void', 'while', 'with', 'yield', 'async', 'get',
+    'set', 'static', 'undefined', 'arguments', 'eval', 'NaN', 'Infinity',
+))
+# Never renamed, even if the engine happens to declare a local with the same name
+GLOBALS = frozenset((
+    'Array', 'Boolean', 'Buffer', 'Date', 'Error', 'JSON', 'Map', 'Math',
+    'Number', 'Object', 'Promise', 'RegExp', 'Set', 'String', 'Symbol', 'URL',
+    'URLSearchParams', 'clearTimeout', 'console', 'decodeURIComponent',
+    'encodeURIComponent', 'fetch', 'isNaN', 'items', 'module', 'parseFloat',
+    'parseInt', 'process', 'require', 'setTimeout',
+))
+# `{` after these starts a block, after anything else an object literal/pattern
+BLOCK_AFTER_PUNCT = frozenset((')', ']', '}', ';', '=>'))
+BLOCK_AFTER_NAME = frozenset(('else', 'try', 'finally', 'do'))
+# A newline after these may end a statement (restricted productions or ASI)
+RESTRICTED = frozenset(('return', 'throw', 'break', 'continue', 'yield'))
+NON_STARTING_NAMES = frozenset(('in', 'of', 'instanceof'))
+
+
+class MinifyError(ValueError):
+    """The engine uses a construct the minifier can't transform safely."""
+
+
+def _significant(tokens):
+    return [t for t in tokens if t.kind not in ('ws', 'comment')]
+
+
+def _apply_edits(src, edits):
+    out = []
+    pos = 0
+    for start, end, text in sorted(edits):
+        if start < pos:
+            raise MinifyError(f'overlapping edits at {start}')
+        out.append(src[pos:start])
+        out.append(text)
+        pos = end
+    out.append(src[pos:])
+    return ''.join(out)
+
+
+def _match(tokens, i):
+    """Index of the bracket closing ``tokens[i]``."""
+    depth = 0
+    for j in range(i, len(tokens)):
+        text = tokens[j].text if tokens[j].kind == 'punct' else ''
+        if text in ('{', '(', '['):
+            depth += 1
+        elif text in ('}', ')', ']'):
+            depth -= 1
+            if depth == 0:
+                return j
+    raise MinifyError(f'unbalanced bracket at {tokens[i].start}')
+
+
+# -- 1. build flags ----------------------------------------------------------
+
+def _fold_once(src, name, value):
+    """Fold one occurrence of flag ``name``. Returns the new source or None."""
+    toks = _significant(tokenize(src))
+    for i, tok in enumerate(toks):
+        if tok.kind != 'name' or tok.text != name or (i and toks[i - 1].text in ('.', '?.')):
+            continue
+        prev = toks[i - 1] if i else None
+        # const NAME = literal;
+        if prev is not None and prev.text == 'const':
+            end = i + 3
+            if end >= len(toks) or toks[end].text != ';':
+                raise MinifyError(f'build flag {name} must be declared as `const {name} = literal;`')
+            stop = src.find('\n', toks[end].end)
+            return src[:prev.start] + src[(len(src) if stop < 0 else stop + 1):]
+        # if (NAME) { ... } [else { ... }]   /   if (!NAME) ...
+        negated = prev is not None and prev.text == '!'
+        open_i = i - 2 if negated else i - 1
+        if (open_i >= 1 and toks[open_i].text == '(' and toks[open_i - 1].text == 'if'
+                and toks[i + 1].text == ')'):
+            if toks[i + 2].text != '{':
+                raise MinifyError(f'`if ({name})` needs a braced block to be folded')
+            then_end = _match(toks, i + 2)
+            keep = toks[i + 2].start, toks[then_end].end
+            drop_end = toks[then_end].end
+            if then_end + 1 < len(toks) and toks[then_end + 1].text == 'else':
+                if toks[then_end + 2].text != '{':
+                    raise MinifyError(f'`if ({name}) ... else` needs a braced else block')
+                else_end = _match(toks, then_end + 2)
+                other = toks[then_end + 2].start, toks[else_end].end
+                drop_end = toks[else_end].end
+            else:
+                other = None
+            if value != negated:
+                body = src[keep[0]:keep[1]]
+            else:
+                body = src[other[0]:other[1]] if other else ''
+            return src[:toks[open_i - 1].start] + body + src[drop_end:]
+        # NAME ? a : b   (a and b without nested ternaries)
+        if toks[i + 1].text == '?':
+            start = prev.start if negated else tok.start
+            value = value != negated
+            depth = 0
+            colon = end = None
+            for j in range(i + 2, len(toks)):
+                text = toks[j].text if toks[j].kind == 'punct' else ''
+                if text in ('(', '[', '{'):
+                    depth += 1
+                elif text in (')', ']', '}'):
+                    if depth == 0:
+                        end = j
+                        break
+                    depth -= 1
+                elif depth == 0 and text == '?':
+                    raise MinifyError(f'nested ternary after build flag {name}')
+                elif depth == 0 and text == ':' and colon is None:
+                    colon = j
+                elif depth == 0 and text in (',', ';'):
+                    end = j
+                    break
+            if colon is None or end is None:
+                raise MinifyError(f'could not fold `{name} ? ... : ...`')
+            if value:
+                body = src[toks[i + 2].start:toks[colon - 1].end]
+            else:
+                body = src[toks[colon + 1].start:toks[end - 1].end]
+            return src[:start] + body + src[toks[end - 1].end:]
+        raise MinifyError(f'build flag {name} is used in a form that cannot be folded (at {tok.start})')
+    return None
+
+
+def fold_flags(src, defines):
+    """Replace each build flag in ``defines`` by its value and fold the code it guards."""
+    for name, value in defines.items():
+        folded = 0
+        while True:
+            result = _fold_once(src, name, bool(value))
+            if result is None:
+                break
+            src = result
+            folded += 1
+        if not folded:
+            raise MinifyError(f'build flag {name} is not used by the engine')
+    return src
+
+
+# -- 2. dead functions -------------------------------------------------------
+
+def _referenced_names(text):
+    names = set()
+    for stream in token_streams(text):
+        toks = _significant(stream)
+        for i, tok in enumerate(toks):
+            if tok.kind == 'name' and not (i and toks[i - 1].text in ('.', '?.')):
+                names.add(tok.text)
+    return names
+
+
+def drop_unused_functions(src):
+    """Remove top-level functions that top-level code can't reach.
+
+    Returns ``(src, [removed names])``.
+    """
+    segments = split_segments(src)
+    functions = {seg.name: seg for seg in segments if seg.kind == 'function'}
+    refs = {name: _referenced_names(seg.text) - {name} for name, seg in functions.items()}
+    live = set()
+    pending = set()
+    for seg in segments:
+        if seg.kind == 'code':
+            pending |= _referenced_names(seg.text) & functions.keys()
+    while pending:
+        name = pending.pop()
+        if name in live:
+            continue
+        live.add(name)
+        pending |= (refs[name] & functions.keys()) - live
+    removed = [name for name in functions if name not in live]
+    source = JsSource(src)
+    for name in removed:
+        source.remove_function(name)
+    return source.text, removed
+
+
+# -- 3. identifiers ----------------------------------------------------------
+
+def _classify(toks):
+    """Yield ``(index, role)`` for every name token: 'var', 'prop', 'key' or 'shorthand'."""
+    stack = []          # 'object', 'block', '(' or '['
+    ternary = [0]       # pending `?` per bracket level
+    for i, tok in enumerate(toks):
+        prev = toks[i - 1] if i else None
+        if tok.kind == 'punct':
+            text = tok.text
+            if text == '{':
+                if prev is None:
+                    kind = 'object'        # only pattern slices start with a brace
+                elif prev.kind == 'punct':
+                    if prev.text == ':' and stack and stack[-1] == 'block' and not ternary[-1]:
+                        kind = 'block'     # label or `case x: {`
+                    else:
+                        kind = 'block' if prev.text in BLOCK_AFTER_PUNCT else 'object'
+                elif prev.kind == 'name':
+                    kind = 'block' if prev.text in BLOCK_AFTER_NAME or prev.text not in KEYWORDS else 'object'
+                else:
+                    kind = 'block'
+                stack.append(kind)
+                ternary.append(0)
+            elif text in ('(', '['):
+                stack.append(text)
+                ternary.append(0)
+            elif text in ('}', ')', ']'):
+                if stack:
+                    stack.pop()
+                    ternary.pop()
+            elif text == '?':
+                ternary[-1] += 1
+            elif text == ':' and ternary[-1]:
+                ternary[-1] -= 1
+            continue
+        if tok.kind != 'name' or tok.text in KEYWORDS:
+            continue
+        if prev is not None and prev.text in ('.', '?.'):
+            yield i, 'prop'
+            continue
+        nxt = toks[i + 1].text if i + 1 < len(toks) else ''
+        if stack and stack[-1] == 'object' and prev is not None and prev.text in ('{', ','):
+            if nxt == ':' or nxt == '(':
+                yield i, 'key'
+                continue
+            if nxt in (',', '}', '='):
+                yield i, 'shorthand'
+                continue
+        # `get x()`, `async x()` are methods; `key: async x => ...` is a parameter
+        if stack and stack[-1] == 'object' and prev is not None and prev.text in ('get', 'set', 'async') and nxt == '(':
+            yield i, 'key'
+            continue
+        yield i, 'var'
+
+
+def _declared_names(toks):
+    """Names bound by let/const/var, function declarations, parameters and catch."""
+    declared = set()
+
+    def bind_range(start, end):
+        for i, role in _classify(toks[start:end]):
+            tok = toks[start + i]
+            if role in ('var', 'shorthand'):
+                declared.add(tok.text)
+
+    for i, tok in enumerate(toks):
+        nxt = toks[i + 1] if i + 1 < len(toks) else None
+        if nxt is None:
+            break
+        if tok.text in ('let', 'const', 'var') and tok.kind == 'name':
+            if nxt.kind == 'name':
+                declared.add(nxt.text)
+            elif nxt.text in ('{', '['):
+                bind_range(i + 1, _match(toks, i + 1) + 1)
+        elif tok.text == 'function' and tok.kind == 'name':
+            j = i + 1
+            if nxt.kind == 'name':
+                declared.add(nxt.text)
+                j += 1
+            if j < len(toks) and toks[j].text == '(':
+                bind_range(j + 1, _match(toks, j))
+        elif tok.text == 'catch' and nxt.text == '(':
+            bind_range(i + 2, _match(toks, i + 1))
+        elif tok.text == '=>':
+            prev = toks[i - 1]
+            if prev.kind == 'name':
+                declared.add(prev.text)
+            elif prev.text == ')':
+                depth = 0
+                for j in range(i - 1, -1, -1):
+                    if toks[j].text == ')':
+                        depth += 1
+                    elif toks[j].text == '(':
+                        depth -= 1
+                        if depth == 0:
+                            bind_range(j + 1, i - 1)
+                            break
+    return declared
+
+
+def _short_names(taken):
+    alphabet = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    size = 1
+    while True:
+        for n in range(len(alphabet) ** size):
+            name = ''
+            for _ in range(size):
+                n, r = divmod(n, len(alphabet))
+                name = alphabet[r] + name
+            if name not in taken and name not in KEYWORDS:
+                yield name
+        size += 1
+
+
+def rename_identifiers(src):
+    """Give every name the engine declares a short name, consistently across scopes.
+
+    Renaming is by name, not by binding: all variable-position occurrences of
+    a declared name are renamed together, which preserves shadowing.
+    """
+    streams = [_significant(s) for s in token_streams(src)]
+    declared = set()
+    used = Counter()
+    every_name = set()
+    for toks in streams:
+        declared |= _declared_names(toks)
+        for i, role in _classify(toks):
+            every_name.add(toks[i].text)
+            if role in ('var', 'shorthand'):
+                used[toks[i].text] += 1
+    candidates = [n for n in declared if n not in GLOBALS and not n.startswith('$')]
+    candidates.sort(key=lambda n: (-used[n], n))
+    mapping = {}
+    fresh = _short_names(every_name | KEYWORDS)
+    for name in candidates:
+        short = next(fresh)
+        if len(short) < len(name):
+            mapping[name] = short
+    edits = []
+    for toks in streams:
+        for i, role in _classify(toks):
+            tok = toks[i]
+            new = mapping.get(tok.text)
+            if new is None or role in ('prop', 'key'):
+                continue
+            text = f'{tok.text}: {new}' if role == 'shorthand' else new
+            edits.append((tok.start, tok.end, text))
+    return _apply_edits(src, edits), mapping
+
+
+# -- 4. whitespace -----------------------------------------------------------
+
+def _ends_statement(tok):
+    if tok.kind in ('name', 'number', 'string', 'template', 'regex'):
+        return True
+    return tok.text in (')', ']', '}', '++', '--')
+
+
+def _starts_statement(tok):
+    if tok.kind == 'name':
+        return tok.text not in NON_STARTING_NAMES
+    if tok.kind in ('number', 'string', 'regex'):
+        return True
+    return tok.text in ('{', '!', '~', '++', '--')
+
+
+def _needs_space(prev, tok):
+    a, b = prev.text[-1], tok.text[0]
+    if _name_char(a) and _name_char(b):
+        return True
+    if a in '+-' and b in '+-':
+        return True
+    if prev.kind == 'number' and b == '.':
+        return True
+    return a == '/' and b in '/*'
+
+
+def compact(src):
+    """Drop comments and whitespace that the token stream doesn't depend on."""
+    tokens = tokenize(src)
+    out = []
+    prev = None
+    newline = False
+    for tok in tokens:
+        if tok.kind in ('ws', 'comment'):
+            newline = newline or '\n' in tok.text or tok.text.startswith('//')
+            continue
+        if prev is not None:
+            if newline and (prev.text in RESTRICTED or tok.text in ('++', '--')
+                            or (_ends_statement(prev) and _starts_statement(tok))):
+                out.append('\n')
+            elif _needs_space(prev, tok):
+                out.append(' ')
+        out.append(tok.text)
+        prev = tok
+        newline = False
+    result = ''.join(out)
+    before = [t.text for t in _significant(tokens)]
+    after = [t.text for t in _significant(tokenize(result))]
+    if before != after:
+        raise MinifyError('compacting changed the token stream')
+    return result
+
+
+def minify(src, defines=None):
+    """Run all passes. Returns ``(code, info)`` with the removed functions and renames."""
+    if defines:
+        src = fold_flags(src, defines)
+    src, removed = drop_unused_functions(src)
+    src, mapping = rename_identifiers(src)
+    return compact(src), {'removed_functions': removed, 'renamed': len(mapping)}
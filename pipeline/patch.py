@@ -0,0 +1,176 @@
+"""
+Patch primitives.
+
+A ``Patch`` is one release step against one workflow file: an ordered tuple of
+edits plus the ``versionId`` the workflow carries once it is applied. Every
+edit contributes a fingerprint to the patch's content hash, which the runner
+records in the workflow's ``meta.appliedPatches``.
+
+Unlike the old ``code.replace()`` scripts, an edit whose anchor is missing is
+a hard ``PatchError`` instead of a silent no-op. The engine Code node is
+bundled from ``engine/`` by ``pipeline.build`` and is not patched any more;
+patches edit the other workflows (Scheduler, Cleanup). For their Code nodes
+prefer ``ReplaceFunction``/``InsertFunction`` once a node has top-level
+functions: they address a function by name through ``pipeline.jsparse``
+instead of anchoring on a whole-buffer substring. ``check_primitives()``
+runs before every ``python -m pipeline patch`` and fails if a missing or
+drifted function stops being a hard error.
+"""
+import inspect
+from dataclasses import dataclass, field
+
+from pipeline.jsparse import JsSyntaxError
+from pipeline.workflow import Workflow, content_hash
+
+
+class PatchError(Exception):
+    """A patch could not be applied exactly as written."""
+
+
+@dataclass(frozen=True)
+class Replace:
+    """Replace an exact snippet in a Code node's ``jsCode``."""
+    node: str
+    old: str
+    new: str
+    count: int = 1
+
+    def apply(self, workflow):
+        code = workflow.code(self.node)
+        found = code.count(self.old)
+        if found != self.count:
+            snippet = self.old.strip().splitlines()[0][:80] if self.old.strip() else repr(self.old)
+            raise PatchError(
+                f'{workflow.path} [{self.node}]: expected {self.count} match(es) '
+                f'for anchor {snippet!r}, found {found}'
+            )
+        workflow.set_code(self.node, code.replace(self.old, self.new))
+
+    def fingerprint(self):
+        return '\0'.join(('replace', self.node, self.old, self.new, str(self.count)))
+
+
+@dataclass(frozen=True)
+class ReplaceFunction:
+    """Replace a top-level function (with its leading comment) by name.
+
+    When ``old`` is given the current segment must match it exactly, so a
+    drifted function fails instead of being overwritten blindly.
+    """
+    node: str
+    name: str
+    new: str
+    old: str = None
+
+    def apply(self, workflow):
+        source = workflow.source(self.node)
+        where = f'{workflow.path} [{self.node}]'
+        if not source.has_function(self.name):
+            raise PatchError(f'{where}: no top-level function {self.name}')
+        if self.old is not None and source.function(self.name) != self.old:
+            raise PatchError(f'{where}: function {self.name} drifted from the expected source')
+        try:
+            source.replace_function(self.name, self.new)
+        except JsSyntaxError as e:
+            raise PatchError(f'{where}: {e}') from None
+        workflow.set_code(self.node, source.text, source=source)
+
+    def fingerprint(self):
+        return '\0'.join(('function', self.node, self.name, self.old or '', self.new))
+
+
+@dataclass(frozen=True)
+class InsertFunction:
+    """Add a new top-level function directly after an existing one."""
+    node: str
+    name: str
+    new: str
+    after: str
+
+    def apply(self, workflow):
+        source = workflow.source(self.node)
+        where = f'{workflow.path} [{self.node}]'
+        if not source.has_function(self.after):
+            raise PatchError(f'{where}: no top-level function {self.after} to insert after')
+        try:
+            source.insert_function(self.name, self.new, after=self.after)
+        except JsSyntaxError as e:
+            raise PatchError(f'{where}: {e}') from None
+        workflow.set_code(self.node, source.text, source=source)
+
+    def fingerprint(self):
+        return '\0'.join(('insert', self.node, self.name, self.after, self.new))
+
+
+@dataclass(frozen=True)
+class Transform:
+    """Arbitrary structural change (node columns, new nodes, connections).
+
+    ``func`` receives the ``Workflow`` and mutates it in place. Its source is
+    part of the fingerprint, so editing the function invalidates the record.
+    """
+    func: object
+
+    def apply(self, workflow):
+        self.func(workflow)
+
+    def fingerprint(self):
+        return '\0'.join(('transform', self.func.__name__, inspect.getsource(self.func)))
+
+
+@dataclass(frozen=True)
+class Patch:
+    id: str
+    target: str
+    edits: tuple = field(default_factory=tuple)
+    version_id: str = None
+
+    @property
+    def digest(self):
+        parts = [self.id, self.target, self.version_id or '']
+        parts.extend(edit.fingerprint() for edit in self.edits)
+        return content_hash('\0\0'.join(parts))
+
+    def apply(self, workflow):
+        for edit in self.edits:
+            edit.apply(workflow)
+        if self.version_id:
+            workflow.version_id = self.version_id
+
+
+_CHECK_CODE = """// Doubles a number
+function double(n) {
+  return n * 2;
+}
+
+return [{ json: { value: double(2) } }];
+"""
+
+
+def check_primitives():
+    """Apply the function edits to a throwaway Code node.
+
+    A missing function and a drifted ``old`` must raise ``PatchError``; a
+    matching ``old`` must apply. Raises ``PatchError`` if any of that breaks.
+    """
+    def fresh():
+        node = {'id': 'check-001', 'parameters': {'jsCode': _CHECK_CODE}}
+        return Workflow('<self-check>', {'nodes': [node]}, '')
+
+    current = fresh().source('check-001').function('double')
+    new = current.replace('n * 2', 'n + n')
+    refused = (
+        ReplaceFunction('check-001', 'triple', new.replace('double', 'triple')),
+        ReplaceFunction('check-001', 'double', new, old=current.replace('n * 2', 'n * 3')),
+        InsertFunction('check-001', 'half', 'function half(n) {\n  return n / 2;\n}\n', after='triple'),
+    )
+    for edit in refused:
+        try:
+            edit.apply(fresh())
+        except PatchError:
+            continue
+        raise PatchError(f'self-check: {type(edit).__name__} {edit.name} applied instead of failing')
+    workflow = fresh()
+    ReplaceFunction('check-001', 'double', new, old=current).apply(workflow)
+    if 'n + n' not in workflow.code('check-001'):
+        raise PatchError('self-check: ReplaceFunction double did not replace the function')
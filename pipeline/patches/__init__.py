@@ -0,0 +1,46 @@
+"""
+Ordered release patch set.
+
+Append new patches at the end of ``PATCHES``; never edit a patch that has
+already shipped, because its content hash is recorded in the target
+workflow's ``meta.appliedPatches`` and a changed hash is a hard error.
+"""
+from pipeline.patches import (
+    cleanup_requeue,
+    scheduler_v2_4,
+    scheduler_v2_6,
+    v2_37,
+    v2_38,
+    v2_39,
+    v2_40,
+    v2_41,
+    v2_42,
+    v2_43,
+    v2_44,
+    v2_45,
+    v2_45_globals,
+    v2_46,
+    v2_46_telegram,
+    v2_48,
+    v2_49,
+)
+
+PATCHES = [
+    scheduler_v2_4.PATCH,
+    scheduler_v2_6.PATCH,
+    v2_37.PATCH,
+    v2_38.PATCH,
+    v2_39.PATCH,
+    v2_40.PATCH,
+    v2_41.PATCH,
+    v2_42.PATCH,
+    v2_43.PATCH,
+    v2_44.PATCH,
+    v2_45.PATCH,
+    v2_45_globals.PATCH,
+    v2_46.PATCH,
+    v2_46_telegram.PATCH,
+    cleanup_requeue.PATCH,
+    v2_48.PATCH,
+    v2_49.PATCH,
+]
@@ -0,0 +1,32 @@
+"""Cleanup: reset stuck topics to QUEUED instead of FAILED
+
+Stuck PROCESSING locks are usually a crashed execution, not a bad topic, so
+they go back into the queue with the error cleared.
+"""
+from pipeline.patch import Patch, PatchError, Transform
+
+
+def requeue_stuck_topics(workflow):
+    node = workflow.node('reset-stuck-001')
+    columns = node['parameters']['columns']['value']
+    if columns.get('status') != 'FAILED':
+        raise PatchError(f"{workflow.path} [reset-stuck-001]: expected status FAILED, found {columns.get('status')!r}")
+    columns['status'] = 'QUEUED'
+    columns['error'] = ''
+    old_name = node['name']
+    node['name'] = 'Reset to QUEUED'
+    connections = workflow.data['connections']
+    if old_name in connections:
+        connections['Reset to QUEUED'] = connections.pop(old_name)
+    for outputs in connections.values():
+        for branch in outputs.get('main', []):
+            for link in branch:
+                if link['node'] == old_name:
+                    link['node'] = 'Reset to QUEUED'
+
+
+PATCH = Patch(
+    id='cleanup-requeue',
+    target='v2/3_Cleanup.json',
+    edits=(Transform(requeue_stuck_topics),),
+)
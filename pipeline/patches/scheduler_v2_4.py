@@ -0,0 +1,50 @@
+"""Master Scheduler v2.4: match sheet updates on row_number instead of site_id
+
+row_number is added by the Google Sheets read node and is always accurate,
+so Update Site last_posted_at, Mark Topic DONE and Mark Topic FAILED all
+match on it.
+"""
+from pipeline.patch import Patch, Transform
+
+
+def _column(name, type_='string', match=False):
+    return {'id': name, 'displayName': name, 'type': type_, 'canBeUsedToMatch': match}
+
+
+def _columns(value):
+    return {
+        'mappingMode': 'defineBelow',
+        'value': value,
+        'matchingColumns': ['row_number'],
+        'schema': [_column('row_number', 'number', True)] + [_column(k) for k in value if k != 'row_number'],
+    }
+
+
+def match_on_row_number(workflow):
+    workflow.node('update-site-001')['parameters']['columns'] = _columns({
+        'row_number': '={{ $json.site?.row_number || $json.site_config?.row_number }}',
+        'last_posted_at': '={{ $now.toISO() }}',
+    })
+    workflow.node('mark-done-001')['parameters']['columns'] = _columns({
+        'row_number': '={{ $json.topicRow?.row_number }}',
+        'status': 'DONE',
+        'post_id': '={{ $json.post_id }}',
+        'post_url': '={{ $json.post_url }}',
+        'error': '',
+        'locked_at': '',
+        'updated_at': '={{ $now.toISO() }}',
+    })
+    workflow.node('mark-failed-001')['parameters']['columns'] = _columns({
+        'row_number': '={{ $json.topicRow?.row_number }}',
+        'status': 'FAILED',
+        'error': "={{ $json.error || $json.failed_at_step || 'Unknown error' }}",
+        'locked_at': '',
+    })
+
+
+PATCH = Patch(
+    id='scheduler-v2.4',
+    target='v2/1_Master_Scheduler.json',
+    version_id='v2.4-fix-updates',
+    edits=(Transform(match_on_row_number),),
+)
@@ -0,0 +1,51 @@
+"""Master Scheduler v2.6: Preserve Data node between Mark Topic DONE and Update Site last_posted_at
+
+The Google Sheets node overwrites $json with its response, losing the
+original Publisher data.
+"""
+from pipeline.patch import Patch, Transform
+
+PRESERVE_CODE = """/**
+ * Preserve Publisher Data - Google Sheets node overwrites $json
+ * We need to pass the original Publisher output to Update Site last_posted_at
+ */
+const publisherOutput = $('Execute Publisher').first().json;
+
+return [{
+  json: {
+    site_row_number: publisherOutput.site?.row_number || publisherOutput.site_config?.row_number,
+    site_id: publisherOutput.site?.site_id || publisherOutput.site_config?.site_id,
+    post_id: publisherOutput.post_id,
+    post_url: publisherOutput.post_url,
+    ok: publisherOutput.ok
+  }
+}];
+"""
+
+
+def add_preserve_node(workflow):
+    update_site = workflow.node('update-site-001')
+    workflow.add_node({
+        'parameters': {'jsCode': PRESERVE_CODE},
+        'id': 'preserve-data-001',
+        'name': 'Preserve Publisher Data',
+        'type': 'n8n-nodes-base.code',
+        'typeVersion': 2,
+        'position': [update_site['position'][0] - 110, update_site['position'][1]],
+    })
+    connections = workflow.data['connections']
+    connections['Mark Topic DONE'] = {
+        'main': [[{'node': 'Preserve Publisher Data', 'type': 'main', 'index': 0}]]
+    }
+    connections['Preserve Publisher Data'] = {
+        'main': [[{'node': 'Update Site last_posted_at', 'type': 'main', 'index': 0}]]
+    }
+    update_site['parameters']['columns']['value']['row_number'] = '={{ $json.site_row_number }}'
+
+
+PATCH = Patch(
+    id='scheduler-v2.6',
+    target='v2/1_Master_Scheduler.json',
+    version_id='v2.6-preserve-data',
+    edits=(Transform(add_preserve_node),),
+)
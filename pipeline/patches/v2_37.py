@@ -0,0 +1,72 @@
+"""Fix v2.37 updates:
+1. Fix NaN bug for internal_links_count and external_links_count empty strings
+2. Change YouTube embed format to use iframe (more reliable than oEmbed URL)
+"""
+from pipeline.patch import Patch, Replace
+
+OLD_EMBED_1 = '''const embedBlock = `<figure class="wp-block-embed is-type-video is-provider-youtube wp-block-embed-youtube wp-embed-aspect-16-9 wp-has-aspect-ratio"><div class="wp-block-embed__wrapper">
+https://www.youtube.com/watch?v=${video.videoId}
+</div><figcaption>${video.title}</figcaption></figure>`;'''
+
+NEW_EMBED_1 = '''const embedBlock = `<figure class="wp-block-embed is-type-video is-provider-youtube wp-block-embed-youtube wp-embed-aspect-16-9 wp-has-aspect-ratio"><div class="wp-block-embed__wrapper">
+<iframe width="560" height="315" src="https://www.youtube.com/embed/${video.videoId}" title="${video.title}" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" allowfullscreen></iframe>
+</div><figcaption>${video.title}</figcaption></figure>`;'''
+
+OLD_EMBED_2 = '''const embedBlock = `
+
+<figure class="wp-block-embed is-type-video is-provider-youtube wp-block-embed-youtube wp-embed-aspect-16-9 wp-has-aspect-ratio"><div class="wp-block-embed__wrapper">
+https://www.youtube.com/watch?v=${video.videoId}
+</div><figcaption>${video.title}</figcaption></figure>
+
+`;'''
+
+NEW_EMBED_2 = '''const embedBlock = `
+
+<figure class="wp-block-embed is-type-video is-provider-youtube wp-block-embed-youtube wp-embed-aspect-16-9 wp-has-aspect-ratio"><div class="wp-block-embed__wrapper">
+<iframe width="560" height="315" src="https://www.youtube.com/embed/${video.videoId}" title="${video.title}" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" allowfullscreen></iframe>
+</div><figcaption>${video.title}</figcaption></figure>
+
+`;'''
+
+OLD_CHANGELOG = """* v2.30 Changes:
+ * - SEO: New plugin endpoint /n8n/v1/update-seo-meta for direct meta updates
+ * - SEO: Shows which SEO plugins are detected (Yoast/RankMath)
+ * - SEO: Uses update_post_meta() directly (bypasses REST API schema restrictions)"""
+
+NEW_CHANGELOG = """* v2.37 Changes:
+ * - FIX: Empty string handling for internal_links_count/external_links_count (was causing NaN)
+ * - YouTube: Use iframe embed instead of oEmbed URL (more reliable rendering)
+ * 
+ * v2.36 Changes:
+ * - YouTube/Images placed by AI using placeholder comments
+ * 
+ * v2.30 Changes:
+ * - SEO: New plugin endpoint /n8n/v1/update-seo-meta for direct meta updates
+ * - SEO: Shows which SEO plugins are detected (Yoast/RankMath)
+ * - SEO: Uses update_post_meta() directly (bypasses REST API schema restrictions)"""
+
+PATCH = Patch(
+    id='v2.37',
+    target='v2/2_Publisher.json',
+    version_id='v2.37-iframe-youtube',
+    edits=(
+        Replace(
+            'engine-001',
+            "return site.internal_links_count !== undefined ? parseInt(site.internal_links_count) : 3;",
+            "return site.internal_links_count !== undefined && site.internal_links_count !== '' ? parseInt(site.internal_links_count) : 3;",
+        ),
+        Replace(
+            'engine-001',
+            "return site.external_links_count !== undefined ? parseInt(site.external_links_count) : 5;",
+            "return site.external_links_count !== undefined && site.external_links_count !== '' ? parseInt(site.external_links_count) : 5;",
+        ),
+        Replace('engine-001', OLD_EMBED_1, NEW_EMBED_1),
+        Replace('engine-001', OLD_EMBED_2, NEW_EMBED_2),
+        Replace(
+            'engine-001',
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.30",
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.37",
+        ),
+        Replace('engine-001', OLD_CHANGELOG, NEW_CHANGELOG),
+    ),
+)
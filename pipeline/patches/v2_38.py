@@ -0,0 +1,58 @@
+"""Fix v2.38: Use WordPress [embed] shortcode for YouTube (iframes get stripped by wp_kses)"""
+from pipeline.patch import Patch, Replace
+
+OLD_EMBED_1 = '''const embedBlock = `<figure class="wp-block-embed is-type-video is-provider-youtube wp-block-embed-youtube wp-embed-aspect-16-9 wp-has-aspect-ratio"><div class="wp-block-embed__wrapper">
+<iframe width="560" height="315" src="https://www.youtube.com/embed/${video.videoId}" title="${video.title}" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" allowfullscreen></iframe>
+</div><figcaption>${video.title}</figcaption></figure>`;'''
+
+NEW_EMBED_1 = '''const embedBlock = `
+<!-- wp:embed {"url":"https://www.youtube.com/watch?v=${video.videoId}","type":"video","providerNameSlug":"youtube","responsive":true,"className":"wp-embed-aspect-16-9 wp-has-aspect-ratio"} -->
+<figure class="wp-block-embed is-type-video is-provider-youtube wp-block-embed-youtube wp-embed-aspect-16-9 wp-has-aspect-ratio"><div class="wp-block-embed__wrapper">
+[embed]https://www.youtube.com/watch?v=${video.videoId}[/embed]
+</div><figcaption>${video.title}</figcaption></figure>
+<!-- /wp:embed -->`;'''
+
+OLD_EMBED_2 = '''const embedBlock = `
+
+<figure class="wp-block-embed is-type-video is-provider-youtube wp-block-embed-youtube wp-embed-aspect-16-9 wp-has-aspect-ratio"><div class="wp-block-embed__wrapper">
+<iframe width="560" height="315" src="https://www.youtube.com/embed/${video.videoId}" title="${video.title}" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" allowfullscreen></iframe>
+</div><figcaption>${video.title}</figcaption></figure>
+
+`;'''
+
+NEW_EMBED_2 = '''const embedBlock = `
+
+<!-- wp:embed {"url":"https://www.youtube.com/watch?v=${video.videoId}","type":"video","providerNameSlug":"youtube","responsive":true,"className":"wp-embed-aspect-16-9 wp-has-aspect-ratio"} -->
+<figure class="wp-block-embed is-type-video is-provider-youtube wp-block-embed-youtube wp-embed-aspect-16-9 wp-has-aspect-ratio"><div class="wp-block-embed__wrapper">
+[embed]https://www.youtube.com/watch?v=${video.videoId}[/embed]
+</div><figcaption>${video.title}</figcaption></figure>
+<!-- /wp:embed -->
+
+`;'''
+
+OLD_CHANGELOG = """* v2.37 Changes:
+ * - FIX: Empty string handling for internal_links_count/external_links_count (was causing NaN)
+ * - YouTube: Use iframe embed instead of oEmbed URL (more reliable rendering)"""
+
+NEW_CHANGELOG = """* v2.38 Changes:
+ * - FIX: YouTube embeds now use [embed] shortcode (iframes stripped by wp_kses)
+ * - Uses Gutenberg block comments for proper block recognition
+ * 
+ * v2.37 Changes:
+ * - FIX: Empty string handling for internal_links_count/external_links_count (was causing NaN)"""
+
+PATCH = Patch(
+    id='v2.38',
+    target='v2/2_Publisher.json',
+    version_id='v2.38-embed-shortcode',
+    edits=(
+        Replace('engine-001', OLD_EMBED_1, NEW_EMBED_1),
+        Replace('engine-001', OLD_EMBED_2, NEW_EMBED_2),
+        Replace(
+            'engine-001',
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.37",
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.38",
+        ),
+        Replace('engine-001', OLD_CHANGELOG, NEW_CHANGELOG),
+    ),
+)
@@ -0,0 +1,62 @@
+"""Fix v2.39: Simplify YouTube embed to just [embed] shortcode
+The Gutenberg block JSON comments were causing 500 errors
+"""
+from pipeline.patch import Patch, Replace
+
+OLD_EMBED_1 = '''const embedBlock = `
+<!-- wp:embed {"url":"https://www.youtube.com/watch?v=${video.videoId}","type":"video","providerNameSlug":"youtube","responsive":true,"className":"wp-embed-aspect-16-9 wp-has-aspect-ratio"} -->
+<figure class="wp-block-embed is-type-video is-provider-youtube wp-block-embed-youtube wp-embed-aspect-16-9 wp-has-aspect-ratio"><div class="wp-block-embed__wrapper">
+[embed]https://www.youtube.com/watch?v=${video.videoId}[/embed]
+</div><figcaption>${video.title}</figcaption></figure>
+<!-- /wp:embed -->`;'''
+
+NEW_EMBED_1 = '''const embedBlock = `<div class="youtube-embed-wrapper" style="position:relative;padding-bottom:56.25%;height:0;overflow:hidden;max-width:100%;margin:20px 0;">
+[embed]https://www.youtube.com/watch?v=${video.videoId}[/embed]
+</div>
+<p class="youtube-caption"><em>${video.title}</em></p>`;'''
+
+OLD_EMBED_2 = '''const embedBlock = `
+
+<!-- wp:embed {"url":"https://www.youtube.com/watch?v=${video.videoId}","type":"video","providerNameSlug":"youtube","responsive":true,"className":"wp-embed-aspect-16-9 wp-has-aspect-ratio"} -->
+<figure class="wp-block-embed is-type-video is-provider-youtube wp-block-embed-youtube wp-embed-aspect-16-9 wp-has-aspect-ratio"><div class="wp-block-embed__wrapper">
+[embed]https://www.youtube.com/watch?v=${video.videoId}[/embed]
+</div><figcaption>${video.title}</figcaption></figure>
+<!-- /wp:embed -->
+
+`;'''
+
+NEW_EMBED_2 = '''const embedBlock = `
+
+<div class="youtube-embed-wrapper" style="position:relative;padding-bottom:56.25%;height:0;overflow:hidden;max-width:100%;margin:20px 0;">
+[embed]https://www.youtube.com/watch?v=${video.videoId}[/embed]
+</div>
+<p class="youtube-caption"><em>${video.title}</em></p>
+
+`;'''
+
+OLD_CHANGELOG = """* v2.38 Changes:
+ * - FIX: YouTube embeds now use [embed] shortcode (iframes stripped by wp_kses)
+ * - Uses Gutenberg block comments for proper block recognition"""
+
+NEW_CHANGELOG = """* v2.39 Changes:
+ * - FIX: Simplified YouTube embed (Gutenberg JSON comments caused 500 errors)
+ * - Now uses plain [embed] shortcode with simple wrapper div
+ * 
+ * v2.38 Changes:
+ * - YouTube embeds use [embed] shortcode (iframes stripped by wp_kses)"""
+
+PATCH = Patch(
+    id='v2.39',
+    target='v2/2_Publisher.json',
+    version_id='v2.39-simple-embed',
+    edits=(
+        Replace('engine-001', OLD_EMBED_1, NEW_EMBED_1),
+        Replace('engine-001', OLD_EMBED_2, NEW_EMBED_2),
+        Replace(
+            'engine-001',
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.38",
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.39",
+        ),
+        Replace('engine-001', OLD_CHANGELOG, NEW_CHANGELOG),
+    ),
+)
@@ -1,34 +1,11 @@
-#!/usr/bin/env python3
-"""
-Fix v2.41: Properly distribute media throughout the article
+"""Fix v2.41: Properly distribute media throughout the article
 - Don't rely on AI placement at all
 - Distribute images and YouTube evenly by H2 sections
 - Never place media in the last section (before Conclusion/FAQs)
 """
-import json
-
-# Load the Publisher JSON
-with open('v2/2_Publisher.json', 'r', encoding='utf-8') as f:
-    workflow = json.load(f)
-
-# Find the engine node
-engine_node = None
-for node in workflow['nodes']:
-    if node['id'] == 'engine-001':
-        engine_node = node
-        break
-
-if not engine_node:
-    print("ERROR: Could not find engine-001 node")
-    exit(1)
-
-code = engine_node['parameters']['jsCode']
-
-# =============================================================================
-# REWRITE: processImagePlaceholders - always distribute by H2, ignore AI placement
-# =============================================================================
+from pipeline.patch import Patch, Replace
 
-old_process_images = '''async function processImagePlaceholders(contentHtml, titleSlug) {
+OLD_PROCESS_IMAGES = '''async function processImagePlaceholders(contentHtml, titleSlug) {
   const placeholderRegex = /<!-- WPIMG alt="([^"]+)" -->/g;
   let matches = [...contentHtml.matchAll(placeholderRegex)];
   let featuredImageId = null;
@@ -71,7 +48,7 @@ old_process_images = '''async function processImagePlaceholders(contentHtml, tit
   
   for (let i = 0; i < Math.min(matches.length, config.imagesCount); i++) {'''
 
-new_process_images = '''async function processImagePlaceholders(contentHtml, titleSlug) {
+NEW_PROCESS_IMAGES = '''async function processImagePlaceholders(contentHtml, titleSlug) {
   const placeholderRegex = /<!-- WPIMG alt="([^"]+)" -->/g;
   const originalMatches = [...contentHtml.matchAll(placeholderRegex)];
   let featuredImageId = null;
@@ -129,13 +106,7 @@ new_process_images = '''async function processImagePlaceholders(contentHtml, tit
   
   for (let i = 0; i < Math.min(matches.length, config.imagesCount); i++) {'''
 
-code = code.replace(old_process_images, new_process_images)
-
-# =============================================================================
-# REWRITE: injectYouTubeEmbeds - always distribute by H2, avoid clustering with images
-# =============================================================================
-
-old_youtube = '''// v2.36: YouTube embeds placed by AI using <!-- YTVID context="..." --> placeholders
+OLD_YOUTUBE = '''// v2.36: YouTube embeds placed by AI using <!-- YTVID context="..." --> placeholders
 function injectYouTubeEmbeds(content, anchorPhrases, youtubeCandidates) {
   if (config.youtubeCount === 0 || !youtubeCandidates?.length) return content;
   let modifiedContent = content;
@@ -217,7 +188,7 @@ https://www.youtube.com/watch?v=${video.videoId}
   return modifiedContent;
 }'''
 
-new_youtube = '''// v2.41: YouTube embeds distributed by H2 sections (different sections than images)
+NEW_YOUTUBE = '''// v2.41: YouTube embeds distributed by H2 sections (different sections than images)
 function injectYouTubeEmbeds(content, anchorPhrases, youtubeCandidates) {
   if (config.youtubeCount === 0 || !youtubeCandidates?.length) return content;
   let modifiedContent = content;
@@ -290,21 +261,11 @@ https://www.youtube.com/watch?v=${pos.video.videoId}
   return modifiedContent;
 }'''
 
-code = code.replace(old_youtube, new_youtube)
-
-# =============================================================================
-# Update version
-# =============================================================================
-code = code.replace(
-    "* AUTOBLOGGER PUBLISHER ENGINE v2.40",
-    "* AUTOBLOGGER PUBLISHER ENGINE v2.41"
-)
-
-old_changelog = """* v2.40 Changes:
+OLD_CHANGELOG = """* v2.40 Changes:
  * - FIX: YouTube now uses plain URL (WordPress auto-embeds perfectly)
  * - FIX: Detects if AI stacked image placeholders and redistributes them by H2"""
 
-new_changelog = """* v2.41 Changes:
+NEW_CHANGELOG = """* v2.41 Changes:
  * - REWRITE: Images always distributed by H2 sections (ignores AI placement)
  * - REWRITE: YouTube placed in middle sections (images in early sections)
  * - FIX: Never places media in Conclusion/FAQ sections
@@ -313,44 +274,18 @@ new_changelog = """* v2.41 Changes:
  * v2.40 Changes:
  * - YouTube uses plain URL (WordPress auto-embeds)"""
 
-code = code.replace(old_changelog, new_changelog)
-
-# Update the node
-engine_node['parameters']['jsCode'] = code
-
-# Update versionId
-workflow['versionId'] = 'v2.41-smart-distribute'
-
-# Save
-with open('v2/2_Publisher.json', 'w', encoding='utf-8') as f:
-    json.dump(workflow, f, indent=2)
-
-print("✅ v2.41 updates applied:")
-print("   - Images: Always distributed by H2 (early sections)")
-print("   - YouTube: Always distributed by H2 (middle sections)")
-print("   - Never places in Conclusion/FAQ sections")
-print("   - Prevents image+YouTube clustering")
-print("   - Version: v2.41-smart-distribute")
-
-# Verify
-with open('v2/2_Publisher.json', 'r', encoding='utf-8') as f:
-    verify = json.load(f)
-    
-code_verify = verify['nodes'][2]['parameters']['jsCode']
-
-if "ALWAYS distribute images by H2" in code_verify:
-    print("✅ Verified: Image distribution rewrite present")
-else:
-    print("❌ Warning: Image distribution may not have applied")
-
-if "YouTube placed in middle sections" in code_verify or "middle sections" in code_verify:
-    print("✅ Verified: YouTube middle placement present")
-else:
-    print("❌ Warning: YouTube placement may not have applied")
-
-if "endingSections" in code_verify:
-    print("✅ Verified: Ending section filter present")
-else:
-    print("❌ Warning: Ending section filter may not have applied")
-
-print(f"\n📄 Version: {verify['versionId']}")
+PATCH = Patch(
+    id='v2.41',
+    target='v2/2_Publisher.json',
+    version_id='v2.41-smart-distribute',
+    edits=(
+        Replace('engine-001', OLD_PROCESS_IMAGES, NEW_PROCESS_IMAGES),
+        Replace('engine-001', OLD_YOUTUBE, NEW_YOUTUBE),
+        Replace(
+            'engine-001',
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.40",
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.41",
+        ),
+        Replace('engine-001', OLD_CHANGELOG, NEW_CHANGELOG),
+    ),
+)
@@ -1,31 +1,7 @@
-#!/usr/bin/env python3
-"""
-Fix v2.42: Filter out YouTube Shorts from search results
-"""
-import json
+"""Fix v2.42: Filter out YouTube Shorts from search results"""
+from pipeline.patch import Patch, Replace
 
-# Load the Publisher JSON
-with open('v2/2_Publisher.json', 'r', encoding='utf-8') as f:
-    workflow = json.load(f)
-
-# Find the engine node
-engine_node = None
-for node in workflow['nodes']:
-    if node['id'] == 'engine-001':
-        engine_node = node
-        break
-
-if not engine_node:
-    print("ERROR: Could not find engine-001 node")
-    exit(1)
-
-code = engine_node['parameters']['jsCode']
-
-# =============================================================================
-# FIX: Filter out YouTube Shorts from search results
-# =============================================================================
-
-old_youtube_fetch = '''async function fetchYouTubeCandidates() {
+OLD_YOUTUBE_FETCH = '''async function fetchYouTubeCandidates() {
   if (!config.youtubeKey || config.youtubeCount === 0) return [];
   try {
     const resp = await httpRequest.call(this, {
@@ -45,8 +21,7 @@ old_youtube_fetch = '''async function fetchYouTubeCandidates() {
   }
 }'''
 
-# Add videoDuration=medium to exclude shorts (under 4 min) and filter by title
-new_youtube_fetch = '''async function fetchYouTubeCandidates() {
+NEW_YOUTUBE_FETCH = '''async function fetchYouTubeCandidates() {
   if (!config.youtubeKey || config.youtubeCount === 0) return [];
   try {
     // v2.42: Use videoDuration=medium to exclude Shorts (under 4 min)
@@ -78,23 +53,13 @@ new_youtube_fetch = '''async function fetchYouTubeCandidates() {
   }
 }'''
 
-code = code.replace(old_youtube_fetch, new_youtube_fetch)
-
-# =============================================================================
-# Update version
-# =============================================================================
-code = code.replace(
-    "* AUTOBLOGGER PUBLISHER ENGINE v2.41",
-    "* AUTOBLOGGER PUBLISHER ENGINE v2.42"
-)
-
-old_changelog = """* v2.41 Changes:
+OLD_CHANGELOG = """* v2.41 Changes:
  * - REWRITE: Images always distributed by H2 sections (ignores AI placement)
  * - REWRITE: YouTube placed in middle sections (images in early sections)
  * - FIX: Never places media in Conclusion/FAQ sections
  * - FIX: Prevents image+YouTube clustering"""
 
-new_changelog = """* v2.42 Changes:
+NEW_CHANGELOG = """* v2.42 Changes:
  * - FIX: Filter out YouTube Shorts (uses videoDuration=medium API param)
  * - FIX: Also filters titles containing #shorts, tiktok, etc.
  * 
@@ -103,37 +68,17 @@ new_changelog = """* v2.42 Changes:
  * - YouTube distributed across middle H2 sections
  * - Never places media in Conclusion/FAQ sections"""
 
-code = code.replace(old_changelog, new_changelog)
-
-# Update the node
-engine_node['parameters']['jsCode'] = code
-
-# Update versionId
-workflow['versionId'] = 'v2.42-no-shorts'
-
-# Save
-with open('v2/2_Publisher.json', 'w', encoding='utf-8') as f:
-    json.dump(workflow, f, indent=2)
-
-print("✅ v2.42 updates applied:")
-print("   - YouTube: Added videoDuration=medium to exclude Shorts")
-print("   - YouTube: Filters titles containing #shorts, tiktok, etc.")
-print("   - Version: v2.42-no-shorts")
-
-# Verify
-with open('v2/2_Publisher.json', 'r', encoding='utf-8') as f:
-    verify = json.load(f)
-    
-code_verify = verify['nodes'][2]['parameters']['jsCode']
-
-if "videoDuration=medium" in code_verify:
-    print("✅ Verified: videoDuration=medium parameter present")
-else:
-    print("❌ Warning: videoDuration parameter may not have applied")
-
-if "shortsKeywords" in code_verify:
-    print("✅ Verified: Shorts title filter present")
-else:
-    print("❌ Warning: Title filter may not have applied")
-
-print(f"\n📄 Version: {verify['versionId']}")
+PATCH = Patch(
+    id='v2.42',
+    target='v2/2_Publisher.json',
+    version_id='v2.42-no-shorts',
+    edits=(
+        Replace('engine-001', OLD_YOUTUBE_FETCH, NEW_YOUTUBE_FETCH),
+        Replace(
+            'engine-001',
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.41",
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.42",
+        ),
+        Replace('engine-001', OLD_CHANGELOG, NEW_CHANGELOG),
+    ),
+)
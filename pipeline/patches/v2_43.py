@@ -1,33 +1,10 @@
-#!/usr/bin/env python3
-"""
-Fix v2.43: YouTube videos matched to section headings
+"""Fix v2.43: YouTube videos matched to section headings
 - Search YouTube with the H2 heading where video will be placed
 - Much more relevant results
 """
-import json
-
-# Load the Publisher JSON
-with open('v2/2_Publisher.json', 'r', encoding='utf-8') as f:
-    workflow = json.load(f)
-
-# Find the engine node
-engine_node = None
-for node in workflow['nodes']:
-    if node['id'] == 'engine-001':
-        engine_node = node
-        break
-
-if not engine_node:
-    print("ERROR: Could not find engine-001 node")
-    exit(1)
-
-code = engine_node['parameters']['jsCode']
+from pipeline.patch import Patch, Replace
 
-# =============================================================================
-# FIX: YouTube search - use section heading instead of main topic
-# =============================================================================
-
-old_youtube_inject = '''// v2.41: YouTube embeds distributed by H2 sections (different sections than images)
+OLD_YOUTUBE_INJECT = '''// v2.41: YouTube embeds distributed by H2 sections (different sections than images)
 function injectYouTubeEmbeds(content, anchorPhrases, youtubeCandidates) {
   if (config.youtubeCount === 0 || !youtubeCandidates?.length) return content;
   let modifiedContent = content;
@@ -100,8 +77,7 @@ https://www.youtube.com/watch?v=${pos.video.videoId}
   return modifiedContent;
 }'''
 
-# New version that takes section context and searches per-section
-new_youtube_inject = '''// v2.43: YouTube embeds matched to section headings for relevance
+NEW_YOUTUBE_INJECT = '''// v2.43: YouTube embeds matched to section headings for relevance
 async function injectYouTubeEmbeds(content, anchorPhrases, youtubeCandidates) {
   if (config.youtubeCount === 0) return content;
   let modifiedContent = content;
@@ -219,34 +195,21 @@ https://www.youtube.com/watch?v=${pos.video.videoId}
   return modifiedContent;
 }'''
 
-code = code.replace(old_youtube_inject, new_youtube_inject)
-
-# Also need to update the call site to be async
-old_call = '''currentStep = 'YOUTUBE_EMBEDS';
+OLD_CALL = '''currentStep = 'YOUTUBE_EMBEDS';
   if (config.youtubeCount > 0 && youtubeCandidates.length > 0) {
     executionLog.push({ step: currentStep, status: 'started' });
     processedHtml = injectYouTubeEmbeds(processedHtml, contentJson.youtube_anchor_phrases, youtubeCandidates);'''
 
-new_call = '''currentStep = 'YOUTUBE_EMBEDS';
+NEW_CALL = '''currentStep = 'YOUTUBE_EMBEDS';
   if (config.youtubeCount > 0 && config.youtubeKey) {
     executionLog.push({ step: currentStep, status: 'started' });
     processedHtml = await injectYouTubeEmbeds.call(this, processedHtml, contentJson.youtube_anchor_phrases, youtubeCandidates);'''
 
-code = code.replace(old_call, new_call)
-
-# =============================================================================
-# Update version
-# =============================================================================
-code = code.replace(
-    "* AUTOBLOGGER PUBLISHER ENGINE v2.42",
-    "* AUTOBLOGGER PUBLISHER ENGINE v2.43"
-)
-
-old_changelog = """* v2.42 Changes:
+OLD_CHANGELOG = """* v2.42 Changes:
  * - FIX: Filter out YouTube Shorts (uses videoDuration=medium API param)
  * - FIX: Also filters titles containing #shorts, tiktok, etc."""
 
-new_changelog = """* v2.43 Changes:
+NEW_CHANGELOG = """* v2.43 Changes:
  * - YouTube: Now searches per-section heading for much better relevance
  * - YouTube: Combines section title + topic for search query
  * - Falls back to pre-fetched candidates if per-section search fails
@@ -254,33 +217,18 @@ new_changelog = """* v2.43 Changes:
  * v2.42 Changes:
  * - Filter out YouTube Shorts (videoDuration=medium)"""
 
-code = code.replace(old_changelog, new_changelog)
-
-# Update the node
-engine_node['parameters']['jsCode'] = code
-
-# Update versionId
-workflow['versionId'] = 'v2.43-relevant-youtube'
-
-# Save
-with open('v2/2_Publisher.json', 'w', encoding='utf-8') as f:
-    json.dump(workflow, f, indent=2)
-
-print("✅ v2.43 updates applied:")
-print("   - YouTube: Now searches per-section for better relevance")
-print("   - Search query: '{Section Heading} {Topic}'")
-print("   - Falls back to pre-fetched if section search fails")
-print("   - Version: v2.43-relevant-youtube")
-
-# Verify
-with open('v2/2_Publisher.json', 'r', encoding='utf-8') as f:
-    verify = json.load(f)
-    
-code_verify = verify['nodes'][2]['parameters']['jsCode']
-
-if "sectionTitle" in code_verify and "searchQuery" in code_verify:
-    print("✅ Verified: Per-section YouTube search present")
-else:
-    print("❌ Warning: Per-section search may not have applied")
-
-print(f"\n📄 Version: {verify['versionId']}")
+PATCH = Patch(
+    id='v2.43',
+    target='v2/2_Publisher.json',
+    version_id='v2.43-relevant-youtube',
+    edits=(
+        Replace('engine-001', OLD_YOUTUBE_INJECT, NEW_YOUTUBE_INJECT),
+        Replace('engine-001', OLD_CALL, NEW_CALL),
+        Replace(
+            'engine-001',
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.42",
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.43",
+        ),
+        Replace('engine-001', OLD_CHANGELOG, NEW_CHANGELOG),
+    ),
+)
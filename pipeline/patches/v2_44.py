@@ -0,0 +1,117 @@
+"""v2.44: Add Serper.dev support for external link SERP
+- Falls back to Serper.dev if Google CSE fails or isn't configured
+- New variable: SERPER_API_KEY
+"""
+from pipeline.patch import Patch, Replace
+
+OLD_CONFIG_SERP = """  googleCseKey: globals.GOOGLE_CSE_API_KEY || '',
+  googleCseCx: globals.GOOGLE_CSE_CX || '',"""
+
+NEW_CONFIG_SERP = """  googleCseKey: globals.GOOGLE_CSE_API_KEY || '',
+  googleCseCx: globals.GOOGLE_CSE_CX || '',
+  serperKey: globals.SERPER_API_KEY || '',"""
+
+OLD_FETCH_SERP = '''async function fetchSerpHints() {
+  if (!config.googleCseKey || !config.googleCseCx) return [];
+  try {
+    const resp = await httpRequest.call(this, {
+      method: 'GET',
+      url: `https://www.googleapis.com/customsearch/v1?key=${config.googleCseKey}&cx=${config.googleCseCx}&q=${encodeURIComponent(config.topic)}&num=10`
+    });
+    const results = (resp?.items || []).map(item => ({ title: item.title, url: item.link, snippet: item.snippet }));
+    debug.serp_count = results.length;
+    return results;
+  } catch (e) {
+    debug.wp_errors.push({ step: 'SERP', error: e.message });
+    return [];
+  }
+}'''
+
+NEW_FETCH_SERP = '''async function fetchSerpHints() {
+  // v2.44: Try Google CSE first, fall back to Serper.dev
+  
+  // Try Google CSE
+  if (config.googleCseKey && config.googleCseCx) {
+    try {
+      const resp = await httpRequest.call(this, {
+        method: 'GET',
+        url: `https://www.googleapis.com/customsearch/v1?key=${config.googleCseKey}&cx=${config.googleCseCx}&q=${encodeURIComponent(config.topic)}&num=10`
+      });
+      const results = (resp?.items || []).map(item => ({ title: item.title, url: item.link, snippet: item.snippet }));
+      if (results.length > 0) {
+        debug.serp_count = results.length;
+        debug.serp_provider = 'google_cse';
+        return results;
+      }
+    } catch (e) {
+      debug.wp_errors.push({ step: 'SERP_GOOGLE_CSE', error: e.message });
+    }
+  }
+  
+  // Fallback to Serper.dev
+  if (config.serperKey) {
+    try {
+      const resp = await httpRequest.call(this, {
+        method: 'POST',
+        url: 'https://google.serper.dev/search',
+        headers: {
+          'X-API-KEY': config.serperKey,
+          'Content-Type': 'application/json'
+        },
+        body: { q: config.topic, num: 10 }
+      });
+      const results = (resp?.organic || []).map(item => ({ 
+        title: item.title, 
+        url: item.link, 
+        snippet: item.snippet 
+      }));
+      debug.serp_count = results.length;
+      debug.serp_provider = 'serper';
+      return results;
+    } catch (e) {
+      debug.wp_errors.push({ step: 'SERP_SERPER', error: e.message });
+    }
+  }
+  
+  debug.serp_provider = 'none';
+  return [];
+}'''
+
+OLD_DEBUG = """const debug = {
+  serp_count: 0,
+  youtube_candidates_count: 0,"""
+
+NEW_DEBUG = """const debug = {
+  serp_count: 0,
+  serp_provider: 'none',
+  youtube_candidates_count: 0,"""
+
+OLD_CHANGELOG = """* v2.43 Changes:
+ * - YouTube: Now searches per-section heading for much better relevance
+ * - YouTube: Combines section title + topic for search query
+ * - Falls back to pre-fetched candidates if per-section search fails"""
+
+NEW_CHANGELOG = """* v2.44 Changes:
+ * - Added Serper.dev as fallback SERP provider (new var: SERPER_API_KEY)
+ * - Google CSE tried first, Serper.dev as fallback
+ * - debug.serp_provider shows which service was used
+ * 
+ * v2.43 Changes:
+ * - YouTube: Now searches per-section heading for much better relevance"""
+
+PATCH = Patch(
+    id='v2.44',
+    target='v2/2_Publisher.json',
+    version_id='v2.44-serper-support',
+    edits=(
+        Replace('engine-001', OLD_CONFIG_SERP, NEW_CONFIG_SERP),
+        Replace('engine-001', OLD_FETCH_SERP, NEW_FETCH_SERP),
+        Replace('engine-001', OLD_DEBUG, NEW_DEBUG),
+        Replace(
+            'engine-001',
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.43",
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.44",
+        ),
+        Replace('engine-001', OLD_CHANGELOG, NEW_CHANGELOG),
+    ),
+)
@@ -0,0 +1,18 @@
+"""v2.45 follow-up: Add SERPER_API_KEY and FASTINDEX_API_KEY to Inject Globals node
+
+v2.44 and v2.45 originally targeted the engine node for this edit, where it
+never matched. The Inject Globals node is the one that reads $vars.
+"""
+from pipeline.patch import Patch, Replace
+
+OLD = "SPEEDYINDEX_API_KEY: $vars.SPEEDYINDEX_API_KEY || '',\n  TELEGRAM_BOT_TOKEN:"
+
+NEW = "SPEEDYINDEX_API_KEY: $vars.SPEEDYINDEX_API_KEY || '',\n  SERPER_API_KEY: $vars.SERPER_API_KEY || '',\n  FASTINDEX_API_KEY: $vars.FASTINDEX_API_KEY || '',\n  TELEGRAM_BOT_TOKEN:"
+
+PATCH = Patch(
+    id='v2.45-globals',
+    target='v2/2_Publisher.json',
+    edits=(
+        Replace('inject-globals-001', OLD, NEW),
+    ),
+)
@@ -0,0 +1,53 @@
+"""Rename speedyindex_enabled to indexing_enabled for generic indexing control"""
+from pipeline.patch import Patch, Replace
+
+OLD_CHANGELOG = """* v2.45 Changes:
+ * - Added FastIndex.eu as fallback indexing service (new var: FASTINDEX_API_KEY)
+ * - SpeedyIndex tried first, FastIndex as fallback
+ * - debug.notifications.speedyindex shows which service was used"""
+
+NEW_CHANGELOG = """* v2.46 Changes:
+ * - Renamed speedyindex_enabled to indexing_enabled (generic control)
+ * - Renamed function to pingIndexingService
+ * 
+ * v2.45 Changes:
+ * - Added FastIndex.eu as fallback (FASTINDEX_API_KEY)"""
+
+PATCH = Patch(
+    id='v2.46',
+    target='v2/2_Publisher.json',
+    version_id='v2.46-indexing-enabled',
+    edits=(
+        Replace(
+            'engine-001',
+            "speedyindexEnabled: site.speedyindex_enabled === true || String(site.speedyindex_enabled || '').toLowerCase() === 'true',",
+            "indexingEnabled: site.indexing_enabled === true || String(site.indexing_enabled || '').toLowerCase() === 'true',",
+        ),
+        Replace(
+            'engine-001',
+            "if (!config.speedyindexEnabled) {",
+            "if (!config.indexingEnabled) {",
+        ),
+        Replace(
+            'engine-001',
+            "// v2.45: SpeedyIndex with FastIndex fallback",
+            "// v2.46: Generic indexing with SpeedyIndex/FastIndex fallback",
+        ),
+        Replace(
+            'engine-001',
+            "async function pingSpeedyIndex(postUrl) {",
+            "async function pingIndexingService(postUrl) {",
+        ),
+        Replace(
+            'engine-001',
+            "await pingSpeedyIndex.call(this, postResp.link);",
+            "await pingIndexingService.call(this, postResp.link);",
+        ),
+        Replace(
+            'engine-001',
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.45",
+            "* AUTOBLOGGER PUBLISHER ENGINE v2.46",
+        ),
+        Replace('engine-001', OLD_CHANGELOG, NEW_CHANGELOG),
+    ),
+)
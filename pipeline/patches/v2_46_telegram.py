@@ -0,0 +1,23 @@
+"""v2.46 follow-up: Add indexing status to the Telegram notification"""
+from pipeline.patch import Patch, Replace
+
+OLD_TELEGRAM = '''// Telegram (respects per-site setting)
+  const notifyMessage = `✅ <b>New Post Published</b>\\n\\n📝 ${contentJson.title}\\n🌐 ${site.site_name || config.baseUrl}\\n🔗 ${postResp.link || 'Draft'}\\n📊 Images: ${debug.images_uploaded}/${debug.images_requested}\\n🔗 Internal: ${debug.internal_links_inserted}/${debug.internal_links_requested}\\n🌐 External: ${debug.external_links_inserted}/${debug.external_links_requested}\\n📺 YouTube: ${debug.youtube_embeds_inserted}/${debug.youtube_embeds_requested}\\n🏷️ Categories: ${categoryIds.length}`;
+  await sendTelegramNotification.call(this, notifyMessage);'''
+
+NEW_TELEGRAM = '''// Telegram (respects per-site setting)
+  const indexStatus = debug.notifications.speedyindex === 'speedyindex_success' ? '✅ SpeedyIndex' : 
+                       debug.notifications.speedyindex === 'fastindex_success' ? '✅ FastIndex' : 
+                       debug.notifications.speedyindex === 'disabled_for_site' ? '⏸️ Disabled' :
+                       debug.notifications.speedyindex === 'post_not_published' ? '⏸️ Draft' :
+                       '❌ Failed';
+  const notifyMessage = `✅ <b>New Post Published</b>\\n\\n📝 ${contentJson.title}\\n🌐 ${site.site_name || config.baseUrl}\\n🔗 ${postResp.link || 'Draft'}\\n📊 Images: ${debug.images_uploaded}/${debug.images_requested}\\n🔗 Internal: ${debug.internal_links_inserted}/${debug.internal_links_requested}\\n🌐 External: ${debug.external_links_inserted}/${debug.external_links_requested}\\n📺 YouTube: ${debug.youtube_embeds_inserted}/${debug.youtube_embeds_requested}\\n🏷️ Categories: ${categoryIds.length}\\n🔍 Indexing: ${indexStatus}`;
+  await sendTelegramNotification.call(this, notifyMessage);'''
+
+PATCH = Patch(
+    id='v2.46-telegram',
+    target='v2/2_Publisher.json',
+    edits=(
+        Replace('engine-001', OLD_TELEGRAM, NEW_TELEGRAM),
+    ),
+)
@@ -0,0 +1,30 @@
+"""Fix v2.48: Images generated even when AI doesn't include placeholders"""
+from pipeline.patch import Patch, Replace
+
+PATCH = Patch(
+    id='v2.48',
+    target='v2/2_Publisher.json',
+    version_id='v2.48-image-fallback',
+    edits=(
+        Replace(
+            'engine-001',
+            '* AUTOBLOGGER PUBLISHER ENGINE v2.47',
+            '* AUTOBLOGGER PUBLISHER ENGINE v2.48',
+        ),
+        Replace(
+            'engine-001',
+            ' * v2.47 Changes:\n * - External links now distributed across content (prevents clustering)',
+            ' * v2.48 Changes:\n * - FIX: Images now generated even when AI omits placeholders\n * - Uses section headings for alt text when AI placeholders missing\n * \n * v2.47 Changes:\n * - External links now distributed across content (prevents clustering)',
+        ),
+        Replace(
+            'engine-001',
+            '// Distribute images across usable sections\n  const imagesToPlace = Math.min(originalMatches.length, config.imagesCount);',
+            '// v2.48: Always generate requested number of images (even if AI omitted placeholders)\n  const imagesToPlace = config.imagesCount;',
+        ),
+        Replace(
+            'engine-001',
+            "alt: originalMatches[i] ? originalMatches[i][1] : `Image ${i + 1} for ${titleSlug}`",
+            "alt: originalMatches[i] ? originalMatches[i][1] : `${h2Match[1].trim()} - ${config.topic}`",
+        ),
+    ),
+)
@@ -1,25 +1,12 @@
-#!/usr/bin/env python3
-"""
-Fix v2.49: Improve content generation prompts
+"""Fix v2.49: Improve content generation prompts
 - Anti-AI footprint rules (no em-dashes, generic phrases, etc.)
 - Adaptive content style based on topic type
 - Better meta descriptions (no "Explore/Discover" openers)
 - Respect tone from registry sheet
 """
+from pipeline.patch import Patch, Replace
 
-import json
-import re
-
-def fix_publisher():
-    with open('v2/2_Publisher.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    for node in data['nodes']:
-        if node['name'] == 'Publisher Engine (Code)':
-            code = node['parameters']['jsCode']
-            
-            # Find and replace the systemPrompt
-            old_system_prompt = '''const systemPrompt = `You are an expert SEO content writer. You MUST respond with ONLY valid JSON, no other text.
+OLD_SYSTEM_PROMPT = '''const systemPrompt = `You are an expert SEO content writer. You MUST respond with ONLY valid JSON, no other text.
 
 Output JSON schema:
 {
@@ -52,8 +39,8 @@ Content rules:
 - NO title in content_html (title goes in the title field)
 - Anchor phrases MUST appear verbatim as plain text in PARAGRAPH content (NOT in headings)
 - focus_keyphrase should appear naturally 3-5 times in the content${imagePlaceholderInstructions}${youtubePlaceholderInstructions}`;'''
-            
-            new_system_prompt = '''const systemPrompt = `You are an expert SEO content writer creating content for a real blog. You MUST respond with ONLY valid JSON, no other text.
+
+NEW_SYSTEM_PROMPT = '''const systemPrompt = `You are an expert SEO content writer creating content for a real blog. You MUST respond with ONLY valid JSON, no other text.
 
 Output JSON schema:
 {
@@ -114,18 +101,12 @@ HTML & FORMATTING:
 
 TONE (PRIORITY): ${config.tone}
 The tone setting from the site takes absolute priority. Adapt your language, formality, and style to match this tone while still following all other rules.${imagePlaceholderInstructions}${youtubePlaceholderInstructions}`;'''
-            
-            code = code.replace(old_system_prompt, new_system_prompt)
-            
-            # Update version
-            code = code.replace('v2.48-image-fallback', 'v2.49-humanized-prompts')
-            
-            # Add v2.49 changelog entry after v2.48
-            old_changelog = '''* v2.48 Changes:
+
+OLD_CHANGELOG = '''* v2.48 Changes:
  * - FIX: Images now generated even when AI omits placeholders
  * - Uses section headings for alt text when AI placeholders missing'''
-            
-            new_changelog = '''* v2.49 Changes:
+
+NEW_CHANGELOG = '''* v2.49 Changes:
  * - Humanized prompts: Anti-AI footprint rules (no em-dashes, typical AI phrases)
  * - Adaptive content style based on topic type (listicles, reviews, how-tos, etc.)
  * - Better meta descriptions (no generic "Explore/Discover" openers)
@@ -134,29 +115,18 @@ The tone setting from the site takes absolute priority. Adapt your language, for
  * v2.48 Changes:
  * - FIX: Images now generated even when AI omits placeholders
  * - Uses section headings for alt text when AI placeholders missing'''
-            
-            code = code.replace(old_changelog, new_changelog)
-            
-            # Update header
-            code = code.replace(
-                'AUTOBLOGGER PUBLISHER ENGINE v2.48',
-                'AUTOBLOGGER PUBLISHER ENGINE v2.49'
-            )
-            
-            node['parameters']['jsCode'] = code
-            break
-    
-    # Update workflow version
-    data['versionId'] = 'v2.49-humanized-prompts'
-    
-    with open('v2/2_Publisher.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
-    
-    print("✅ Fixed! Publisher updated to v2.49")
-    print("   - Anti-AI footprint rules added (no em-dashes, generic phrases)")
-    print("   - Adaptive content style based on topic type")
-    print("   - Better meta descriptions (no Explore/Discover openers)")
-    print("   - Tone setting explicitly prioritized")
 
-if __name__ == '__main__':
-    fix_publisher()
+PATCH = Patch(
+    id='v2.49',
+    target='v2/2_Publisher.json',
+    version_id='v2.49-humanized-prompts',
+    edits=(
+        Replace('engine-001', OLD_SYSTEM_PROMPT, NEW_SYSTEM_PROMPT),
+        Replace('engine-001', OLD_CHANGELOG, NEW_CHANGELOG),
+        Replace(
+            'engine-001',
+            'AUTOBLOGGER PUBLISHER ENGINE v2.48',
+            'AUTOBLOGGER PUBLISHER ENGINE v2.49',
+        ),
+    ),
+)
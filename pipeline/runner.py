@@ -0,0 +1,76 @@
+"""
+Single-pass patch runner.
+
+Groups the ordered patch set by target file, parses each workflow once,
+applies only the patches that are not already recorded in
+``meta.appliedPatches`` and writes each file at most once.
+"""
+from collections import OrderedDict
+from pathlib import Path
+
+from pipeline.jsparse import JsSyntaxError
+from pipeline.patch import PatchError
+from pipeline.workflow import Workflow
+
+
+def group_by_target(patches):
+    groups = OrderedDict()
+    for patch in patches:
+        groups.setdefault(patch.target, []).append(patch)
+    return groups
+
+
+def touched_code_nodes(patches):
+    return {edit.node for patch in patches for edit in patch.edits if hasattr(edit, 'node')}
+
+
+def verify_code_nodes(workflow, node_ids):
+    """Every patched Code node must still split into balanced top-level segments."""
+    for node_id in sorted(node_ids):
+        try:
+            workflow.source(node_id)
+        except JsSyntaxError as e:
+            raise PatchError(f'{workflow.path} [{node_id}]: patched code no longer tokenizes: {e}') from None
+
+
+def run_patches(patches, root='.', adopt=False, dry_run=False, log=print):
+    """Apply pending patches. Returns ``{target: [applied patch ids]}``.
+
+    ``adopt`` records patches as applied without touching the code. It is
+    used once to baseline workflows that were produced by the old fix scripts.
+    """
+    root = Path(root)
+    report = OrderedDict()
+    for target, group in group_by_target(patches).items():
+        workflow = Workflow.load(root / target)
+        applied = workflow.applied_patches()
+        done = []
+        pending = []
+        for patch in group:
+            digest = patch.digest
+            recorded = applied.get(patch.id)
+            if recorded == digest:
+                continue
+            if recorded is not None:
+                raise PatchError(
+                    f'{target}: patch {patch.id} changed after it was applied '
+                    f'(recorded {recorded}, now {digest}). Add a new patch instead.'
+                )
+            if adopt:
+                if patch.version_id:
+                    workflow.version_id = patch.version_id
+            else:
+                patch.apply(workflow)
+                pending.append(patch)
+            applied[patch.id] = digest
+            done.append(patch.id)
+        verify_code_nodes(workflow, touched_code_nodes(pending))
+        report[target] = done
+        if not done:
+            log(f'  = {target}: up to date ({len(group)} patches)')
+            continue
+        verb = 'adopted' if adopt else 'applied'
+        log(f'  + {target}: {verb} {", ".join(done)} -> {workflow.version_id}')
+        if not dry_run:
+            workflow.save()
+    return report
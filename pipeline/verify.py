@@ -0,0 +1,209 @@
+"""
+Differential check for release builds.
+
+``python -m pipeline build --release --verify`` runs each variant's engine
+twice under ``node``: once as bundled (with the release flags folded, so both
+sides take the same branches) and once minified. Every run gets the same
+stubbed ``this.helpers.httpRequest`` with canned provider responses, a seeded
+``Math.random``, a frozen clock and empty workflow static data. The recorded
+requests (method, URL, body), the node output and the static data left behind
+must be identical, scenario by scenario; the first difference fails the build.
+
+This covers what ``compact`` can't check on its own: a rename that shadows or
+misses a binding still tokenizes, but sends a different request or returns a
+different result.
+"""
+import json
+import shutil
+import subprocess
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    site: dict = field(default_factory=dict)   # columns on top of BASE_SITE
+    fail: tuple = ()        # URL substrings whose requests are rejected
+    runs: int = 2           # later runs see the caches (auth, terms, post index) left behind
+    ok: bool = True         # expected result of the last run, so a broken stub can't pass
+
+
+BASE_SITE = {
+    'base_url': 'https://site.test/', 'site_name': 'Site Test', 'auth_mode': 'basic',
+    'wp_user': 'u', 'wp_app_password': 'p', 'jwt_user': 'ju', 'jwt_password': 'jp',
+    'images_count': '3', 'internal_links_count': '2', 'external_links_count': '2',
+    'youtube_embeds_count': '1', 'categories': 'News', 'tags': 'a,b',
+    'telegram_enabled': 'true', 'indexing_enabled': 'true', 'image_concurrency': '2',
+}
+
+SCENARIOS = (
+    Scenario('publish'),
+    Scenario('sections', {'generation_mode': 'sections', 'auth_mode': 'jwt',
+                          'image_provider_priority': 'openai,fal', 'internal_link_mode': 'semantic'}),
+    Scenario('legacy-plugin', {'images_count': '1', 'youtube_embeds_count': '0'},
+             fail=('publish-bundle',)),
+    Scenario('openai-down', fail=('chat/completions',), runs=3, ok=False),
+)
+
+# Loads {codes, keys, scenarios} from stdin and prints
+# {code key: {scenario: [{requests, output, staticData}, ...]}}.
+RUNNER = r"""
+const vm = require('vm');
+const { codes, keys, scenarios } = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const html = '<p>Widgets help with many small jobs around the house.</p>' +
+  ['Getting Started', 'Choosing Tools', 'Advanced Widgets', 'Maintenance Tips', 'Conclusion'].map((h, i) =>
+    `<h2>${h}</h2><p>Part ${i} covers the widget care guide and gadget reviews with practical advice.</p><ul><li>Tool storage ${i}</li></ul>`).join('');
+// One answer for every chat request: single-pass articles, outlines, sections and FAQs
+const article = {
+  title: 'Widget Guide', slug: 'widget-guide', meta_description: 'A guide to widgets.', focus_keyphrase: 'widgets',
+  tag_suggestions: ['widgets', 'gadgets'], content_html: html, html: '<p>Section text on widget care guide and tool storage.</p>',
+  sections: ['Getting Started', 'Choosing Tools', 'Advanced Widgets', 'Conclusion'].map(heading => ({ heading, summary: 'about ' + heading })),
+  image_alts: ['widget on a bench', 'widget tools'], faq_questions: ['Do widgets rust?'], faq_items: [{ question: 'Do widgets rust?', answer: 'Rarely.' }],
+  internal_anchor_phrases: ['widget care guide', 'gadget reviews'], external_anchor_phrases: ['practical advice', 'tool storage'],
+};
+const vector = (text, n) => {
+  const v = new Array(n).fill(0);
+  for (const w of String(text).toLowerCase().split(/[^a-z]+/).filter(Boolean)) { let h = 0; for (const c of w) h = (h * 31 + c.charCodeAt(0)) % n; v[h] += 1; }
+  return v;
+};
+function respond(o, scenario, count) {
+  const u = o.url || o.uri || '';
+  const method = (o.method || 'GET').toUpperCase();
+  if (scenario.fail.some(part => u.includes(part))) {
+    const e = new Error('Request failed with status code ' + (u.includes('chat/completions') ? 500 : 404));
+    e.response = { status: u.includes('chat/completions') ? 500 : 404, headers: {} };
+    throw e;
+  }
+  if (u.endsWith('jwt-auth/v1/token')) return { token: 'h.' + Buffer.from(JSON.stringify({ exp: 1700003600 })).toString('base64url') + '.s' };
+  if (u.includes('token/validate')) return { code: 'jwt_auth_valid_token', data: { status: 200 } };
+  if (u.includes('users/me')) return { id: 1, name: 'admin' };
+  if (u.includes('chat/completions')) return { choices: [{ message: { content: JSON.stringify(article) }, finish_reason: 'stop' }], usage: { prompt_tokens: 1000, completion_tokens: 800, prompt_tokens_details: { cached_tokens: 512 } } };
+  if (u.includes('/embeddings')) return { data: [].concat(o.body.input).map((t, index) => ({ index, embedding: vector(t, o.body.dimensions || 64) })) };
+  if (u.includes('images/generations')) return { data: [{ b64_json: 'aGVsbG8=' }] };
+  if (u.includes('fal.run') || u.includes('fal.ai')) return { images: [{ url: 'https://cdn.fal.test/img.png' }] };
+  if (u.includes('cdn.fal.test')) return Buffer.from('imgdata');
+  if (u.includes('pexels')) return { photos: [] };
+  if (u.includes('customsearch')) return { items: [1, 2, 3].map(i => ({ title: `Practical advice ${i}`, link: `https://ext${i}.test/a`, snippet: 'tool storage tips' })) };
+  if (u.includes('serper')) return { organic: [] };
+  if (u.includes('youtube/v3/videos')) return { items: (u.match(/id=([^&]+)/) || [, ''])[1].split(',').map(id => ({ id, contentDetails: { duration: 'PT8M' } })) };
+  if (u.includes('youtube/v3/search')) return { items: [1, 2].map(i => ({ id: { videoId: 'vid' + i }, snippet: { title: 'Widget video ' + i } })) };
+  if (u.includes('upload-image') || u.includes('sideload-image') || u.includes('wp/v2/media')) return { id: 100 + count, url: 'https://site.test/img.png', source_url: 'https://site.test/img.png' };
+  if (u.includes('wp/v2/posts') && method === 'GET') return u.includes('modified_after') ? [] : [1, 2, 3].map(i => ({ id: i, title: { rendered: `Widget care guide part ${i}` }, excerpt: { rendered: '<p>Excerpt &amp; more</p>' }, link: `https://site.test/p${i}`, slug: 'p' + i, modified: `2026-10-0${i}T10:00:00` }));
+  if (u.includes('wp/v2/posts')) return { id: 99, link: 'https://site.test/widget-guide', status: 'draft' };
+  if (u.includes('wp/v2/tags') || u.includes('wp/v2/categories')) return method === 'GET' ? [{ id: 3, name: 'News', slug: 'news' }] : { id: 7 };
+  if (u.includes('publish-bundle')) return { success: true, id: 99, link: 'https://site.test/widget-guide', status: 'draft', tags: [7, 8], categories: [3] };
+  if (u.includes('update-seo-meta')) return { success: true };
+  return { ok: true };
+}
+async function run(code, scenario) {
+  const globals = Object.fromEntries(keys.map(key => [key, 'test-' + key.toLowerCase()]));
+  const site = { ...Object.fromEntries(keys.map(key => [key.toLowerCase(), globals[key]])), ...scenario.base, ...scenario.site };
+  const json = { site_config: site, topicRow: { topic: 'widgets' }, globals };
+  const staticData = {};
+  const runs = [];
+  for (let n = 0; n < scenario.runs; n++) {
+    const requests = [];
+    const helpers = { httpRequest: async o => {
+      requests.push([(o.method || 'GET').toUpperCase(), o.url || o.uri, o.body === undefined ? null : Buffer.isBuffer(o.body) ? o.body.toString('base64') : typeof o.body === 'string' ? o.body : JSON.stringify(o.body)]);
+      return respond(o, scenario, requests.length);
+    } };
+    // No require in the sandbox: the engine uses helpers.httpRequest, never real sockets
+    const context = vm.createContext({ Buffer, URL, URLSearchParams, setTimeout, clearTimeout, console: { log() {}, warn() {}, error() {} } });
+    vm.runInContext('let seed = 42; Math.random = () => { seed = (seed * 16807) % 2147483647; return (seed - 1) / 2147483646; };' +
+      'const RealDate = Date; Date = class extends RealDate { constructor(...a) { super(...(a.length ? a : [1700000000000])); } static now() { return 1700000000000; } };', context);
+    const fn = vm.runInContext('(async function ($input, $vars, $json, $getWorkflowStaticData) {\n' + code + '\n})', context);
+    let output;
+    try {
+      output = JSON.parse(JSON.stringify(await fn.call({ helpers }, { first: () => ({ json }), all: () => [{ json }] }, {}, json, () => staticData)));
+      for (const item of output) if (item.json) delete item.json.stack;
+    } catch (e) {
+      output = { thrown: String(e && e.message) };
+    }
+    runs.push({ requests, output, staticData: JSON.parse(JSON.stringify(staticData)) });
+  }
+  return runs;
+}
+(async () => {
+  const out = {};
+  for (const [key, code] of Object.entries(codes)) {
+    out[key] = {};
+    for (const scenario of scenarios) out[key][scenario.name] = await run(code, scenario);
+  }
+  process.stdout.write(JSON.stringify(out));
+})();
+"""
+
+
+class VerifyError(Exception):
+    """The minified engine behaves differently from the bundled one."""
+
+
+def _first_difference(dev, release, path=''):
+    if type(dev) is not type(release):
+        return path or '<root>', dev, release
+    if isinstance(dev, dict):
+        for key in list(dev) + [k for k in release if k not in dev]:
+            if key not in dev or key not in release:
+                return f'{path}.{key}', dev.get(key), release.get(key)
+            found = _first_difference(dev[key], release[key], f'{path}.{key}')
+            if found:
+                return found
+        return None
+    if isinstance(dev, list):
+        for i, (a, b) in enumerate(zip(dev, release)):
+            found = _first_difference(a, b, f'{path}[{i}]')
+            if found:
+                return found
+        if len(dev) != len(release):
+            return f'{path}.length', len(dev), len(release)
+        return None
+    return None if dev == release else (path, dev, release)
+
+
+def _short(value, limit=160):
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def verify_release(pairs, keys, scenarios=SCENARIOS, timeout=300):
+    """Run ``{name: (bundled code, minified code)}`` under node and compare.
+
+    Returns the number of scenarios checked per name. Raises ``VerifyError``
+    on the first difference, or if node isn't available.
+    """
+    node = shutil.which('node')
+    if not node:
+        raise VerifyError('--verify needs node on PATH')
+    codes = {}
+    for name, (dev, release) in pairs.items():
+        codes[f'{name}:dev'] = dev
+        codes[f'{name}:release'] = release
+    payload = {
+        'codes': codes,
+        # Keys with a default in the engine keep it; the rest get a dummy value
+        'keys': [key for key, default in keys if default == "''"],
+        'scenarios': [{'name': s.name, 'base': BASE_SITE, 'site': s.site, 'fail': list(s.fail), 'runs': s.runs}
+                      for s in scenarios],
+    }
+    try:
+        proc = subprocess.run([node, '-e', RUNNER], input=json.dumps(payload),
+                              capture_output=True, text=True, timeout=timeout, check=True)
+    except subprocess.CalledProcessError as e:
+        raise VerifyError(f'verify runner failed: {e.stderr.strip()[-500:]}') from None
+    except (OSError, subprocess.SubprocessError) as e:
+        raise VerifyError(f'verify runner failed: {e}') from None
+    results = json.loads(proc.stdout)
+    for name in pairs:
+        dev, release = results[f'{name}:dev'], results[f'{name}:release']
+        for scenario in scenarios:
+            last = dev[scenario.name][-1]['output']
+            ok = isinstance(last, list) and bool(last) and last[0].get('json', {}).get('ok')
+            if ok is not scenario.ok:
+                raise VerifyError(f'{name}: scenario {scenario.name!r} expected ok={scenario.ok}, '
+                                  f'bundled engine returned {_short(last)}')
+            found = _first_difference(dev[scenario.name], release[scenario.name])
+            if found:
+                path, a, b = found
+                raise VerifyError(f'{name}: scenario {scenario.name!r} differs at {path}: '
+                                  f'bundled {_short(a)}, minified {_short(b)}')
+    return {name: len(scenarios) for name in pairs}
@@ -0,0 +1,116 @@
+"""
+Workflow JSON loading and saving.
+
+Workflows are parsed once and written back in the exact style they were read
+with (BOM, ``ensure_ascii``, trailing newline), so an unchanged workflow
+re-serializes byte-for-byte and a no-op run never touches the file.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+from pipeline.jsparse import JsSource
+
+BOM = '\ufeff'
+
+
+def content_hash(text):
+    """Short, stable sha256 digest used for patch and build records."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+class Workflow:
+    """An n8n workflow file with O(1) node lookup by id."""
+
+    def __init__(self, path, data, raw):
+        self.path = Path(path)
+        self.data = data
+        self.raw = raw
+        self.bom = raw.startswith(BOM)
+        body = raw[1:] if self.bom else raw
+        self.trailing_newline = body.endswith('\n')
+        self.ensure_ascii = self._detect_ensure_ascii(body)
+        self._nodes = {node['id']: node for node in data.get('nodes', [])}
+        self._sources = {}
+
+    @classmethod
+    def load(cls, path):
+        raw = Path(path).read_text(encoding='utf-8')
+        data = json.loads(raw[1:] if raw.startswith(BOM) else raw)
+        return cls(path, data, raw)
+
+    def _detect_ensure_ascii(self, body):
+        # Files written by json.dump() keep the default; v3 exports were saved with raw UTF-8
+        if json.dumps(self.data, indent=2, ensure_ascii=False) == body.rstrip('\n'):
+            return False
+        return True
+
+    # -- nodes ---------------------------------------------------------------
+
+    def node(self, node_id):
+        try:
+            return self._nodes[node_id]
+        except KeyError:
+            raise KeyError(f'{self.path}: no node with id {node_id!r}') from None
+
+    def has_node(self, node_id):
+        return node_id in self._nodes
+
+    def add_node(self, node):
+        self.data['nodes'].append(node)
+        self._nodes[node['id']] = node
+
+    def code(self, node_id):
+        return self.node(node_id)['parameters']['jsCode']
+
+    def set_code(self, node_id, code, source=None):
+        self.node(node_id)['parameters']['jsCode'] = code
+        if source is None:
+            self._sources.pop(node_id, None)
+        else:
+            self._sources[node_id] = source
+
+    def source(self, node_id):
+        """Segmented view of a Code node, tokenized once and cached until a text edit."""
+        if node_id not in self._sources:
+            self._sources[node_id] = JsSource(self.code(node_id))
+        return self._sources[node_id]
+
+    # -- metadata ------------------------------------------------------------
+
+    @property
+    def meta(self):
+        return self.data.setdefault('meta', {})
+
+    @property
+    def version_id(self):
+        return self.data.get('versionId')
+
+    @version_id.setter
+    def version_id(self, value):
+        self.data['versionId'] = value
+
+    def applied_patches(self):
+        """Patch id -> content hash for every patch recorded in meta."""
+        return self.meta.setdefault('appliedPatches', {})
+
+    # -- output --------------------------------------------------------------
+
+    def dumps(self):
+        text = json.dumps(self.data, indent=2, ensure_ascii=self.ensure_ascii)
+        if self.trailing_newline:
+            text += '\n'
+        return (BOM if self.bom else '') + text
+
+    @property
+    def changed(self):
+        return self.dumps() != self.raw
+
+    def save(self):
+        """Write the workflow if its content changed. Returns True when written."""
+        text = self.dumps()
+        if text == self.raw:
+            return False
+        self.path.write_text(text, encoding='utf-8')
+        self.raw = text
+        return True
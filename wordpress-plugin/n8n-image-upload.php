@@ -1,8 +1,8 @@
 <?php
 /**
  * Plugin Name: n8n Autoblogger Helper
- * Description: REST API endpoints for n8n autoblogging - image uploads, SEO meta, and category management
- * Version: 1.2
+ * Description: REST API endpoints for n8n autoblogging - image uploads, SEO meta, category management and one-request publishing
+ * Version: 1.6
  * Author: Maestro Uchiha
  */
 
@@ -42,40 +42,280 @@ add_action('rest_api_init', function() {
             return current_user_can('edit_posts');
         }
     ]);
+    
+    // v1.4: Terms, post and SEO meta in one request
+    register_rest_route('n8n/v1', '/publish-bundle', [
+        'methods' => 'POST',
+        'callback' => 'n8n_handle_publish_bundle',
+        'permission_callback' => function($request) {
+            return current_user_can('edit_posts');
+        }
+    ]);
+    
+    // v1.6: Resumable chunked upload (init / chunk / finalize)
+    register_rest_route('n8n/v1', '/upload-chunked', [
+        'methods' => 'POST',
+        'callback' => 'n8n_handle_chunked_init',
+        'permission_callback' => function($request) {
+            return current_user_can('upload_files');
+        }
+    ]);
+    
+    register_rest_route('n8n/v1', '/upload-chunked/(?P<id>[a-f0-9]{32})', [
+        'methods' => 'GET',
+        'callback' => 'n8n_handle_chunked_status',
+        'permission_callback' => function($request) {
+            return current_user_can('upload_files');
+        }
+    ]);
+    
+    register_rest_route('n8n/v1', '/upload-chunked/(?P<id>[a-f0-9]{32})/chunk', [
+        'methods' => 'POST',
+        'callback' => 'n8n_handle_chunked_append',
+        'permission_callback' => function($request) {
+            return current_user_can('upload_files');
+        }
+    ]);
+    
+    register_rest_route('n8n/v1', '/upload-chunked/(?P<id>[a-f0-9]{32})/finalize', [
+        'methods' => 'POST',
+        'callback' => 'n8n_handle_chunked_finalize',
+        'permission_callback' => function($request) {
+            return current_user_can('upload_files');
+        }
+    ]);
+    
+    // v1.3: Thumbnail status for uploads made with defer_thumbnails
+    register_rest_route('n8n/v1', '/image-status/(?P<id>\d+)', [
+        'methods' => 'GET',
+        'callback' => 'n8n_handle_image_status',
+        'permission_callback' => function($request) {
+            return current_user_can('upload_files');
+        }
+    ]);
 });
 
+// v1.3: Background sub-size generation (Action Scheduler if available, else WP-Cron)
+add_action('n8n_generate_thumbnails', 'n8n_generate_thumbnails');
+
+// v1.5: Keep WP_REST_Server from buffering a raw base64 upload body - the
+// handler streams php://input itself. WordPress reads the body through
+// $HTTP_RAW_POST_DATA only when it is unset, and rest_api_init fires first.
+// v1.6: Chunk bodies are always streamed
+add_action('rest_api_init', function() {
+    $route = untrailingslashit($GLOBALS['wp']->query_vars['rest_route'] ?? '');
+    $streamed = ($route === '/n8n/v1/upload-image' && n8n_is_streamed_upload($_SERVER['CONTENT_TYPE'] ?? ''))
+        || preg_match('#^/n8n/v1/upload-chunked/[a-f0-9]{32}/chunk$#', $route);
+    if ($streamed) {
+        $GLOBALS['HTTP_RAW_POST_DATA'] = '';
+    }
+}, 0);
+
 /**
  * Upload image from base64 data
  * POST /wp-json/n8n/v1/upload-image
- * Body: { "base64": "...", "filename": "image.png", "mime_type": "image/png", "alt_text": "..." }
+ * Body: { "base64": "...", "filename": "image.png", "mime_type": "image/png", "alt_text": "...", "defer_thumbnails": true }
+ *
+ * v1.5: Or a raw base64 body (Content-Type: text/plain) with the other fields
+ * as query params - decoded straight from php://input in constant memory
+ * POST /wp-json/n8n/v1/upload-image?filename=image.png&alt_text=...&defer_thumbnails=1
  */
 function n8n_handle_image_upload($request) {
-    $params = $request->get_json_params();
+    $streamed = n8n_is_streamed_upload($request->get_content_type()['value'] ?? '');
+    $params = $streamed ? $request->get_query_params() : $request->get_json_params();
     
-    $base64 = $params['base64'] ?? '';
     $filename = sanitize_file_name($params['filename'] ?? 'image-' . time() . '.png');
-    $mime_type = $params['mime_type'] ?? 'image/png';
     $alt_text = sanitize_text_field($params['alt_text'] ?? '');
     $title = sanitize_text_field($params['title'] ?? $filename);
+    $defer = !empty($params['defer_thumbnails']);
     
-    if (empty($base64)) {
-        return new WP_Error('no_base64', 'Base64 data is required', ['status' => 400]);
+    if ($streamed) {
+        $input = fopen('php://input', 'rb');
+        $chunks = n8n_stream_chunks($input);
+    } else {
+        if (empty($params['base64'])) {
+            return new WP_Error('no_base64', 'Base64 data is required', ['status' => 400]);
+        }
+        $chunks = n8n_string_chunks($params['base64']);
     }
     
-    // Remove data URL prefix if present
-    if (strpos($base64, 'base64,') !== false) {
-        $base64 = explode('base64,', $base64)[1];
+    $file = n8n_write_base64_upload($chunks, $filename);
+    if ($streamed) {
+        fclose($input);
     }
+    if (is_wp_error($file)) {
+        return $file;
+    }
+    
+    return n8n_insert_upload($file, $title, $alt_text, $defer);
+}
+
+/**
+ * Register a file already written to the uploads directory as an attachment
+ * v1.6: Shared by upload-image and upload-chunked finalize
+ */
+function n8n_insert_upload($file, $title, $alt_text, $defer) {
+    // Create attachment
+    $attachment = [
+        'post_mime_type' => $file['mime'],
+        'post_title' => $title,
+        'post_content' => '',
+        'post_status' => 'inherit'
+    ];
     
-    // Decode base64
-    $image_data = base64_decode($base64);
-    if ($image_data === false) {
-        return new WP_Error('decode_failed', 'Failed to decode base64 data', ['status' => 400]);
+    $attachment_id = wp_insert_attachment($attachment, $file['path']);
+    if (is_wp_error($attachment_id)) {
+        @unlink($file['path']);
+        return $attachment_id;
     }
     
-    // Validate image
-    $finfo = new finfo(FILEINFO_MIME_TYPE);
-    $detected_mime = $finfo->buffer($image_data);
+    // Generate metadata (v1.3: or defer sub-sizes to a background job)
+    require_once(ABSPATH . 'wp-admin/includes/image.php');
+    if ($defer) {
+        n8n_defer_thumbnails($attachment_id, $file['path']);
+    } else {
+        $metadata = wp_generate_attachment_metadata($attachment_id, $file['path']);
+        wp_update_attachment_metadata($attachment_id, $metadata);
+    }
+    
+    // Set alt text
+    if ($alt_text) {
+        update_post_meta($attachment_id, '_wp_attachment_image_alt', $alt_text);
+    }
+    
+    return [
+        'success' => true,
+        'id' => $attachment_id,
+        'url' => wp_get_attachment_url($attachment_id),
+        'source_url' => wp_get_attachment_url($attachment_id),
+        'filename' => $file['filename'],
+        'size' => $file['size'],
+        'thumbnails' => $defer ? 'pending' : 'complete'
+    ];
+}
+
+/**
+ * v1.5: Raw base64 request bodies are streamed; JSON bodies use the v1.0 format
+ */
+function n8n_is_streamed_upload($content_type) {
+    return stripos($content_type, 'text/plain') === 0;
+}
+
+function n8n_stream_chunks($handle, $size = 65536) {
+    while (!feof($handle)) {
+        $chunk = fread($handle, $size);
+        if ($chunk === false) break;
+        if ($chunk !== '') yield $chunk;
+    }
+}
+
+function n8n_string_chunks($string, $size = 65536) {
+    $length = strlen($string);
+    for ($offset = 0; $offset < $length; $offset += $size) {
+        yield substr($string, $offset, $size);
+    }
+}
+
+/**
+ * v1.5: Decode base64 slice by slice (each slice cut on a 4-character
+ * boundary) so only one slice is ever held in memory. A data URL prefix
+ * on the first slice is skipped.
+ */
+function n8n_base64_decode_chunks($chunks) {
+    $carry = '';
+    $first = true;
+    foreach ($chunks as $chunk) {
+        if ($first) {
+            $first = false;
+            $prefix = strpos($chunk, 'base64,');
+            if ($prefix !== false && $prefix < 100) {
+                $chunk = substr($chunk, $prefix + 7);
+            }
+        }
+        $chunk = $carry . preg_replace('/\s+/', '', $chunk);
+        $usable = strlen($chunk) - strlen($chunk) % 4;
+        $carry = substr($chunk, $usable);
+        if ($usable === 0) continue;
+        
+        $bytes = base64_decode(substr($chunk, 0, $usable), true);
+        if ($bytes === false) {
+            throw new UnexpectedValueException('Failed to decode base64 data');
+        }
+        yield $bytes;
+    }
+    // Unpadded input leaves a short tail
+    if ($carry !== '') {
+        $bytes = base64_decode($carry);
+        if ($bytes === false) {
+            throw new UnexpectedValueException('Failed to decode base64 data');
+        }
+        yield $bytes;
+    }
+}
+
+/**
+ * v1.5: Stream decoded base64 into a new file in the uploads directory.
+ * The MIME type is sniffed from the first decoded bytes only, before
+ * anything is written.
+ * Returns [ 'path', 'filename', 'mime', 'size' ] or WP_Error
+ */
+function n8n_write_base64_upload($chunks, $filename) {
+    $decoded = n8n_base64_decode_chunks($chunks);
+    $fp = null;
+    $file_path = '';
+    
+    try {
+        $head = '';
+        while ($decoded->valid() && strlen($head) < 4096) {
+            $head .= $decoded->current();
+            $decoded->next();
+        }
+        if ($head === '') {
+            return new WP_Error('no_base64', 'Base64 data is required', ['status' => 400]);
+        }
+        
+        // Validate image
+        $finfo = new finfo(FILEINFO_MIME_TYPE);
+        $detected_mime = $finfo->buffer($head);
+        $target = n8n_upload_target($filename, $detected_mime);
+        if (is_wp_error($target)) {
+            return $target;
+        }
+        list($file_path, $unique_filename) = $target;
+        
+        // Write file
+        $fp = fopen($file_path, 'wb');
+        if (!$fp) {
+            return new WP_Error('write_failed', 'Failed to write image file', ['status' => 500]);
+        }
+        $bytes_written = fwrite($fp, $head);
+        while ($decoded->valid()) {
+            $bytes_written += fwrite($fp, $decoded->current());
+            $decoded->next();
+        }
+        fclose($fp);
+        $fp = null;
+    } catch (UnexpectedValueException $e) {
+        if ($fp) {
+            fclose($fp);
+            @unlink($file_path);
+        }
+        return new WP_Error('decode_failed', $e->getMessage(), ['status' => 400]);
+    }
+    
+    return [
+        'path' => $file_path,
+        'filename' => $unique_filename,
+        'mime' => $detected_mime,
+        'size' => $bytes_written
+    ];
+}
+
+/**
+ * v1.6: Check the sniffed MIME type and pick a unique path in the uploads
+ * directory. Returns [ path, filename ] or WP_Error
+ */
+function n8n_upload_target($filename, $detected_mime) {
     if (!in_array($detected_mime, ['image/jpeg', 'image/png', 'image/gif', 'image/webp'])) {
         return new WP_Error('invalid_image', 'Invalid image type: ' . $detected_mime, ['status' => 400]);
     }
@@ -93,52 +333,236 @@ function n8n_handle_image_upload($request) {
         $filename .= '.' . $ext;
     }
     $unique_filename = wp_unique_filename($upload_dir['path'], $filename);
-    $file_path = $upload_dir['path'] . '/' . $unique_filename;
     
-    // Write file
-    $bytes_written = file_put_contents($file_path, $image_data);
-    if ($bytes_written === false) {
-        return new WP_Error('write_failed', 'Failed to write image file', ['status' => 500]);
+    return [$upload_dir['path'] . '/' . $unique_filename, $unique_filename];
+}
+
+/**
+ * Start a resumable chunked upload
+ * POST /wp-json/n8n/v1/upload-chunked
+ * Body: { "size": 1843200, "filename": "image.png", "alt_text": "...", "title": "...", "defer_thumbnails": true }
+ */
+function n8n_handle_chunked_init($request) {
+    $params = $request->get_json_params();
+    
+    $size = intval($params['size'] ?? 0);
+    $filename = sanitize_file_name($params['filename'] ?? 'image-' . time() . '.png');
+    $max_size = apply_filters('n8n_chunked_upload_max_size', 50 * MB_IN_BYTES);
+    
+    if ($size <= 0) {
+        return new WP_Error('no_size', 'Total size in bytes is required', ['status' => 400]);
+    }
+    if ($size > $max_size) {
+        return new WP_Error('too_large', 'Upload exceeds ' . size_format($max_size), ['status' => 413]);
     }
     
-    // Create attachment
-    $attachment = [
-        'post_mime_type' => $detected_mime,
-        'post_title' => $title,
-        'post_content' => '',
-        'post_status' => 'inherit'
+    n8n_sweep_chunked_uploads();
+    
+    $upload_id = bin2hex(random_bytes(16));
+    $path = trailingslashit(get_temp_dir()) . 'n8n-upload-' . $upload_id . '.part';
+    if (@file_put_contents($path, '') === false) {
+        return new WP_Error('write_failed', 'Failed to create upload file', ['status' => 500]);
+    }
+    
+    $upload = [
+        'user' => get_current_user_id(),
+        'path' => $path,
+        'size' => $size,
+        'received' => 0,
+        'filename' => $filename,
+        'title' => sanitize_text_field($params['title'] ?? $filename),
+        'alt_text' => sanitize_text_field($params['alt_text'] ?? ''),
+        'defer' => !empty($params['defer_thumbnails'])
     ];
+    set_transient('n8n_upload_' . $upload_id, $upload, DAY_IN_SECONDS);
     
-    $attachment_id = wp_insert_attachment($attachment, $file_path);
-    if (is_wp_error($attachment_id)) {
-        @unlink($file_path);
-        return $attachment_id;
+    // A chunk is one request body, so it has to fit in post_max_size
+    $post_max = wp_convert_hr_to_bytes(ini_get('post_max_size'));
+    $max_chunk = apply_filters('n8n_chunked_upload_max_chunk', 2 * MB_IN_BYTES);
+    if ($post_max > 0) {
+        $max_chunk = min($max_chunk, $post_max - 8 * KB_IN_BYTES);
     }
     
-    // Generate metadata
-    require_once(ABSPATH . 'wp-admin/includes/image.php');
-    $metadata = wp_generate_attachment_metadata($attachment_id, $file_path);
-    wp_update_attachment_metadata($attachment_id, $metadata);
+    return [
+        'success' => true,
+        'upload_id' => $upload_id,
+        'received' => 0,
+        'size' => $size,
+        'max_chunk_size' => $max_chunk
+    ];
+}
+
+/**
+ * Report how many bytes of a chunked upload have been stored
+ * GET /wp-json/n8n/v1/upload-chunked/{upload_id}
+ */
+function n8n_handle_chunked_status($request) {
+    $upload = n8n_get_chunked_upload($request['id']);
+    if (is_wp_error($upload)) {
+        return $upload;
+    }
     
-    // Set alt text
-    if ($alt_text) {
-        update_post_meta($attachment_id, '_wp_attachment_image_alt', $alt_text);
+    return [
+        'success' => true,
+        'upload_id' => $request['id'],
+        'received' => $upload['received'],
+        'size' => $upload['size']
+    ];
+}
+
+/**
+ * Write one chunk at the given offset
+ * POST /wp-json/n8n/v1/upload-chunked/{upload_id}/chunk?offset=0
+ * Body: raw bytes (application/octet-stream), or base64 text with &encoding=base64
+ *
+ * Re-sending a chunk that was already stored is harmless; a chunk that
+ * would leave a gap is rejected with the current offset.
+ */
+function n8n_handle_chunked_append($request) {
+    $upload_id = $request['id'];
+    $upload = n8n_get_chunked_upload($upload_id);
+    if (is_wp_error($upload)) {
+        return $upload;
+    }
+    
+    $offset = intval($request->get_param('offset'));
+    if ($offset < 0 || $offset > $upload['received']) {
+        return new WP_Error('bad_offset', 'Chunk offset must be at most ' . $upload['received'], [
+            'status' => 409,
+            'received' => $upload['received']
+        ]);
+    }
+    
+    $fp = fopen($upload['path'], 'r+b');
+    if (!$fp || fseek($fp, $offset) !== 0) {
+        return new WP_Error('write_failed', 'Failed to open upload file', ['status' => 500]);
+    }
+    
+    $input = fopen('php://input', 'rb');
+    $chunks = n8n_stream_chunks($input);
+    if ($request->get_param('encoding') === 'base64') {
+        $chunks = n8n_base64_decode_chunks($chunks);
+    }
+    
+    $written = 0;
+    $error = null;
+    try {
+        foreach ($chunks as $bytes) {
+            if ($offset + $written + strlen($bytes) > $upload['size']) {
+                $error = new WP_Error('too_large', 'Chunk runs past the declared size', ['status' => 400]);
+                break;
+            }
+            $result = fwrite($fp, $bytes);
+            if ($result === false) {
+                $error = new WP_Error('write_failed', 'Failed to write chunk', ['status' => 500]);
+                break;
+            }
+            $written += $result;
+        }
+    } catch (UnexpectedValueException $e) {
+        $error = new WP_Error('decode_failed', $e->getMessage(), ['status' => 400]);
+    }
+    fclose($fp);
+    fclose($input);
+    
+    // Bytes that did land are kept so the client can resume from 'received'
+    $upload['received'] = max($upload['received'], $offset + $written);
+    set_transient('n8n_upload_' . $upload_id, $upload, DAY_IN_SECONDS);
+    
+    if ($error) {
+        return $error;
     }
     
     return [
         'success' => true,
-        'id' => $attachment_id,
-        'url' => wp_get_attachment_url($attachment_id),
-        'source_url' => wp_get_attachment_url($attachment_id),
+        'upload_id' => $upload_id,
+        'received' => $upload['received'],
+        'size' => $upload['size']
+    ];
+}
+
+/**
+ * Move a complete chunked upload into the media library
+ * POST /wp-json/n8n/v1/upload-chunked/{upload_id}/finalize
+ */
+function n8n_handle_chunked_finalize($request) {
+    $upload_id = $request['id'];
+    $upload = n8n_get_chunked_upload($upload_id);
+    if (is_wp_error($upload)) {
+        return $upload;
+    }
+    
+    if ($upload['received'] < $upload['size']) {
+        return new WP_Error('incomplete', 'Upload incomplete: ' . $upload['received'] . ' of ' . $upload['size'] . ' bytes', [
+            'status' => 409,
+            'received' => $upload['received']
+        ]);
+    }
+    
+    // Validate image (finfo only reads the first bytes of the file)
+    $finfo = new finfo(FILEINFO_MIME_TYPE);
+    $detected_mime = $finfo->file($upload['path']);
+    $target = n8n_upload_target($upload['filename'], $detected_mime);
+    if (is_wp_error($target)) {
+        @unlink($upload['path']);
+        delete_transient('n8n_upload_' . $upload_id);
+        return $target;
+    }
+    list($file_path, $unique_filename) = $target;
+    
+    // rename() fails across filesystems (temp dir vs uploads)
+    if (!@rename($upload['path'], $file_path)) {
+        if (!@copy($upload['path'], $file_path)) {
+            return new WP_Error('write_failed', 'Failed to move upload into place', ['status' => 500]);
+        }
+        @unlink($upload['path']);
+    }
+    delete_transient('n8n_upload_' . $upload_id);
+    
+    // Match the permissions of files WordPress writes itself
+    $stat = stat(dirname($file_path));
+    @chmod($file_path, $stat['mode'] & 0000666);
+    
+    $file = [
+        'path' => $file_path,
         'filename' => $unique_filename,
-        'size' => $bytes_written
+        'mime' => $detected_mime,
+        'size' => $upload['size']
     ];
+    
+    return n8n_insert_upload($file, $upload['title'], $upload['alt_text'], $upload['defer']);
+}
+
+/**
+ * v1.6: Load chunked upload state; only the user who started it may continue it
+ */
+function n8n_get_chunked_upload($upload_id) {
+    $upload = get_transient('n8n_upload_' . $upload_id);
+    if (!$upload || !file_exists($upload['path'])) {
+        return new WP_Error('unknown_upload', 'Upload not found or expired', ['status' => 404]);
+    }
+    if ($upload['user'] !== get_current_user_id()) {
+        return new WP_Error('forbidden', 'Upload belongs to another user', ['status' => 403]);
+    }
+    return $upload;
+}
+
+/**
+ * v1.6: Remove partial files abandoned more than a day ago
+ */
+function n8n_sweep_chunked_uploads() {
+    $files = glob(trailingslashit(get_temp_dir()) . 'n8n-upload-*.part') ?: [];
+    foreach ($files as $file) {
+        if (filemtime($file) < time() - DAY_IN_SECONDS) {
+            @unlink($file);
+        }
+    }
 }
 
 /**
  * Sideload image from URL (WordPress downloads it)
  * POST /wp-json/n8n/v1/sideload-image
- * Body: { "url": "https://...", "filename": "image.png", "alt_text": "..." }
+ * Body: { "url": "https://...", "filename": "image.png", "alt_text": "...", "defer_thumbnails": true }
  */
 function n8n_handle_image_sideload($request) {
     $params = $request->get_json_params();
@@ -147,6 +571,7 @@ function n8n_handle_image_sideload($request) {
     $filename = sanitize_file_name($params['filename'] ?? '');
     $alt_text = sanitize_text_field($params['alt_text'] ?? '');
     $title = sanitize_text_field($params['title'] ?? $filename);
+    $defer = !empty($params['defer_thumbnails']);
     
     if (empty($url)) {
         return new WP_Error('no_url', 'Image URL is required', ['status' => 400]);
@@ -173,7 +598,11 @@ function n8n_handle_image_sideload($request) {
     ];
     
     // Sideload into media library
-    $attachment_id = media_handle_sideload($file_array, 0, $title);
+    if ($defer) {
+        $attachment_id = n8n_sideload_deferred($file_array, $title);
+    } else {
+        $attachment_id = media_handle_sideload($file_array, 0, $title);
+    }
     
     // Clean up temp file
     @unlink($tmp);
@@ -192,7 +621,113 @@ function n8n_handle_image_sideload($request) {
         'id' => $attachment_id,
         'url' => wp_get_attachment_url($attachment_id),
         'source_url' => wp_get_attachment_url($attachment_id),
-        'filename' => $filename
+        'filename' => $filename,
+        'thumbnails' => $defer ? 'pending' : 'complete'
+    ];
+}
+
+/**
+ * v1.3: Move a downloaded file into uploads and register the attachment
+ * without generating sub-sizes (media_handle_sideload always generates them)
+ */
+function n8n_sideload_deferred($file_array, $title) {
+    $file = wp_handle_sideload($file_array, ['test_form' => false]);
+    if (isset($file['error'])) {
+        return new WP_Error('sideload_failed', $file['error'], ['status' => 500]);
+    }
+    
+    $attachment = [
+        'post_mime_type' => $file['type'],
+        'post_title' => $title ?: preg_replace('/\.[^.]+$/', '', basename($file['file'])),
+        'post_content' => '',
+        'post_status' => 'inherit'
+    ];
+    
+    $attachment_id = wp_insert_attachment($attachment, $file['file']);
+    if (is_wp_error($attachment_id)) {
+        @unlink($file['file']);
+        return $attachment_id;
+    }
+    
+    n8n_defer_thumbnails($attachment_id, $file['file']);
+    return $attachment_id;
+}
+
+/**
+ * v1.3: Store the full-size metadata now and queue sub-size generation.
+ * The attachment is usable (URL, featured image) as soon as this returns.
+ */
+function n8n_defer_thumbnails($attachment_id, $file_path) {
+    $metadata = ['file' => _wp_relative_upload_path($file_path), 'sizes' => []];
+    $size = wp_getimagesize($file_path);
+    if ($size) {
+        $metadata['width'] = $size[0];
+        $metadata['height'] = $size[1];
+    }
+    wp_update_attachment_metadata($attachment_id, $metadata);
+    update_post_meta($attachment_id, '_n8n_thumbnails', 'pending');
+    
+    if (function_exists('as_enqueue_async_action')) {
+        as_enqueue_async_action('n8n_generate_thumbnails', ['attachment_id' => $attachment_id], 'n8n');
+    } else {
+        wp_schedule_single_event(time(), 'n8n_generate_thumbnails', ['attachment_id' => $attachment_id]);
+        spawn_cron();
+    }
+}
+
+/**
+ * v1.3: Background job - generate sub-sizes for a deferred upload
+ */
+function n8n_generate_thumbnails($attachment_id) {
+    $attachment_id = intval($attachment_id);
+    if (get_post_meta($attachment_id, '_n8n_thumbnails', true) !== 'pending') {
+        return;
+    }
+    
+    $file_path = get_attached_file($attachment_id);
+    if (!$file_path || !file_exists($file_path)) {
+        update_post_meta($attachment_id, '_n8n_thumbnails', 'failed');
+        return;
+    }
+    
+    require_once(ABSPATH . 'wp-admin/includes/image.php');
+    $metadata = wp_generate_attachment_metadata($attachment_id, $file_path);
+    wp_update_attachment_metadata($attachment_id, $metadata);
+    update_post_meta($attachment_id, '_n8n_thumbnails', 'complete');
+}
+
+/**
+ * Report whether an attachment's sub-sizes have been generated
+ * GET /wp-json/n8n/v1/image-status/123
+ */
+function n8n_handle_image_status($request) {
+    $attachment_id = intval($request['id']);
+    if (!$attachment_id || get_post_type($attachment_id) !== 'attachment') {
+        return new WP_Error('invalid_attachment', 'Invalid attachment ID', ['status' => 404]);
+    }
+    
+    // Uploads made without defer_thumbnails have no status meta and are complete
+    $status = get_post_meta($attachment_id, '_n8n_thumbnails', true) ?: 'complete';
+    
+    // Re-queue if the job was lost (e.g. WP-Cron disabled and the event expired)
+    if ($status === 'pending') {
+        $args = ['attachment_id' => $attachment_id];
+        $queued = function_exists('as_has_scheduled_action')
+            ? as_has_scheduled_action('n8n_generate_thumbnails', $args, 'n8n')
+            : wp_next_scheduled('n8n_generate_thumbnails', $args);
+        if (!$queued) {
+            n8n_defer_thumbnails($attachment_id, get_attached_file($attachment_id));
+        }
+    }
+    
+    $metadata = wp_get_attachment_metadata($attachment_id);
+    
+    return [
+        'success' => true,
+        'id' => $attachment_id,
+        'url' => wp_get_attachment_url($attachment_id),
+        'thumbnails' => $status,
+        'sizes' => array_keys($metadata['sizes'] ?? [])
     ];
 }
 
@@ -205,75 +740,94 @@ function n8n_handle_seo_meta_update($request) {
     $params = $request->get_json_params();
     
     $post_id = intval($params['post_id'] ?? 0);
-    $focus_keyphrase = sanitize_text_field($params['focus_keyphrase'] ?? '');
-    $meta_description = sanitize_text_field($params['meta_description'] ?? '');
-    $seo_title = sanitize_text_field($params['seo_title'] ?? '');
     
     if (!$post_id || !get_post($post_id)) {
         return new WP_Error('invalid_post', 'Invalid post ID', ['status' => 400]);
     }
     
+    $seo = n8n_seo_meta_fields($params);
+    foreach ($seo['meta'] as $key => $value) {
+        update_post_meta($post_id, $key, $value);
+    }
+    
+    return [
+        'success' => true,
+        'post_id' => $post_id,
+        'seo_plugins' => $seo['plugins'],
+        'updated' => $seo['updated']
+    ];
+}
+
+/**
+ * Map focus keyphrase / description / title to Yoast and RankMath meta keys
+ * v1.4: Shared by update-seo-meta and publish-bundle
+ */
+function n8n_seo_meta_fields($params) {
+    $focus_keyphrase = sanitize_text_field($params['focus_keyphrase'] ?? '');
+    $meta_description = sanitize_text_field($params['meta_description'] ?? '');
+    $seo_title = sanitize_text_field($params['seo_title'] ?? '');
+    
+    $meta = [];
     $updated = [];
     
     // Detect which SEO plugin is active
     $has_yoast = defined('WPSEO_VERSION') || class_exists('WPSEO_Meta');
     $has_rankmath = class_exists('RankMath') || defined('RANK_MATH_VERSION');
     
-    // Update Yoast SEO meta
+    // Yoast SEO meta
     if ($has_yoast) {
         if ($focus_keyphrase) {
-            update_post_meta($post_id, '_yoast_wpseo_focuskw', $focus_keyphrase);
+            $meta['_yoast_wpseo_focuskw'] = $focus_keyphrase;
             $updated['yoast_focus_keyword'] = true;
         }
         if ($meta_description) {
-            update_post_meta($post_id, '_yoast_wpseo_metadesc', $meta_description);
+            $meta['_yoast_wpseo_metadesc'] = $meta_description;
             $updated['yoast_meta_description'] = true;
         }
         if ($seo_title) {
-            update_post_meta($post_id, '_yoast_wpseo_title', $seo_title);
+            $meta['_yoast_wpseo_title'] = $seo_title;
             $updated['yoast_title'] = true;
         }
     }
     
-    // Update RankMath SEO meta
+    // RankMath SEO meta
     if ($has_rankmath) {
         if ($focus_keyphrase) {
-            update_post_meta($post_id, 'rank_math_focus_keyword', $focus_keyphrase);
+            $meta['rank_math_focus_keyword'] = $focus_keyphrase;
             $updated['rankmath_focus_keyword'] = true;
         }
         if ($meta_description) {
-            update_post_meta($post_id, 'rank_math_description', $meta_description);
+            $meta['rank_math_description'] = $meta_description;
             $updated['rankmath_description'] = true;
         }
         if ($seo_title) {
-            update_post_meta($post_id, 'rank_math_title', $seo_title);
+            $meta['rank_math_title'] = $seo_title;
             $updated['rankmath_title'] = true;
         }
         
         // RankMath also stores robots meta - set to index
-        update_post_meta($post_id, 'rank_math_robots', ['index']);
+        $meta['rank_math_robots'] = ['index'];
     }
     
     // If no SEO plugin detected, still store the meta for later
     if (!$has_yoast && !$has_rankmath) {
         if ($focus_keyphrase) {
-            update_post_meta($post_id, '_n8n_focus_keyphrase', $focus_keyphrase);
+            $meta['_n8n_focus_keyphrase'] = $focus_keyphrase;
             $updated['n8n_focus_keyphrase'] = true;
         }
         if ($meta_description) {
-            update_post_meta($post_id, '_n8n_meta_description', $meta_description);
+            $meta['_n8n_meta_description'] = $meta_description;
             $updated['n8n_meta_description'] = true;
         }
     }
     
     return [
-        'success' => true,
-        'post_id' => $post_id,
-        'seo_plugins' => [
+        'meta' => $meta,
+        'updated' => $updated,
+        'plugins' => [
             'yoast' => $has_yoast,
             'rankmath' => $has_rankmath
-        ],
-        'updated' => $updated
+        ]
     ];
 }
 
@@ -328,3 +882,158 @@ function n8n_handle_create_category($request) {
         'created' => true
     ];
 }
+
+/**
+ * Resolve tags and categories, insert the post and write SEO meta in one request
+ * POST /wp-json/n8n/v1/publish-bundle
+ * Body: { "post": { "title": "...", "content": "...", "status": "publish", "featured_media": 123 },
+ *         "tags": ["Tag"], "categories": ["Category"],
+ *         "seo": { "focus_keyphrase": "...", "meta_description": "...", "seo_title": "..." } }
+ */
+function n8n_handle_publish_bundle($request) {
+    $params = $request->get_json_params();
+    $post = $params['post'] ?? [];
+    
+    $title = sanitize_text_field($post['title'] ?? '');
+    $status = sanitize_key($post['status'] ?? 'draft');
+    $featured_media = intval($post['featured_media'] ?? 0);
+    
+    if (empty($title)) {
+        return new WP_Error('no_title', 'Post title is required', ['status' => 400]);
+    }
+    if (!in_array($status, ['draft', 'publish', 'pending', 'private', 'future'])) {
+        return new WP_Error('invalid_status', 'Invalid post status: ' . $status, ['status' => 400]);
+    }
+    if ($status === 'publish' && !current_user_can('publish_posts')) {
+        return new WP_Error('cannot_publish', 'Sorry, you are not allowed to publish posts', ['status' => 403]);
+    }
+    
+    $tag_ids = n8n_resolve_tags((array) ($params['tags'] ?? []));
+    $categories = n8n_resolve_categories((array) ($params['categories'] ?? []));
+    $seo = n8n_seo_meta_fields($params['seo'] ?? []);
+    
+    // meta_input is written before the publish hooks fire, so SEO plugins
+    // index the post with its keyphrase/description already in place
+    $meta = $seo['meta'];
+    if ($featured_media && get_post_type($featured_media) === 'attachment') {
+        $meta['_thumbnail_id'] = $featured_media;
+    }
+    
+    $post_id = wp_insert_post([
+        'post_title' => $title,
+        'post_name' => sanitize_title($post['slug'] ?? ''),
+        'post_content' => $post['content'] ?? '',
+        'post_excerpt' => sanitize_textarea_field($post['excerpt'] ?? ''),
+        'post_status' => $status,
+        'post_type' => 'post',
+        'comment_status' => ($post['comment_status'] ?? 'open') === 'closed' ? 'closed' : 'open',
+        'ping_status' => ($post['ping_status'] ?? 'open') === 'closed' ? 'closed' : 'open',
+        'post_category' => $categories['ids'],
+        'tags_input' => $tag_ids,
+        'meta_input' => $meta
+    ], true);
+    
+    if (is_wp_error($post_id)) {
+        return new WP_Error('insert_failed', $post_id->get_error_message(), ['status' => 500]);
+    }
+    
+    return [
+        'success' => true,
+        'id' => $post_id,
+        'link' => get_permalink($post_id),
+        'status' => get_post_status($post_id),
+        'slug' => get_post_field('post_name', $post_id),
+        'featured_media' => isset($meta['_thumbnail_id']) ? $featured_media : 0,
+        'tags' => $tag_ids,
+        'categories' => $categories['ids'],
+        'categories_found' => $categories['found'],
+        'seo_plugins' => $seo['plugins'],
+        'seo_updated' => $seo['updated']
+    ];
+}
+
+/**
+ * v1.4: Tag IDs by name, creating missing tags
+ */
+function n8n_resolve_tags($names) {
+    $ids = [];
+    foreach ($names as $name) {
+        $name = sanitize_text_field($name);
+        if ($name === '') continue;
+        
+        $existing = get_term_by('name', $name, 'post_tag');
+        if ($existing) {
+            $ids[] = $existing->term_id;
+            continue;
+        }
+        
+        $result = wp_insert_term($name, 'post_tag');
+        if (!is_wp_error($result)) {
+            $ids[] = $result['term_id'];
+        } elseif ($result->get_error_code() === 'term_exists') {
+            $ids[] = intval($result->get_error_data());
+        }
+    }
+    return array_values(array_unique($ids));
+}
+
+/**
+ * v1.4: Category IDs by name - exact name, then slug, then partial name match
+ * (same order the engine used), creating missing categories
+ */
+function n8n_resolve_categories($names) {
+    $ids = [];
+    $found = [];
+    $all = null;
+    
+    foreach ($names as $name) {
+        $name = sanitize_text_field($name);
+        if ($name === '') continue;
+        
+        if ($all === null) {
+            $all = get_terms(['taxonomy' => 'category', 'hide_empty' => false]);
+            if (is_wp_error($all)) $all = [];
+        }
+        
+        $name_lower = strtolower($name);
+        $slug = sanitize_title($name);
+        $match = null;
+        foreach ($all as $term) {
+            if (strtolower($term->name) === $name_lower) { $match = $term; break; }
+        }
+        if (!$match) {
+            foreach ($all as $term) {
+                if ($term->slug === $slug) { $match = $term; break; }
+            }
+        }
+        if (!$match) {
+            foreach ($all as $term) {
+                $term_lower = strtolower($term->name);
+                if (strpos($term_lower, $name_lower) !== false || strpos($name_lower, $term_lower) !== false) {
+                    $match = $term;
+                    break;
+                }
+            }
+        }
+        
+        if ($match) {
+            $ids[] = $match->term_id;
+            $found[] = ['requested' => $name, 'matched' => $match->name, 'id' => $match->term_id];
+            continue;
+        }
+        
+        $result = wp_insert_term($name, 'category', ['slug' => $slug]);
+        if (is_wp_error($result)) {
+            if ($result->get_error_code() === 'term_exists') {
+                $ids[] = intval($result->get_error_data());
+                $found[] = ['requested' => $name, 'created' => false, 'id' => intval($result->get_error_data())];
+            }
+            continue;
+        }
+        $ids[] = $result['term_id'];
+        $found[] = ['requested' => $name, 'created' => true, 'id' => $result['term_id']];
+        $all[] = get_term($result['term_id'], 'category');
+    }
+    
+    return ['ids' => array_values(array_unique($ids)), 'found' => $found];
+}